@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PromptCraft AI - API Gecikme Ölçümü
+Yerel, OpenAI uyumlu sahte bir sunucuya karşı çağrı başına gecikmeyi ölçer.
+
+Kullanım:
+    python benchmark_api_latency.py [--calls 50] [--handshake-ms 30] [--max-overhead-ms 5]
+
+--handshake-ms her yeni TCP bağlantısında sunucunun beklediği süredir ve
+gerçek sunucudaki TCP+TLS el sıkışma maliyetini taklit eder.
+
+Animasyonlu çağrının düz çağrıya göre medyan ek yükü --max-overhead-ms
+değerini aşarsa betik 1 koduyla çıkar (gecikme regresyon kontrolü).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+sys.path.append(str(Path(__file__).resolve().parent))
+
+
+def make_handler(handshake_delay: float):
+    """Sahte sohbet tamamlama sunucusu için handler sınıfı oluştur"""
+
+    class FakeChatHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            # Her yeni bağlantıda bir kez çalışır: el sıkışma maliyeti
+            super().setup()
+            time.sleep(handshake_delay)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            self.rfile.read(length)
+
+            body = json.dumps({
+                "id": "bench",
+                "object": "chat.completion",
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "Test başarılı!"},
+                    "finish_reason": "stop"
+                }]
+            }).encode("utf-8")
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FakeChatHandler
+
+
+def start_server(handshake_delay: float) -> ThreadingHTTPServer:
+    """Sahte sunucuyu arka planda başlat"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(handshake_delay))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def measure(label: str, func, calls: int) -> list:
+    """Fonksiyonu art arda çağırıp gecikmeleri ölç"""
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+        if not result:
+            print(f"❌ {label}: çağrı başarısız")
+            sys.exit(1)
+
+    print(f"{label:<28} ortalama {statistics.mean(timings):7.2f} ms | "
+          f"medyan {statistics.median(timings):7.2f} ms | "
+          f"p95 {sorted(timings)[int(len(timings) * 0.95) - 1]:7.2f} ms")
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PromptCraft API gecikme ölçümü")
+    parser.add_argument("--calls", type=int, default=50, help="Ölçüm başına çağrı sayısı")
+    parser.add_argument("--handshake-ms", type=float, default=30.0,
+                        help="Yeni bağlantı başına taklit edilen el sıkışma süresi (ms)")
+    parser.add_argument("--max-overhead-ms", type=float, default=5.0,
+                        help="Animasyonlu çağrı için izin verilen medyan ek yük (ms)")
+    args = parser.parse_args()
+
+    server = start_server(args.handshake_ms / 1000)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    os.environ["DEEPSEEK_API_KEY"] = "benchmark"
+    os.environ["DEEPSEEK_BASE_URL"] = base_url
+    os.environ.pop("GEMINI_API_KEY", None)
+
+    import requests
+    from vibe_coding_app import PromptCraftApp
+
+    app = PromptCraftApp()
+    headers, data = app._build_deepseek_request("Merhaba")
+
+    print("🧪 PromptCraft API Gecikme Ölçümü")
+    print("=" * 40)
+    print(f"Sunucu: {base_url} | el sıkışma: {args.handshake_ms} ms | çağrı: {args.calls}\n")
+
+    before = measure(
+        "Önce (requests.post)",
+        lambda: requests.post(f"{base_url}/v1/chat/completions", headers=headers, json=data, timeout=60).ok,
+        args.calls
+    )
+    after = measure("Sonra (havuzlu istemci)", lambda: app.call_deepseek_api("Merhaba"), args.calls)
+
+    speedup = statistics.mean(before) / statistics.mean(after)
+    print(f"\n📊 Havuzlu istemci çağrı başına {speedup:.1f}x daha hızlı\n")
+
+    # Animasyon ek yükü: gösterge isteğe süre eklememeli
+    progress = Progress(
+        SpinnerColumn("dots12", style="cyan"),
+        TextColumn("[bold blue]{task.description}"),
+        TimeElapsedColumn(),
+        console=app.console,
+        transient=True
+    )
+    with progress:
+        task = progress.add_task("🧪 Ölçülüyor...", total=None)
+        animated = measure(
+            "Animasyonlu çağrı",
+            lambda: app.call_deepseek_api_animated("Merhaba", progress, task),
+            args.calls
+        )
+
+    overhead = statistics.median(animated) - statistics.median(after)
+    print(f"\n⏱️ Animasyon ek yükü (medyan): {overhead:.2f} ms (sınır {args.max_overhead_ms} ms)")
+
+    server.shutdown()
+
+    if overhead > args.max_overhead_ms:
+        print("❌ Animasyonlu çağrı isteğe gecikme ekliyor!")
+        sys.exit(1)
+    print("✅ Animasyon isteğe gecikme eklemiyor")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VibeCoding CLI - Açılış Süresi Ölçümü
+`vibe --version` (veya --help) için import süresini modül bazında ölçer.
+
+Kullanım:
+    python benchmark_import_time.py [--runs 5] [--budget-ms 50] [--flag=--help]
+
+Bütçe, boş bir Python sürecine göre eklenen medyan süredir. Bütçe aşılırsa
+veya ağır AI modüllerinden biri yüklenirse betik 1 koduyla çıkar.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+# --version / --help için yüklenmemesi gereken modüller
+HEAVY_MODULES = [
+    "vibe_coding_ai_system",
+    "pydantic_ai",
+    "pydantic",
+    "httpx",
+    "rich",
+    "google.generativeai",
+]
+
+
+def run_timed(args: list, runs: int) -> float:
+    """Komutu art arda çalıştırıp medyan süreyi (ms) döndür"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def parse_importtime(output: str) -> list:
+    """-X importtime çıktısını (modül, derinlik, self_us, cumulative_us) listesine çevir"""
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_part, cumulative_part, raw_name = line.split("|", 2)
+        self_us = int(self_part.split(":")[1])
+        cumulative_us = int(cumulative_part)
+        depth = (len(raw_name) - len(raw_name.lstrip())) // 2
+        rows.append((raw_name.strip(), depth, self_us, cumulative_us))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VibeCoding CLI açılış süresi ölçümü")
+    parser.add_argument("--runs", type=int, default=5, help="Ölçüm tekrar sayısı")
+    parser.add_argument("--budget-ms", type=float, default=50.0,
+                        help="Boş Python sürecine göre izin verilen ek süre (ms)")
+    parser.add_argument("--flag", default="--version", help="Ölçülecek vibe bayrağı (--version veya --help)")
+    parser.add_argument("--top", type=int, default=15, help="Gösterilecek modül sayısı")
+    args = parser.parse_args()
+
+    command = [sys.executable, "vibe_cli.py", args.flag]
+
+    print("⏱️ VibeCoding CLI - Açılış Süresi Ölçümü")
+    print("=" * 40)
+
+    baseline = run_timed([sys.executable, "-c", "pass"], args.runs)
+    vibe = run_timed(command, args.runs)
+    overhead = vibe - baseline
+
+    print(f"Boş Python süreci : {baseline:7.1f} ms")
+    print(f"vibe {args.flag:<13}: {vibe:7.1f} ms")
+    print(f"Ek süre           : {overhead:7.1f} ms (bütçe {args.budget_ms} ms)\n")
+
+    # Modül bazında döküm
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *command[1:]],
+        cwd=ROOT, capture_output=True, text=True, check=False
+    )
+    rows = parse_importtime(result.stderr)
+
+    print(f"📦 En pahalı {args.top} üst düzey import (kümülatif):")
+    top_level = sorted((row for row in rows if row[1] == 0), key=lambda row: row[3], reverse=True)
+    for name, _, self_us, cumulative_us in top_level[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  (kendi {self_us / 1000:6.1f} ms)  {name}")
+
+    loaded = {row[0] for row in rows}
+    heavy = [module for module in HEAVY_MODULES if module in loaded]
+
+    failed = False
+    if heavy:
+        print(f"\n❌ Ağır modüller yüklendi: {', '.join(heavy)}")
+        failed = True
+    if overhead > args.budget_ms:
+        print(f"\n❌ Açılış bütçesi aşıldı: {overhead:.1f} ms > {args.budget_ms} ms")
+        failed = True
+
+    if failed:
+        sys.exit(1)
+    print("\n✅ Açılış süresi bütçe içinde")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,31 +6,21 @@ Claude Code benzeri terminal uygulaması
 """
 
 import argparse
-import asyncio
 import os
 import sys
 from pathlib import Path
 from typing import Optional, List
 import json
-import shutil
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich.syntax import Syntax
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from dotenv import load_dotenv
-
-# Mevcut VibeCoding modüllerini import et
-from vibe_coding_ai_system import VibeCodingAISystem
-
-console = Console()
+# rich, dotenv ve AI sistemi (pydantic_ai, httpx...) ağır modüllerdir; `vibe --version`
+# ve `vibe --help` hızlı açılsın diye yalnızca ihtiyaç duyan komutlarda import edilir.
 
 class VibeCodingCLI:
     """VibeCoding CLI Ana Sınıfı"""
     
     def __init__(self):
+        from rich.console import Console
+        
         self.console = Console()
         self.current_dir = Path.cwd()
         self.ai_system = None
@@ -48,6 +38,8 @@ class VibeCodingCLI:
     
     def _load_global_config(self):
         """Global konfigürasyonu yükle"""
+        from dotenv import load_dotenv
+        
         # Önce local .env'i dene
         load_dotenv()
         
@@ -92,6 +84,9 @@ class VibeCodingCLI:
     
     async def init_project(self, project_name: Optional[str] = None):
         """Yeni proje başlat"""
+        from rich.prompt import Prompt, Confirm
+        from vibe_coding_ai_system import VibeCodingAISystem
+        
         if not self.check_api_keys():
             return
             
@@ -122,6 +117,8 @@ class VibeCodingCLI:
     
     async def create_project_interactive(self):
         """İnteraktif proje oluşturma"""
+        from rich.prompt import Prompt
+        
         self.console.print("\n[bold blue]🎯 Proje Oluşturma Süreci[/bold blue]\n")
         
         # Proje tipi seçimi
@@ -170,6 +167,7 @@ class VibeCodingCLI:
     async def generate_project_with_ai(self, project_type: str, description: str, 
                                      tech_stack: List[str], features: List[str]):
         """AI ile proje oluştur"""
+        from rich.progress import Progress, SpinnerColumn, TextColumn
         
         with Progress(
             SpinnerColumn(),
@@ -201,12 +199,11 @@ class VibeCodingCLI:
             try:
                 # Proje geliştirme
                 required_experts = self.ai_system._determine_required_experts(project_config)
-                responses = {}
+                progress.update(task, description=f"👨‍💻 {len(required_experts)} uzman eşzamanlı çalışıyor...")
+                responses = await self.ai_system._consult_experts(required_experts, project_config, progress)
                 
-                for expert_type in required_experts:
-                    progress.update(task, description=f"👨‍💻 {expert_type.title()} uzmanı çalışıyor...")
-                    response = await self.ai_system._consult_expert(expert_type, project_config)
-                    responses[expert_type] = response
+                if not responses:
+                    raise RuntimeError("Hiçbir uzman yanıt veremedi")
                 
                 # Dosyaları oluştur
                 progress.update(task, description="📁 Proje dosyaları oluşturuluyor...")
@@ -236,28 +233,24 @@ class VibeCodingCLI:
             "vibe_cli_version": "1.0.0"
         }
         
-        with open("vibe-project.json", "w", encoding="utf-8") as f:
-            json.dump(config_data, f, indent=2, ensure_ascii=False)
+        # Tüm dosyalar tek partide, atomik olarak yazılır
+        root = Path.cwd()
+        files = [(root / "vibe-project.json", json.dumps(config_data, indent=2, ensure_ascii=False))]
         
         # Her uzman için dosyaları oluştur
         for expert_type, response in responses.items():
-            expert_dir = Path(expert_type)
-            expert_dir.mkdir(exist_ok=True)
+            expert_dir = root / expert_type
             
             # Kod dosyalarını oluştur
             for file_struct in response.code_files:
-                file_path = expert_dir / file_struct.path
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(file_struct.content)
+                files.append((expert_dir / file_struct.path, file_struct.content))
             
             # Bağımlılıkları kaydet
             if response.dependencies:
-                deps_file = expert_dir / "requirements.txt"
-                with open(deps_file, "w", encoding="utf-8") as f:
-                    for dep in response.dependencies:
-                        f.write(f"{dep}\n")
+                files.append((
+                    expert_dir / "requirements.txt",
+                    "".join(f"{dep}\n" for dep in response.dependencies)
+                ))
         
         # Ana README oluştur
         readme_content = f"""# {project_config.name}
@@ -295,11 +288,18 @@ Her klasör kendi README dosyasını içerir:
 VibeCoding CLI ile oluşturulan projeler için destek: https://github.com/your-repo
 """
         
-        with open("README.md", "w", encoding="utf-8") as f:
-            f.write(readme_content)
+        files.append((root / "README.md", readme_content))
+        
+        # Çalışma dizini kullanıcınındır: manifest tutulmaz, önceki dosyalar budanmaz
+        summary = await self.ai_system.file_writer.write(files)
+        self.console.print(
+            f"[dim]📝 Dosyalar: {summary.written} yazıldı, {summary.unchanged} değişmedi[/dim]"
+        )
     
     def display_project_summary(self, project_config, responses):
         """Proje özetini göster"""
+        from rich.table import Table
+        
         self.console.print("\n[bold green]🎉 Proje Başarıyla Oluşturuldu![/bold green]\n")
         
         # Proje tablosu
@@ -332,17 +332,24 @@ VibeCoding CLI ile oluşturulan projeler için destek: https://github.com/your-r
     
     def display_help(self):
         """Yardım menüsü"""
+        from rich.panel import Panel
+        
         help_text = """
 [bold blue]VibeCoding CLI - Kullanım Kılavuzu[/bold blue]
 
 [bold]Komutlar:[/bold]
   vibe init [proje-adı]     Yeni proje oluştur
+  vibe search <sorgu>       Üretilen projelerde tam metin arama
+  vibe gc [--dry-run]       Blob deposunu temizle, kazanılan alanı raporla
+  vibe batch specs.jsonl    Her satırı bir ProjectConfig olan dosyadan toplu üretim
+                            (--concurrency N, --results dosya, --no-resume)
   vibe --help              Bu yardım menüsünü göster
   vibe --version           Versiyon bilgisi
 
 [bold]Örnekler:[/bold]
   vibe init my-web-app     'my-web-app' adında yeni proje
   vibe init                İnteraktif proje oluşturma
+  vibe search jwt refresh  JWT yenileme akışı olan projeleri bul
 
 [bold]Gereksinimler:[/bold]
   - Python 3.8+
@@ -364,6 +371,76 @@ VibeCoding CLI ile oluşturulan projeler için destek: https://github.com/your-r
         panel = Panel(help_text, border_style="blue", padding=(1, 2))
         self.console.print(panel)
     
+    def search_projects(self, query: str, project: str = "", limit: int = 20):
+        """Üretilen tüm projelerde tam metin arama (API anahtarı gerektirmez)"""
+        import time
+        from vibe_coding_ai_system import ProjectRegistry, display_search_results
+        
+        if not query.strip():
+            self.console.print("[red]❌ Arama sorgusu gerekli: vibe search \"jwt refresh\"[/red]")
+            return
+        
+        projects_dir = Path("generated_projects")
+        if not projects_dir.is_dir():
+            self.console.print(f"[yellow]📭 Bu klasörde '{projects_dir}' dizini bulunamadı.[/yellow]")
+            return
+        
+        db_path = Path(os.getenv("VIBE_REGISTRY_DB", str(projects_dir / ".cache" / "projects.sqlite3")))
+        registry = ProjectRegistry(db_path, projects_dir)
+        registry.reconcile()
+        
+        start = time.perf_counter()
+        results = registry.search(query, project=project, limit=limit)
+        display_search_results(self.console, results, query, time.perf_counter() - start)
+    
+    def collect_blob_garbage(self, dry_run: bool = False):
+        """Blob deposundaki kullanılmayan içerikleri sil ve kazanılan alanı raporla"""
+        from vibe_coding_ai_system import BlobStore, env_number
+        
+        projects_dir = Path("generated_projects")
+        blob_dir = Path(os.getenv("VIBE_BLOB_DIR", str(projects_dir / ".cache" / "blobs")))
+        if not blob_dir.is_dir():
+            self.console.print(f"[yellow]📭 Blob deposu bulunamadı: {blob_dir} (VIBE_BLOB_STORE kapalı olabilir)[/yellow]")
+            return
+        
+        store = BlobStore(blob_dir)
+        grace_hours = env_number("VIBE_BLOB_GC_GRACE_HOURS", 1.0, float)
+        result = store.gc(projects_dir, grace_seconds=grace_hours * 3600, dry_run=dry_run)
+        report = store.report(projects_dir)
+        
+        mb = 1024 * 1024
+        action = "silinecek" if dry_run else "silindi"
+        self.console.print(
+            f"[green]🧹 {result['removed']} blob {action} ({result['freed_bytes'] / mb:.1f} MB), "
+            f"{result['kept']} blob tutuldu[/green]"
+        )
+        if result["corrupt"]:
+            self.console.print(
+                f"[yellow]⚠️ {result['corrupt']} blob'un içeriği adıyla uyuşmuyordu (hardlink'li dosya yerinde "
+                f"düzenlenmiş olabilir); {action}[/yellow]"
+            )
+        self.console.print(
+            f"📦 Depo: {report['blobs']} blob, {report['blob_bytes'] / mb:.1f} MB - "
+            f"{report['linked_files']} dosya blob paylaşıyor ({report['logical_bytes'] / mb:.1f} MB)"
+        )
+        self.console.print(f"[bold]💾 Tekilleştirme ile kazanılan alan: {report['saved_bytes'] / mb:.1f} MB[/bold]")
+    
+    async def run_batch(self, specs_path: Path, results_path: Optional[Path] = None,
+                        resume: bool = True, concurrency: Optional[int] = None):
+        """JSONL spesifikasyon dosyasından projeleri etkileşimsiz üret"""
+        from vibe_coding_ai_system import VibeCodingAISystem
+        
+        if not self.check_api_keys():
+            return
+        if not specs_path.is_file():
+            self.console.print(f"[red]❌ Spesifikasyon dosyası bulunamadı: {specs_path}[/red]")
+            return
+        
+        self.ai_system = VibeCodingAISystem()
+        if concurrency:
+            self.ai_system.max_concurrent_experts = max(1, concurrency)
+        await self.ai_system.run_batch(specs_path, results_path=results_path, resume=resume)
+    
     async def run_full_system(self):
         """Tam VibeCoding AI sistemini başlat"""
         # VibeCoding AI System'i import et ve başlat
@@ -382,14 +459,52 @@ def main():
     parser.add_argument(
         "command", 
         nargs="?", 
-        choices=["init"],
-        help="Komut (init: yeni proje oluştur)"
+        choices=["init", "search", "gc", "batch"],
+        help="Komut (init: yeni proje oluştur, search: projelerde ara, gc: blob deposunu temizle, "
+             "batch: JSONL spesifikasyonlardan toplu üretim)"
+    )
+    
+    parser.add_argument(
+        "arguments",
+        nargs="*",
+        metavar="argüman",
+        help="init için proje adı (isteğe bağlı), search için arama sorgusu, batch için specs.jsonl"
+    )
+    
+    parser.add_argument(
+        "--project",
+        default="",
+        help="search: yalnızca bu projede ara"
+    )
+    
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="search: gösterilecek en fazla sonuç sayısı"
+    )
+    
+    parser.add_argument(
+        "--results",
+        help="batch: sonuç JSONL dosyası (varsayılan: <specs>.results.jsonl)"
+    )
+    
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="batch: daha önce tamamlanan projeleri de yeniden üret"
     )
     
     parser.add_argument(
-        "project_name",
-        nargs="?",
-        help="Proje adı (isteğe bağlı)"
+        "--concurrency",
+        type=int,
+        help="batch: tüm projelerdeki eşzamanlı uzman çağrısı sınırı (VIBE_MAX_CONCURRENT_EXPERTS)"
+    )
+    
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="gc: silinecek blob'ları yalnızca raporla"
     )
     
     parser.add_argument(
@@ -400,6 +515,8 @@ def main():
     
     args = parser.parse_args()
     
+    import asyncio
+    
     cli = VibeCodingCLI()
     
     # Komut yok ise tam AI sistemini başlat
@@ -410,7 +527,26 @@ def main():
     # Init komutu
     if args.command == "init":
         cli.display_banner()
-        asyncio.run(cli.init_project(args.project_name))
+        asyncio.run(cli.init_project(args.arguments[0] if args.arguments else None))
+    
+    # Search komutu
+    elif args.command == "search":
+        cli.search_projects(" ".join(args.arguments), project=args.project, limit=args.limit)
+    
+    # Gc komutu
+    elif args.command == "gc":
+        cli.collect_blob_garbage(dry_run=args.dry_run)
+    
+    # Batch komutu
+    elif args.command == "batch":
+        if not args.arguments:
+            parser.error("batch için spesifikasyon dosyası gerekli: vibe batch specs.jsonl")
+        asyncio.run(cli.run_batch(
+            Path(args.arguments[0]),
+            results_path=Path(args.results) if args.results else None,
+            resume=not args.no_resume,
+            concurrency=args.concurrency
+        ))
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -14,24 +14,41 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 import json
 import shutil
+import hashlib
+import time
+import threading
+import re
+import ast
+import difflib
+import tempfile
 
-from pydantic import BaseModel, Field
-from pydantic_ai import Agent, RunContext
+from pydantic import BaseModel, Field, PrivateAttr
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.prompt import Prompt, Confirm
 from rich.markdown import Markdown
+from rich.markup import escape
 from rich.syntax import Syntax
 from dotenv import load_dotenv
-import httpx
 
 # Environment variables yükle
 load_dotenv()
 
 console = Console()
 
+def env_number(name: str, default, cast=int, minimum=None):
+    """Sayısal ortam değişkenini oku; geçersizse uyarı verip varsayılanı kullan"""
+    raw = os.getenv(name)
+    value = default
+    if raw is not None and raw.strip():
+        try:
+            value = cast(raw.strip())
+        except ValueError:
+            console.print(f"[yellow]⚠️ {name}={raw!r} geçersiz, varsayılan kullanılıyor: {default}[/yellow]")
+    return value if minimum is None else max(minimum, value)
+
 class ProjectConfig(BaseModel):
     """Proje konfigürasyon modeli"""
     name: str = Field(description="Proje adı")
@@ -60,6 +77,1745 @@ class ExpertResponse(BaseModel):
     code_files: List[FileStructure] = Field(description="Kod dosyaları")
     dependencies: List[str] = Field(description="Bağımlılıklar")
     next_steps: List[str] = Field(description="Sonraki adımlar")
+    # Plan-doldur modunda üretilemeyen dosyalar; eksik yanıt önbelleğe ve parmak izine yazılmaz
+    _failed_files: List[str] = PrivateAttr(default_factory=list)
+
+class FileEdit(BaseModel):
+    """Mevcut bir dosyaya uygulanacak düzenleme"""
+    path: str = Field(description="Uzman klasörüne göre dosya yolu")
+    operation: str = Field(description="İşlem: replace (arama/değiştirme), diff (unified diff), create, delete")
+    search: Optional[str] = Field(default=None, description="replace: dosyada birebir ve tek kez geçen metin")
+    replace: Optional[str] = Field(default=None, description="replace: yerine yazılacak metin")
+    diff: Optional[str] = Field(default=None, description="diff: @@ hunk başlıklı unified diff")
+    content: Optional[str] = Field(default=None, description="create: yeni dosyanın tam içeriği")
+    description: str = Field(default="", description="Değişikliğin kısa açıklaması")
+
+class ExpertPatchResponse(BaseModel):
+    """Mevcut proje üzerinde çalışan uzmanın düzenleme yanıtı"""
+    expert_type: str = Field(description="Uzman tipi")
+    analysis: str = Field(description="Analiz")
+    recommendations: List[str] = Field(description="Öneriler")
+    edits: List[FileEdit] = Field(description="Dosya düzenlemeleri")
+    dependencies: List[str] = Field(description="Bağımlılıklar")
+    next_steps: List[str] = Field(description="Sonraki adımlar")
+
+class PlannedFile(BaseModel):
+    """Plan aşamasında belirlenen dosya"""
+    path: str = Field(description="Dosya yolu")
+    file_type: str = Field(description="Dosya tipi")
+    purpose: str = Field(description="Dosyanın amacı")
+    interfaces: List[str] = Field(default_factory=list, description="Dışa açtığı fonksiyon, sınıf, endpoint ve tipler")
+
+class ExpertPlan(BaseModel):
+    """Uzmanın dosya içerikleri olmadan döndürdüğü plan (manifest)"""
+    expert_type: str = Field(description="Uzman tipi")
+    analysis: str = Field(description="Analiz")
+    recommendations: List[str] = Field(description="Öneriler")
+    files: List[PlannedFile] = Field(description="Oluşturulacak dosyalar")
+    dependencies: List[str] = Field(description="Bağımlılıklar")
+    next_steps: List[str] = Field(description="Sonraki adımlar")
+
+class PatchResult(BaseModel):
+    """Bir dosyaya düzenleme uygulamanın sonucu"""
+    path: str = Field(description="Dosya yolu")
+    status: str = Field(description="Durum (applied, created, deleted, unchanged, conflict)")
+    message: str = Field(default="", description="Açıklama veya çakışma nedeni")
+    added: int = Field(default=0, description="Eklenen satır sayısı")
+    removed: int = Field(default=0, description="Silinen satır sayısı")
+
+class WriteSummary(BaseModel):
+    """Bir dosya yazma partisinin sonucu"""
+    written: int = Field(default=0, description="Yazılan (yeni veya değişen) dosya sayısı")
+    unchanged: int = Field(default=0, description="İçeriği aynı olduğu için yazılmayan dosya sayısı")
+    deleted: int = Field(default=0, description="Artık üretilmediği için silinen dosya sayısı")
+
+# Uzman bağımlılıkları: her uzman, listedeki uzmanların çıktılarını bağlam olarak alır.
+# Listede olmayan (örn. uiux, devops) uzmanlar diğerleriyle paralel çalışır.
+EXPERT_DEPENDENCIES: Dict[str, List[str]] = {
+    "database": [],
+    "backend": ["database"],
+    "frontend": ["backend"],
+    "mobile": ["backend"],
+    "uiux": [],
+    "devops": [],
+    "test": ["database", "backend", "frontend", "mobile"],
+}
+
+# Düzenleme modunda uzmanların sistem prompt'una eklenen talimatlar
+PATCH_MODE_INSTRUCTIONS = """
+            
+            ✏️ DÜZENLEME MODU:
+            - Proje dosyaları zaten diskte; dosyaları baştan yazma, yalnızca değişiklikleri döndür
+            - Küçük değişiklikler için operation="replace" kullan: search dosyada birebir ve tek kez geçmeli,
+              birkaç satır bağlam içermeli
+            - Çok parçalı değişiklikler için operation="diff" ile unified diff (@@ -a,b +c,d @@) kullan
+            - Yeni dosyalar için operation="create" ve tam content, silmek için operation="delete"
+            - Değişmeyen dosyaları listeye ekleme
+            """
+
+# Plan-doldur modunda plan ve dosya ajanlarının sistem prompt'una eklenen talimatlar
+PLAN_MODE_INSTRUCTIONS = """
+            
+            🗺️ PLAN AŞAMASI:
+            - Dosya içeriklerini YAZMA; yalnızca oluşturulacak dosyaların listesini çıkar
+            - Her dosya için yol, tip, amaç ve dışa açtığı arayüzleri (fonksiyon, sınıf, endpoint,
+              tip imzaları) belirt; dosyalar bu arayüzlere göre ayrı ayrı yazılacak
+            """
+FILL_MODE_INSTRUCTIONS = """
+            
+            📝 DOSYA YAZMA AŞAMASI:
+            - Sana verilen plandaki TEK bir dosyanın tam içeriğini yaz
+            - Plandaki diğer dosyaların arayüzlerine birebir uy
+            - Yalnızca dosya içeriğini döndür; açıklama veya markdown kod bloğu ekleme
+            """
+
+# Plan-doldur modunu kullanabilen uzmanlar
+PLANNED_EXPERTS = {"database", "backend", "frontend", "mobile", "uiux", "devops"}
+
+# Uzman prompt'larının sürümü; prompt şablonları değiştiğinde artırılır (artımlı üretimi geçersiz kılar)
+PROMPT_VERSION = "3"
+
+# Uzman prompt'larındaki proje bilgisi satırlarının etiketleri (her uzman tüm alanları görür)
+PROJECT_FIELD_LABELS = {
+    "name": "İsim",
+    "description": "Açıklama",
+    "type": "Tip",
+    "tech_stack": "Teknoloji Yığını",
+    "features": "Özellikler",
+    "target_audience": "Hedef Kitle",
+    "complexity": "Karmaşıklık",
+    "database_needed": "Veritabanı",
+    "auth_needed": "Kimlik Doğrulama",
+    "api_needed": "API",
+}
+
+class ExpertCache:
+    """Uzman yanıtları için içerik adresli disk önbelleği.
+    
+    Anahtar; uzman tipi, model, sistem prompt'u, kullanıcı prompt'u ve yanıt şemasının
+    hash'idir. Kayıtlar TTL sonunda geçersizleşir, toplam boyut sınırı aşılınca en uzun
+    süredir kullanılmayan kayıtlar silinir. Toplam boyut bellekte tutulur; dizin yalnızca
+    ilk yazmada ve sınır aşıldığında taranır (başka süreçlerin yazdıkları da o an sayılır).
+    """
+    
+    def __init__(self, cache_dir: Path, ttl_seconds: float = 7 * 86400, max_bytes: int = 200 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._total_bytes: Optional[int] = None  # ilk put'ta dizin taranarak hesaplanır
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(expert_type: str, model: str, system_prompt: str, user_prompt: str, schema: Dict[str, Any]) -> str:
+        """Önbellek anahtarını oluştur"""
+        payload = json.dumps(
+            [expert_type, model, system_prompt, user_prompt, schema],
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[ExpertResponse]:
+        """Kayıt varsa ve süresi dolmadıysa yanıtı döndür"""
+        path = self._path(key)
+        
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            
+            if self.ttl_seconds and time.time() - entry["created_at"] > self.ttl_seconds:
+                self._remove(path)
+                self.evictions += 1
+                self.misses += 1
+                return None
+            
+            response = ExpertResponse.model_validate(entry["response"])
+            
+            # LRU için son kullanım zamanını güncelle; kayıt okunduktan sonra başka bir
+            # süreçte silindiyse yanıt zaten elimizde, isabet sayılır
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # Bozuk kayıt: sil ve yeniden üret
+            self._remove(path)
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return response
+    
+    def put(self, key: str, response: ExpertResponse):
+        """Yanıtı önbelleğe yaz ve gerekirse eski kayıtları sil"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"created_at": time.time(), "response": response.model_dump()}, f, ensure_ascii=False)
+        size = tmp_path.stat().st_size
+        
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(stat.st_size for _, stat in self._entries())
+            try:
+                self._total_bytes -= path.stat().st_size
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, path)
+            self._total_bytes += size
+            
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+    
+    def _remove(self, path: Path):
+        """Kaydı sil ve bellekteki toplam boyutu güncelle"""
+        with self._lock:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                return
+            if self._total_bytes is not None:
+                self._total_bytes -= size
+    
+    def _entries(self) -> List[tuple]:
+        entries = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+        return entries
+    
+    def _evict(self):
+        """Boyut sınırı aşıldıysa en eski kullanılan kayıtları sil (kilit tutulurken çağrılır).
+        
+        Dizin yeniden taranır; böylece bellekteki toplamın sapması da düzeltilir. Sınırın
+        %90'ına kadar silinir ki sonraki her yazma yeniden tarama gerektirmesin.
+        """
+        entries = self._entries()
+        total = sum(stat.st_size for _, stat in entries)
+        
+        if total > self.max_bytes:
+            target = int(self.max_bytes * 0.9)
+            for path, stat in sorted(entries, key=lambda item: item[1].st_mtime):
+                if total <= target:
+                    break
+                path.unlink(missing_ok=True)
+                total -= stat.st_size
+                self.evictions += 1
+        
+        self._total_bytes = total
+    
+    def stats(self) -> Dict[str, int]:
+        """İsabet/ıskalama istatistiklerini döndür"""
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "size_bytes": sum(stat.st_size for _, stat in entries)
+        }
+
+# Test uzmanına bağlam olarak gönderilen dosya uzantıları
+CODE_EXTENSIONS = {'.py', '.js', '.ts', '.jsx', '.tsx', '.html', '.css', '.sql', '.json', '.yml', '.yaml', '.md'}
+
+def estimate_tokens(text: str) -> int:
+    """Metnin yaklaşık token sayısı (~4 karakter = 1 token)"""
+    return len(text) // 4 + 1
+
+# JS/TS: korunacak bildirimler ve route tanımları
+JS_DECLARATION_PATTERN = re.compile(
+    r"^(export\s+)?(default\s+)?(declare\s+)?(abstract\s+)?"
+    r"(async\s+function|function|class|interface|type|enum|const|let|var|import|module\.exports)\b"
+)
+JS_ROUTE_PATTERN = re.compile(r"^(\w+)\.(get|post|put|patch|delete|use|route|all)\s*\(")
+JS_MEMBER_PATTERN = re.compile(
+    r"^(public\s+|private\s+|protected\s+|static\s+|readonly\s+|async\s+|get\s+|set\s+)*"
+    r"(constructor|[A-Za-z_$][\w$]*)\s*[(:=<?!]"
+)
+JS_STRING_PATTERN = re.compile(r"'(?:\\.|[^'\\])*'|\"(?:\\.|[^\"\\])*\"|`(?:\\.|[^`\\])*`")
+SQL_COMMENT_PATTERN = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+
+class CodeSkeletonExtractor:
+    """Kod dosyalarını imza, sınıf, route ve şema bildirimlerine indirger.
+    
+    Python dosyaları ast ile, JS/TS ve SQL dosyaları hafif satır tabanlı tarayıcılarla
+    işlenir. Sonuçlar içerik hash'ine göre bellekte önbelleklenir.
+    """
+    
+    MAX_LINE = 160
+    
+    def __init__(self):
+        self._cache: Dict[str, str] = {}
+        self._lock = threading.Lock()
+    
+    def extract(self, path: str, content: str) -> str:
+        """Dosyanın iskeletini döndür (desteklenmeyen türlerde boş metin)"""
+        suffix = Path(path).suffix.lower()
+        key = hashlib.sha256(suffix.encode("utf-8") + b"\0" + content.encode("utf-8")).hexdigest()
+        
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+        
+        if suffix == ".py":
+            skeleton = self._python(content)
+        elif suffix in {".js", ".jsx", ".ts", ".tsx"}:
+            skeleton = self._javascript(content)
+        elif suffix == ".sql":
+            skeleton = self._sql(content)
+        elif suffix == ".md":
+            skeleton = "\n".join(line for line in content.splitlines() if line.startswith("#"))
+        elif suffix == ".json":
+            skeleton = self._json(content)
+        else:
+            skeleton = ""
+        
+        with self._lock:
+            self._cache[key] = skeleton
+        return skeleton
+    
+    def _clip(self, text: str) -> str:
+        """Çok uzun satırları kısalt"""
+        return text if len(text) <= self.MAX_LINE else text[:self.MAX_LINE] + " ..."
+    
+    # --- Python ---
+    
+    def _python(self, content: str) -> str:
+        """Python: import, imza, docstring, sınıf alanları ve modül düzeyi atamalar"""
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError):
+            return "\n".join(
+                self._clip(line.rstrip()) for line in content.splitlines()
+                if re.match(r"\s*(async\s+def|def|class)\s", line)
+            )
+        
+        lines = []
+        docstring = ast.get_docstring(tree)
+        if docstring:
+            lines.append(f'"""{docstring.splitlines()[0]}"""')
+        self._python_body(tree.body, lines, 0, in_class=False)
+        return "\n".join(lines)
+    
+    def _python_body(self, body: list, lines: List[str], depth: int, in_class: bool):
+        indent = "    " * depth
+        
+        for node in body:
+            if isinstance(node, (ast.Import, ast.ImportFrom)) and depth == 0:
+                lines.append(self._clip(ast.unparse(node)))
+            
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                for decorator in node.decorator_list:
+                    lines.append(self._clip(f"{indent}@{ast.unparse(decorator)}"))
+                prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+                returns = f" -> {ast.unparse(node.returns)}" if node.returns else ""
+                lines.append(self._clip(f"{indent}{prefix} {node.name}({ast.unparse(node.args)}){returns}:"))
+                docstring = ast.get_docstring(node)
+                if docstring:
+                    lines.append(self._clip(f'{indent}    """{docstring.splitlines()[0]}"""'))
+                lines.append(f"{indent}    ...")
+            
+            elif isinstance(node, ast.ClassDef):
+                for decorator in node.decorator_list:
+                    lines.append(self._clip(f"{indent}@{ast.unparse(decorator)}"))
+                bases = ", ".join(ast.unparse(base) for base in node.bases + node.keywords)
+                lines.append(f"{indent}class {node.name}({bases}):" if bases else f"{indent}class {node.name}:")
+                docstring = ast.get_docstring(node)
+                if docstring:
+                    lines.append(self._clip(f'{indent}    """{docstring.splitlines()[0]}"""'))
+                before = len(lines)
+                self._python_body(node.body, lines, depth + 1, in_class=True)
+                if len(lines) == before:
+                    lines.append(f"{indent}    ...")
+            
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)) and (in_class or depth == 0):
+                # Sınıf alanları (şemalar) her zaman; modül düzeyinde sabitler ve app/router gibi nesneler
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                names = [ast.unparse(target) for target in targets]
+                if in_class or isinstance(node, ast.AnnAssign) or isinstance(node.value, ast.Call) \
+                        or all(name.isupper() for name in names):
+                    lines.append(self._clip(f"{indent}{ast.unparse(node)}"))
+            
+            elif isinstance(node, ast.If) and depth == 0 and "__main__" in ast.unparse(node.test):
+                lines.append(f"if {ast.unparse(node.test)}: ...")
+    
+    # --- JavaScript / TypeScript ---
+    
+    def _javascript(self, content: str) -> str:
+        """JS/TS: bildirimler, route'lar, sınıf üyeleri; interface/type/enum gövdeleri tam"""
+        lines = []
+        stack = []  # blok türleri: "keep" (tam), "class" (üyeler), "skip" (gövde atlanır)
+        in_comment = False
+        
+        for raw in content.splitlines():
+            # Stringleri ve yorumları aynı uzunlukta boşlukla maskele; konumlar raw ile hizalı kalır
+            code = JS_STRING_PATTERN.sub(lambda m: m.group(0)[0] + " " * (len(m.group(0)) - 2) + m.group(0)[-1], raw)
+            if in_comment:
+                if "*/" not in code:
+                    continue
+                end = code.index("*/") + 2
+                code = " " * end + code[end:]
+                in_comment = False
+            code = re.sub(r"/\*.*?\*/", lambda m: " " * len(m.group(0)), code)
+            if "/*" in code:
+                code, in_comment = code[:code.index("/*")], True
+            if "//" in code:
+                code = code[:code.index("//")]
+            
+            stripped = code.strip()
+            shown = raw[:len(code)].strip()
+            opens, closes = code.count("{"), code.count("}")
+            block = stack[-1] if stack else "top"
+            indent = "  " * len(stack)
+            new_block = "skip"
+            
+            if block == "keep":
+                if stripped:
+                    lines.append(self._clip(raw.rstrip()))
+            elif stripped and block in ("top", "class"):
+                pattern = JS_MEMBER_PATTERN if block == "class" else JS_DECLARATION_PATTERN
+                if pattern.match(stripped) or JS_ROUTE_PATTERN.match(stripped):
+                    if opens > closes:
+                        if re.match(r"^(export\s+)?(declare\s+)?(interface|type|enum)\b", stripped):
+                            new_block = "keep"
+                            lines.append(self._clip(indent + shown))
+                        elif re.match(r"^(export\s+)?(default\s+)?(abstract\s+)?class\b", stripped):
+                            new_block = "class"
+                            lines.append(self._clip(indent + shown))
+                        else:
+                            signature = raw[:code.index("{") + 1].strip()
+                            lines.append(self._clip(f"{indent}{signature} ... }}"))
+                    else:
+                        lines.append(self._clip(indent + shown))
+            
+            # Blok yığınını güncelle
+            net = opens - closes
+            for i in range(net):
+                stack.append(new_block if i == 0 else "skip")
+            for _ in range(-net):
+                if not stack:
+                    break
+                if stack.pop() == "class":
+                    lines.append("  " * len(stack) + "}")
+        
+        return "\n".join(lines)
+    
+    # --- SQL ---
+    
+    def _sql(self, content: str) -> str:
+        """SQL: CREATE TABLE/TYPE tam, diğer CREATE/ALTER ifadeleri başlık olarak"""
+        statements = []
+        for statement in SQL_COMMENT_PATTERN.sub("", content).split(";"):
+            statement = statement.strip()
+            upper = statement.upper()
+            if upper.startswith(("CREATE TABLE", "CREATE TYPE")):
+                body = "\n".join(
+                    ("  " if i and not line.strip().startswith(")") else "") + " ".join(line.split())
+                    for i, line in enumerate(statement.splitlines()) if line.strip()
+                )
+                statements.append(body + ";")
+            elif upper.startswith(("CREATE", "ALTER")):
+                header = " ".join(statement.split())
+                header = re.split(r"\s(?:AS|BEGIN)\s", header, maxsplit=1, flags=re.IGNORECASE)[0]
+                statements.append(self._clip(header) + ";")
+        return "\n".join(statements)
+    
+    # --- JSON ---
+    
+    def _json(self, content: str) -> str:
+        """JSON: üst düzey anahtarlar, basit değerler ve alt anahtar adları"""
+        try:
+            data = json.loads(content)
+        except ValueError:
+            return ""
+        if not isinstance(data, dict):
+            return f"{type(data).__name__} ({len(data) if isinstance(data, list) else 1} öğe)"
+        
+        lines = []
+        for key, value in data.items():
+            if isinstance(value, dict):
+                lines.append(self._clip(f"{key}: {{{', '.join(map(str, value))}}}"))
+            elif isinstance(value, list):
+                lines.append(f"{key}: [{len(value)} öğe]")
+            else:
+                lines.append(self._clip(f"{key}: {json.dumps(value, ensure_ascii=False)}"))
+        return "\n".join(lines)
+
+# Bağlam önceliği: dosya yolunda geçen kalıplar ve puanları (yüksek = önce)
+CONTEXT_PRIORITY_PATTERNS = [
+    (("main.", "app.", "index.", "server.", "manage.", "wsgi.", "asgi."), 100),
+    (("model", "schema", "entity", "entities"), 80),
+    (("route", "router", "api", "controller", "view", "endpoint"), 70),
+    (("service", "repository", "crud", "auth"), 50),
+    (("config", "settings", "requirements", "package.json", "docker"), 30),
+]
+
+class ContextItem(BaseModel):
+    """Bağlam paketine giren dosya ve seviyesi"""
+    path: str = Field(description="Dosya yolu")
+    level: str = Field(description="Seviye (tam, iskelet, özet, dışarıda)")
+    tokens: int = Field(description="Bağlamda kapladığı tahmini token")
+
+class ProjectFileIndex:
+    """Proje dosyaları için kalıcı indeks.
+    
+    Her dosya için yol, boyut, mtime, içerik hash'i, tahmini token sayısı ve summarize
+    fonksiyonunun döndürdüğü alanlar (iskelet, kısa özet) saklanır. Boyutu ve mtime'ı
+    değişmeyen dosyalar yeniden okunmaz; içeriği değişmeyen dosyaların özeti yeniden
+    hesaplanmaz. İndeks proje dizininde INDEX_FILE olarak tutulur.
+    """
+    
+    INDEX_FILE = ".vibe_file_index.json"
+    VERSION = 3
+    
+    def __init__(self, project_dir: Path, extensions: set, summarize):
+        self.project_dir = project_dir
+        self.index_path = project_dir / self.INDEX_FILE
+        self.extensions = extensions
+        self.summarize = summarize
+        self.entries: Dict[str, Dict[str, Any]] = self._load()
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                return data["files"]
+        except (FileNotFoundError, ValueError, KeyError):
+            pass
+        return {}
+    
+    def _save(self):
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "files": self.entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+    
+    def refresh(self, exclude_dirs: Optional[set] = None) -> List[Dict[str, Any]]:
+        """İndeksi disk ile eşitle ve girdileri (klasör, yol) sırasıyla döndür"""
+        exclude_dirs = exclude_dirs or set()
+        ordered = []
+        changed = False
+        
+        for expert_dir in sorted(self.project_dir.iterdir()):
+            if not expert_dir.is_dir() or expert_dir.name in exclude_dirs or expert_dir.name.startswith("."):
+                continue
+            
+            for file_path in sorted(expert_dir.rglob("*")):
+                if file_path.suffix not in self.extensions or file_path.name.startswith(".") \
+                        or not file_path.is_file():
+                    continue
+                
+                rel_path = file_path.relative_to(self.project_dir).as_posix()
+                stat = file_path.stat()
+                entry = self.entries.get(rel_path)
+                
+                if entry is None or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+                    entry = self._index_file(file_path, rel_path, stat, entry)
+                    self.entries[rel_path] = entry
+                    changed = True
+                
+                ordered.append(entry)
+        
+        # Silinen dosyaları indeksten çıkar
+        seen = {entry["path"] for entry in ordered}
+        for rel_path in list(self.entries):
+            if rel_path not in seen and rel_path.split("/", 1)[0] not in exclude_dirs:
+                del self.entries[rel_path]
+                changed = True
+        
+        if changed:
+            self._save()
+        
+        return ordered
+    
+    def _index_file(self, file_path: Path, rel_path: str, stat: os.stat_result,
+                    previous: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Dosyayı oku, hash'ini ve özetini hesapla"""
+        raw = file_path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        
+        if previous is not None and previous["sha256"] == digest:
+            summary = {key: previous[key] for key in ("tokens", "skeleton", "outline")}
+        else:
+            try:
+                content = raw.decode("utf-8")
+                summary = {"tokens": estimate_tokens(content), **self.summarize(rel_path, content)}
+            except UnicodeDecodeError:
+                summary = {"tokens": 0, "skeleton": None, "outline": None}
+        
+        return {
+            "path": rel_path,
+            "expert": rel_path.split("/", 1)[0],
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest,
+            **summary
+        }
+
+class ProjectRegistry:
+    """Üretilen projelerin SQLite (sqlalchemy) kayıt defteri.
+    
+    Proje adı, tipi, teknoloji yığını, zaman damgaları ve uzman bazında dosya sayıları
+    tek bir tabloda tutulur; listeleme, filtreleme, sıralama ve sayfalama SQL ile yapılır.
+    Kayıt defteri diskteki projelerden türetilen bir önbellektir: reconcile() yalnızca
+    project_config.json dosyalarının mtime'ını kontrol ederek değişen projeleri yeniden
+    indeksler, rebuild() her şeyi diskten baştan oluşturur. Bozuk konfigürasyonlar
+    atlanmaz, "corrupt" durumuyla kaydedilir.
+    
+    Aynı veritabanında üretilen dosyalar, analiz raporları ve proje özetlerindeki
+    analiz/öneriler için bir FTS5 tam metin indeksi tutulur. İndeks kaynak dosya
+    bazında (boyut + mtime) artımlı olarak güncellenir.
+    """
+    
+    SCHEMA_VERSION = 2
+    SORT_COLUMNS = {"updated": "updated_at", "created": "created_at", "name": "name",
+                    "type": "type", "files": "file_count"}
+    SEARCH_ROOT_FILES = ("project_config.json", "project_summary.json")
+    
+    def __init__(self, db_path: Path, projects_dir: Path, max_search_bytes: int = 512 * 1024):
+        # sqlalchemy yalnızca kayıt defteri ilk kullanıldığında yüklenir
+        from sqlalchemy import (Column, Float, Index, Integer, MetaData, PrimaryKeyConstraint, String, Table,
+                                Text, create_engine)
+        
+        self.projects_dir = projects_dir
+        self.max_search_bytes = max_search_bytes
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.engine = create_engine(f"sqlite:///{db_path}")
+        self.metadata = MetaData()
+        self.projects = Table(
+            "projects", self.metadata,
+            Column("name", String, primary_key=True),
+            Column("type", String, index=True),
+            Column("description", Text),
+            Column("complexity", String),
+            Column("tech_stack", Text),  # JSON liste
+            Column("tech_search", Text),  # filtreleme için küçük harfli, virgülle ayrılmış
+            Column("experts", Text),  # JSON: uzman -> dosya sayısı
+            Column("expert_count", Integer),
+            Column("file_count", Integer),
+            Column("created_at", Float, index=True),
+            Column("updated_at", Float, index=True),
+            Column("config_mtime_ns", Integer),
+            Column("status", String),  # ok, corrupt
+            Column("error", Text)
+        )
+        self.meta = Table(
+            "registry_meta", self.metadata,
+            Column("key", String, primary_key=True),
+            Column("value", String)
+        )
+        
+        # Arama indeksi: kaynak dosyalar (artımlı güncelleme için) ve FTS5 satırlarının sahipleri
+        self.search_sources = Table(
+            "search_sources", self.metadata,
+            Column("project", String),
+            Column("source", String),
+            Column("mtime_ns", Integer),
+            Column("size", Integer),
+            PrimaryKeyConstraint("project", "source")
+        )
+        self.search_rows = Table(
+            "search_rows", self.metadata,
+            Column("id", Integer, primary_key=True, autoincrement=True),
+            Column("project", String),
+            Column("source", String),
+            Column("path", String),
+            Column("kind", String),  # file, report, summary, config
+            Index("ix_search_rows_source", "project", "source")
+        )
+        self._lock = threading.Lock()
+        self._migrate()
+    
+    def _migrate(self):
+        """Şema sürümü değiştiyse tabloları yeniden oluştur (veriler diskten yeniden indekslenir)"""
+        from sqlalchemy import inspect, select
+        
+        version = None
+        if inspect(self.engine).has_table("registry_meta"):
+            with self.engine.connect() as conn:
+                version = conn.execute(
+                    select(self.meta.c.value).where(self.meta.c.key == "schema_version")
+                ).scalar()
+        
+        if version != str(self.SCHEMA_VERSION):
+            self.metadata.drop_all(self.engine)
+            self.metadata.create_all(self.engine)
+            with self.engine.begin() as conn:
+                conn.exec_driver_sql("DROP TABLE IF EXISTS search_documents")
+                conn.exec_driver_sql(
+                    "CREATE VIRTUAL TABLE search_documents USING fts5("
+                    "path, content, tokenize = 'unicode61 remove_diacritics 2')"
+                )
+                conn.execute(self.meta.insert().values(key="schema_version", value=str(self.SCHEMA_VERSION)))
+    
+    def _read_project(self, project_dir: Path, previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Proje dizininden kayıt satırını oluştur"""
+        config_file = project_dir / "project_config.json"
+        stat = config_file.stat()
+        row = {
+            "name": project_dir.name, "type": None, "description": None, "complexity": None,
+            "tech_stack": "[]", "tech_search": "", "experts": "{}", "expert_count": 0, "file_count": 0,
+            "created_at": previous["created_at"] if previous else stat.st_mtime,
+            "updated_at": stat.st_mtime, "config_mtime_ns": stat.st_mtime_ns,
+            "status": "ok", "error": None
+        }
+        
+        try:
+            with open(config_file, "r", encoding="utf-8") as f:
+                config = json.load(f)
+            tech_stack = [str(tech).strip() for tech in config.get("tech_stack", [])]
+            row.update(
+                type=config.get("type"),
+                description=config.get("description"),
+                complexity=config.get("complexity"),
+                tech_stack=json.dumps(tech_stack, ensure_ascii=False),
+                tech_search="," + ",".join(tech.lower() for tech in tech_stack) + ","
+            )
+        except (OSError, ValueError, AttributeError) as e:
+            row.update(status="corrupt", error=str(e))
+        
+        # Uzman dizinlerindeki dosya sayıları ve son güncelleme zamanı
+        experts = {}
+        for entry in os.scandir(project_dir):
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir():
+                count = sum(
+                    1 for _, _, names in os.walk(entry.path)
+                    for name in names if not name.startswith(".")
+                )
+                if count:
+                    experts[entry.name] = count
+            elif entry.name.endswith(".json"):
+                row["updated_at"] = max(row["updated_at"], entry.stat().st_mtime)
+        
+        row.update(
+            experts=json.dumps(experts, ensure_ascii=False),
+            expert_count=len(experts),
+            file_count=sum(experts.values())
+        )
+        return row
+    
+    def sync_project(self, project_dir: Path):
+        """Tek bir projenin kaydını ve arama indeksini diskten güncelle (oluşturma/geliştirme sonrası)"""
+        with self._lock, self.engine.begin() as conn:
+            if not (project_dir / "project_config.json").exists():
+                self._delete_projects(conn, [project_dir.name])
+                return
+            self._upsert(conn, [project_dir])
+            self._index_documents(conn, project_dir, None)
+    
+    def _upsert(self, conn, project_dirs: List[Path]):
+        """Projeleri tek işlemde ekle/güncelle; ilk oluşturma zamanı korunur"""
+        from sqlalchemy import select
+        from sqlalchemy.dialects.sqlite import insert
+        
+        names = [project_dir.name for project_dir in project_dirs]
+        created = dict(conn.execute(
+            select(self.projects.c.name, self.projects.c.created_at).where(self.projects.c.name.in_(names))
+        ).all())
+        
+        rows = [
+            self._read_project(project_dir, {"created_at": created[project_dir.name]}
+                               if project_dir.name in created else None)
+            for project_dir in project_dirs
+        ]
+        if not rows:
+            return
+        
+        statement = insert(self.projects)
+        conn.execute(statement.on_conflict_do_update(
+            index_elements=["name"],
+            set_={key: statement.excluded[key] for key in rows[0] if key not in ("name", "created_at")}
+        ), rows)
+    
+    def reconcile(self) -> int:
+        """Yeni, silinen veya konfigürasyonu değişen projeleri eşitle; güncellenen kayıt sayısını döndür"""
+        from sqlalchemy import select
+        
+        on_disk = {}
+        if self.projects_dir.exists():
+            for entry in os.scandir(self.projects_dir):
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue
+                try:
+                    on_disk[entry.name] = os.stat(os.path.join(entry.path, "project_config.json")).st_mtime_ns
+                except OSError:
+                    continue
+        
+        with self.engine.connect() as conn:
+            known = dict(conn.execute(select(self.projects.c.name, self.projects.c.config_mtime_ns)).all())
+        
+        changed = [name for name, mtime_ns in on_disk.items() if known.get(name) != mtime_ns]
+        removed = [name for name in known if name not in on_disk]
+        
+        if changed or removed:
+            with self._lock, self.engine.begin() as conn:
+                # SQLite parametre sınırı nedeniyle parçalar halinde
+                for i in range(0, len(changed), 500):
+                    self._upsert(conn, [self.projects_dir / name for name in changed[i:i + 500]])
+                self._delete_projects(conn, removed)
+                
+                # Yeni veya konfigürasyonu değişen projelerin dosyaları da aynı işlemde indekslenir
+                for name in changed:
+                    self._index_documents(conn, self.projects_dir / name, None)
+        
+        return len(changed) + len(removed)
+    
+    def rebuild(self) -> int:
+        """Kayıt defterini ve arama indeksini diskten baştan oluştur; kayıtlı proje sayısını döndür"""
+        with self._lock, self.engine.begin() as conn:
+            conn.execute(self.projects.delete())
+            conn.execute(self.search_sources.delete())
+            conn.execute(self.search_rows.delete())
+            conn.exec_driver_sql("DELETE FROM search_documents")
+        self.reconcile()
+        return self.count()
+    
+    def count(self) -> int:
+        from sqlalchemy import func, select
+        
+        with self.engine.connect() as conn:
+            return conn.execute(select(func.count()).select_from(self.projects)).scalar()
+    
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Ada göre kaydı döndür"""
+        from sqlalchemy import select
+        
+        with self.engine.connect() as conn:
+            row = conn.execute(select(self.projects).where(self.projects.c.name == name)).mappings().first()
+        return self._decode(row) if row else None
+    
+    def query(self, text: str = "", project_type: str = "", tech: str = "", sort: str = "updated",
+              descending: bool = True, page: int = 1, page_size: int = 20) -> tuple:
+        """Filtrelenmiş, sıralanmış sayfayı ve toplam kayıt sayısını (satırlar, toplam) döndür"""
+        from sqlalchemy import func, or_, select
+        
+        conditions = []
+        if text:
+            pattern = f"%{self._like_escape(text)}%"
+            conditions.append(or_(
+                self.projects.c.name.ilike(pattern, escape="\\"),
+                self.projects.c.description.ilike(pattern, escape="\\")
+            ))
+        if project_type:
+            conditions.append(self.projects.c.type == project_type)
+        if tech:
+            # tech_search ",react,fastapi," biçimindedir; virgüllerle birlikte tam teknoloji eşleşir
+            pattern = f"%,{self._like_escape(tech.lower().strip())},%"
+            conditions.append(self.projects.c.tech_search.like(pattern, escape="\\"))
+        
+        column = self.projects.c[self.SORT_COLUMNS.get(sort, "updated_at")]
+        order = column.desc() if descending else column.asc()
+        page = max(1, page)
+        
+        with self.engine.connect() as conn:
+            total = conn.execute(select(func.count()).select_from(self.projects).where(*conditions)).scalar()
+            rows = conn.execute(
+                select(self.projects).where(*conditions).order_by(order, self.projects.c.name)
+                .limit(page_size).offset((page - 1) * page_size)
+            ).mappings().all()
+        
+        return [self._decode(row) for row in rows], total
+    
+    # --- Tam metin arama (FTS5) ---
+    
+    def index_documents(self, project_dir: Path, paths: Optional[List[Path]] = None) -> int:
+        """Proje dosyalarını arama indeksine ekle; yalnızca boyutu/mtime'ı değişenler okunur.
+        
+        paths verilmezse tüm proje taranır ve diskten silinen dosyalar indeksten çıkarılır.
+        Yeniden indekslenen kaynak sayısını döndürür.
+        """
+        with self._lock, self.engine.begin() as conn:
+            return self._index_documents(conn, project_dir, paths)
+    
+    def _index_documents(self, conn, project_dir: Path, paths: Optional[List[Path]]) -> int:
+        from sqlalchemy import func, select
+        
+        project = project_dir.name
+        full_scan = paths is None
+        if full_scan:
+            paths = self._searchable_files(project_dir)
+        
+        stats = {}
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            stats[path.relative_to(project_dir).as_posix()] = (path, stat)
+        
+        known = {
+            row.source: (row.mtime_ns, row.size)
+            for row in conn.execute(
+                select(self.search_sources).where(self.search_sources.c.project == project)
+            )
+        }
+        
+        changed = [
+            source for source, (_, stat) in stats.items()
+            if known.get(source) != (stat.st_mtime_ns, stat.st_size)
+        ]
+        removed = [source for source in known if source not in stats] if full_scan else []
+        
+        stale = [source for source in changed if source in known] + removed
+        if stale:
+            self._delete_documents(conn, project, stale)
+        if not changed:
+            return len(removed)
+        
+        # Kimlikler önceden atanır; satırlar toplu (executemany) eklenir
+        next_id = conn.execute(select(func.coalesce(func.max(self.search_rows.c.id), 0))).scalar() + 1
+        rows, documents, sources = [], [], []
+        for source in changed:
+            path, stat = stats[source]
+            for display_path, kind, content in self._extract_documents(source, path):
+                rows.append({"id": next_id, "project": project, "source": source, "path": display_path, "kind": kind})
+                documents.append((next_id, display_path, content))
+                next_id += 1
+            sources.append({"project": project, "source": source, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size})
+        
+        if rows:
+            conn.execute(self.search_rows.insert(), rows)
+            conn.exec_driver_sql("INSERT INTO search_documents (rowid, path, content) VALUES (?, ?, ?)", documents)
+        conn.execute(self.search_sources.insert(), sources)
+        
+        return len(changed) + len(removed)
+    
+    def _searchable_files(self, project_dir: Path) -> List[Path]:
+        """Aranabilir dosyalar: proje özeti/konfigürasyonu ve uzman dizinlerindeki metin dosyaları"""
+        files = [project_dir / name for name in self.SEARCH_ROOT_FILES if (project_dir / name).is_file()]
+        for root, dirs, names in os.walk(project_dir):
+            if root == str(project_dir):
+                dirs[:] = [name for name in dirs if not name.startswith(".")]
+                continue
+            dirs[:] = [name for name in dirs if not name.startswith(".")]
+            files.extend(
+                Path(root) / name for name in names
+                if not name.startswith(".") and Path(name).suffix in CODE_EXTENSIONS
+            )
+        return files
+    
+    def _extract_documents(self, source: str, path: Path) -> List[tuple]:
+        """Kaynak dosyayı (görünen yol, tür, içerik) belgelerine dönüştür"""
+        try:
+            if path.stat().st_size > self.max_search_bytes:
+                return []
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return []
+        
+        if source == "project_config.json":
+            try:
+                config = json.loads(text)
+                parts = [config.get("description", ""), config.get("target_audience", "")]
+                parts.extend(config.get("features", []) + config.get("tech_stack", []))
+            except (ValueError, AttributeError, TypeError):
+                return []
+            return [(source, "config", "\n".join(str(part) for part in parts if part))]
+        
+        if source == "project_summary.json":
+            # Yalnızca analiz, öneri ve adımlar; kod dosyaları ayrıca indekslenir
+            try:
+                experts = json.loads(text).get("experts", {})
+                documents = []
+                for expert_type, response in experts.items():
+                    parts = [response.get("analysis", "")]
+                    parts.extend(response.get("recommendations", []) + response.get("next_steps", []))
+                    documents.append((
+                        f"{source} › {expert_type}", "summary", "\n".join(str(part) for part in parts if part)
+                    ))
+                return documents
+            except (ValueError, AttributeError, TypeError):
+                return []
+        
+        kind = "report" if path.name.endswith("report.md") else "file"
+        return [(source, kind, text)]
+    
+    def _delete_documents(self, conn, project: str, sources: List[str]):
+        """Kaynaklara ait belgeleri indeksten sil"""
+        from sqlalchemy import select
+        
+        for i in range(0, len(sources), 500):
+            chunk = sources[i:i + 500]
+            condition = (self.search_rows.c.project == project) & self.search_rows.c.source.in_(chunk)
+            row_ids = conn.execute(select(self.search_rows.c.id).where(condition)).scalars().all()
+            for j in range(0, len(row_ids), 500):
+                ids = row_ids[j:j + 500]
+                conn.exec_driver_sql(
+                    f"DELETE FROM search_documents WHERE rowid IN ({', '.join('?' * len(ids))})", tuple(ids)
+                )
+            conn.execute(self.search_rows.delete().where(condition))
+            conn.execute(self.search_sources.delete().where(
+                (self.search_sources.c.project == project) & self.search_sources.c.source.in_(chunk)
+            ))
+    
+    def _delete_projects(self, conn, names: List[str]):
+        """Projeleri kayıt defterinden ve arama indeksinden sil"""
+        from sqlalchemy import select
+        
+        for name in names:
+            sources = conn.execute(
+                select(self.search_sources.c.source).where(self.search_sources.c.project == name)
+            ).scalars().all()
+            self._delete_documents(conn, name, list(sources))
+        for i in range(0, len(names), 500):
+            conn.execute(self.projects.delete().where(self.projects.c.name.in_(names[i:i + 500])))
+    
+    def search(self, query: str, project: str = "", limit: int = 20) -> List[Dict[str, Any]]:
+        """Sorgudaki tüm kelimeleri içeren belgeleri alaka sırasıyla döndür.
+        
+        Kelimeler tırnaklanarak FTS5 sözdiziminden kaçırılır; sonda * önek araması yapar.
+        Parçacıkta eşleşen kelimeler \\x02 ve \\x03 karakterleri arasındadır.
+        """
+        terms = re.findall(r"\w+\*?", query)
+        if not terms:
+            return []
+        match = " ".join(f'"{term.rstrip("*")}"' + ("*" if term.endswith("*") else "") for term in terms)
+        
+        sql = (
+            "SELECT r.project, r.path, r.kind, "
+            "snippet(search_documents, 1, char(2), char(3), '…', 16) AS snippet, "
+            "bm25(search_documents, 4.0, 1.0) AS score "
+            "FROM search_documents JOIN search_rows r ON r.id = search_documents.rowid "
+            "WHERE search_documents MATCH ?"
+        )
+        params = [match]
+        if project:
+            sql += " AND r.project = ?"
+            params.append(project)
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+        
+        with self.engine.connect() as conn:
+            rows = conn.exec_driver_sql(sql, tuple(params)).mappings().all()
+        return [dict(row) for row in rows]
+    
+    @staticmethod
+    def _like_escape(text: str) -> str:
+        """LIKE joker karakterlerini (%, _) ve kaçış karakterini düz metin olarak eşleşecek şekilde kaçır"""
+        return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    
+    def _decode(self, row) -> Dict[str, Any]:
+        record = dict(row)
+        record["tech_stack"] = json.loads(record["tech_stack"] or "[]")
+        record["experts"] = json.loads(record["experts"] or "{}")
+        return record
+
+def display_search_results(console: Console, results: List[Dict[str, Any]], query: str, elapsed: float):
+    """ProjectRegistry.search sonuçlarını vurgulanmış parçacıklarla göster"""
+    if not results:
+        console.print(f"[yellow]📭 '{escape(query)}' için sonuç bulunamadı.[/yellow] [dim]({elapsed * 1000:.1f} ms)[/dim]")
+        return
+    
+    console.print(f"\n[bold]{len(results)} sonuç[/bold] [dim]({elapsed * 1000:.1f} ms)[/dim]\n")
+    for result in results:
+        snippet = " ".join(escape(result["snippet"]).split())
+        snippet = snippet.replace("\x02", "[bold yellow]").replace("\x03", "[/bold yellow]")
+        console.print(f"[bold cyan]{escape(result['project'])}[/bold cyan] / {escape(result['path'])} [dim]({result['kind']})[/dim]")
+        console.print(f"   {snippet}\n")
+
+class BlobStore:
+    """Üretilen dosyalar için içerik adresli blob deposu.
+    
+    Her içerik blob_dir/<ilk iki hex>/<sha256> altında bir kez ve salt okunur olarak saklanır;
+    proje ağacındaki dosyalar blob'a reflink (yazarken kopyalanan klon) ile, desteklenmiyorsa
+    düz kopya ile bağlanır ("auto" ve "reflink" modları). Reflink'li dosya ayrı bir inode'dur,
+    yerinde düzenlenmesi blob'u veya diğer projeleri etkilemez.
+    
+    "hardlink" modu açıkça seçilmelidir: dosyalar blob ile aynı inode'u paylaşır ve 0444 izni
+    bunu korumaz (root izni yok sayar, sahibi chmod u+w yapabilir). Böyle bir dosyaya yerinde
+    yapılan düzenleme aynı içeriği paylaşan tüm projelere yansır. Bozulan blob'un yeniden
+    kullanılmaması için store() mevcut blob'u doğrular, gc() ve report() bozuk blob'ları bulur.
+    """
+    
+    MODES = ("auto", "reflink", "hardlink")
+    FICLONE = 0x40049409  # Linux ioctl: btrfs, xfs, bcachefs...
+    
+    def __init__(self, blob_dir: Path, mode: str = "auto"):
+        if mode not in self.MODES:
+            raise ValueError(f"Geçersiz blob modu: {mode} ({', '.join(self.MODES)})")
+        self.blob_dir = blob_dir
+        self.mode = mode
+        self._reflink = mode in ("auto", "reflink") and sys.platform.startswith("linux")
+        self._hardlink = mode == "hardlink"
+        # Doğrulanmış blob'lar: sha256 -> (inode, boyut, mtime_ns); değişmedikçe yeniden okunmaz
+        self._verified: Dict[str, tuple] = {}
+    
+    def path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / digest
+    
+    @property
+    def can_share(self) -> bool:
+        """Reflink veya hardlink hâlâ kullanılabilir mi? (değilse blob saklamak yalnızca yer harcar)"""
+        return self._reflink or self._hardlink
+    
+    def _intact(self, blob: Path, digest: str, stat: os.stat_result) -> bool:
+        """Blob içeriği adındaki sha256 ile hâlâ eşleşiyor mu?"""
+        signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        if self._verified.get(digest) == signature:
+            return True
+        
+        sha = hashlib.sha256()
+        with open(blob, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha.update(chunk)
+        if sha.hexdigest() != digest:
+            return False
+        self._verified[digest] = signature
+        return True
+    
+    def store(self, digest: str, data: bytes, fsync: bool = False) -> Path:
+        """İçeriği blob olarak kaydet; sağlam bir blob zaten varsa onu döndür.
+        
+        Mevcut blob'un boyutu veya içeriği adıyla uyuşmuyorsa (hardlink'li bir dosya yerinde
+        düzenlenmişse) blob yenisiyle değiştirilir; bozuk inode'a bağlı dosyalar ona bağlı kalır.
+        """
+        blob = self.path(digest)
+        try:
+            stat = blob.stat()
+            if stat.st_size == len(data) and self._intact(blob, digest, stat):
+                return blob
+            self._verified.pop(digest, None)
+        except FileNotFoundError:
+            pass
+        
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=blob.parent, prefix=f".{digest[:8]}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.chmod(tmp_name, 0o444)
+            os.replace(tmp_name, blob)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        return blob
+    
+    def materialize(self, blob: Path, target: str, mode: int) -> str:
+        """Blob'u target yoluna bağla; kullanılan yöntemi (reflink, hardlink, copy) döndür"""
+        if self._reflink:
+            import fcntl
+            
+            dst = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+            try:
+                src = os.open(blob, os.O_RDONLY)
+                try:
+                    fcntl.ioctl(dst, self.FICLONE, src)
+                    return "reflink"
+                finally:
+                    os.close(src)
+            except OSError:
+                # Dosya sistemi klonlamayı desteklemiyor; bir daha denenmez
+                self._reflink = False
+                os.unlink(target)
+            finally:
+                os.close(dst)
+        
+        if self._hardlink:
+            try:
+                os.link(blob, target)
+                return "hardlink"
+            except OSError:
+                # Farklı dosya sistemi veya hardlink desteği yok
+                self._hardlink = False
+        
+        shutil.copyfile(blob, target)
+        os.chmod(target, mode)
+        return "copy"
+    
+    def _manifest_entries(self, projects_dir: Path):
+        """Proje ağaçlarındaki yazıcı manifestlerinin kayıtlarını üret"""
+        for root, dirs, names in os.walk(projects_dir):
+            dirs[:] = [name for name in dirs if not name.startswith(".")]
+            if AsyncFileWriter.MANIFEST_NAME not in names:
+                continue
+            try:
+                with open(os.path.join(root, AsyncFileWriter.MANIFEST_NAME), "r", encoding="utf-8") as f:
+                    entries = json.load(f).get("files", {})
+            except (OSError, ValueError, AttributeError):
+                continue
+            yield from entries.values()
+    
+    def _blobs(self):
+        """(yol, stat) çiftleri; geçici dosyalar dahil"""
+        if not self.blob_dir.exists():
+            return
+        for prefix in os.scandir(self.blob_dir):
+            if not prefix.is_dir():
+                continue
+            for entry in os.scandir(prefix.path):
+                yield Path(entry.path), entry.stat()
+    
+    def report(self, projects_dir: Path) -> Dict[str, int]:
+        """Blob sayısı/boyutu, paylaşım sayesinde kazanılan alan ve bozuk blob sayısı"""
+        logical_bytes = 0
+        linked_files = 0
+        referenced = set()
+        for entry in self._manifest_entries(projects_dir):
+            if entry.get("blob") in ("reflink", "hardlink"):
+                linked_files += 1
+                logical_bytes += entry.get("size", 0)
+                referenced.add(entry.get("sha256"))
+        
+        blobs = blob_bytes = shared_bytes = corrupt = 0
+        for blob, stat in self._blobs():
+            if blob.name.startswith("."):
+                continue
+            blobs += 1
+            blob_bytes += stat.st_size
+            if not self._intact(blob, blob.name, stat):
+                corrupt += 1
+            elif blob.name in referenced:
+                shared_bytes += stat.st_size
+        
+        return {
+            "blobs": blobs,
+            "blob_bytes": blob_bytes,
+            "linked_files": linked_files,
+            "logical_bytes": logical_bytes,
+            "saved_bytes": max(0, logical_bytes - shared_bytes),
+            "corrupt": corrupt
+        }
+    
+    def gc(self, projects_dir: Path, grace_seconds: float = 3600, dry_run: bool = False) -> Dict[str, int]:
+        """Hiçbir dosyanın bağlı olmadığı ve hiçbir manifestte geçmeyen blob'ları sil.
+        
+        Hardlink'li blob'lar link sayısıyla korunur; reflink ve kopyalar blob'dan bağımsız
+        olduğu için silinmeleri dosyaları etkilemez, yalnızca gelecekteki paylaşımı kaybettirir.
+        report() gibi yalnızca reflink/hardlink kayıtları referans sayılır; kopyalar paylaşmaz.
+        grace_seconds'tan yeni blob'lar, süren yazmalarla yarışmamak için tutulur. İçeriği
+        adıyla uyuşmayan (bozuk) blob'lar her durumda silinir; bağlı dosyalar etkilenmez.
+        """
+        referenced = {
+            entry.get("sha256") for entry in self._manifest_entries(projects_dir)
+            if entry.get("blob") in ("reflink", "hardlink")
+        }
+        now = time.time()
+        removed = freed_bytes = kept = corrupt = 0
+        
+        for blob, stat in self._blobs():
+            orphan_tmp = blob.name.startswith(".")
+            broken = not orphan_tmp and not self._intact(blob, blob.name, stat)
+            in_use = not orphan_tmp and (stat.st_nlink > 1 or blob.name in referenced)
+            if not broken and (in_use or now - stat.st_mtime < grace_seconds):
+                kept += 1
+                continue
+            if not dry_run:
+                blob.unlink()
+                self._verified.pop(blob.name, None)
+            removed += 1
+            corrupt += broken
+            freed_bytes += stat.st_size
+        
+        return {"removed": removed, "freed_bytes": freed_bytes, "kept": kept, "corrupt": corrupt}
+
+def read_process_umask() -> int:
+    """Sürecin umask değerini döndür.
+    
+    Linux'ta /proc/self/status'tan okunur; os.umask ile okumak değeri geçici olarak değiştirir
+    ve o sırada dosya oluşturan diğer iş parçacıklarını etkiler, bu yüzden yalnızca modül
+    yüklenirken (tek seferlik) yedek yol olarak kullanılır.
+    """
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+PROCESS_UMASK = read_process_umask()
+
+class AsyncFileWriter:
+    """Üretilen dosyaları olay döngüsünü bloklamadan, toplu ve atomik olarak yazar.
+    
+    Bir parti (batch) tek bir iş parçacığında yazılır: gereken dizinler bir kez oluşturulur,
+    her dosya hedefin yanındaki geçici dosyaya yazılır ve veriler diske aktarıldıktan sonra
+    os.replace ile yerine taşınır. Böylece yarıda kalan bir yazma hedef dosyayı bozmaz.
+    fsync açıksa yalnızca bu partinin geçici dosyaları (os.fsync) ve yeniden adlandırmalar
+    için dizinleri senkronize edilir; makinenin tüm kirli sayfaları (os.sync) beklenmez.
+    
+    İçeriği diskteki dosyayla aynı olan dosyalar yeniden yazılmaz (mtime korunur).
+    root verilirse root altındaki bir manifest (yol -> sha256, boyut, mtime) tutulur:
+    boyutu ve mtime'ı değişmemiş dosyalar okunmadan karşılaştırılır, önceki partide
+    üretilip bu partide olmayan dosyalar (kullanıcı değiştirmediyse) silinir.
+    blob_store verilirse root altındaki dosyalar içerik adresli blob'lara bağlanır.
+    """
+    
+    MANIFEST_NAME = ".vibe-manifest.json"
+    
+    def __init__(self, fsync: bool = True, blob_store: Optional[BlobStore] = None):
+        self.fsync = fsync
+        self.blob_store = blob_store
+        # Geçici dosyalar 0600 izinle açılır; yeni dosyalara normal open() izinlerini ver
+        self._file_mode = 0o666 & ~PROCESS_UMASK
+        self._stats = {"written": 0, "unchanged": 0, "deleted": 0}
+        self._lock = threading.Lock()
+    
+    def stats(self) -> Dict[str, int]:
+        """Oturum boyunca yazılan, değişmeyen ve silinen dosya sayıları"""
+        with self._lock:
+            return dict(self._stats)
+    
+    async def write(self, files, root: Optional[Path] = None, keep=(), prune: bool = True) -> "WriteSummary":
+        """(yol, içerik) çiftlerini iş parçacığı havuzunda yaz"""
+        files = list(files)
+        if not files and root is None:
+            return WriteSummary()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.write_sync, files, root, keep, prune)
+    
+    def write_sync(self, files, root: Optional[Path] = None, keep=(), prune: bool = True) -> "WriteSummary":
+        """(yol, içerik) çiftlerini aynı iş parçacığında toplu ve atomik yaz.
+        
+        root verilirse files, root altındaki üretilmiş dosyaların tam kümesi kabul edilir;
+        keep'teki yollar (bu partide üretilemeyenler) ise silinmez ve manifestte kalır.
+        prune=False ise files yalnızca bir kısmı sayılır: manifestteki hiçbir dosya silinmez.
+        """
+        # Aynı yol birden fazla kez verilirse son içerik geçerlidir
+        contents = {Path(path): content.encode("utf-8") for path, content in files}
+        manifest = self._load_manifest(root) if root is not None else {}
+        
+        summary = WriteSummary()
+        pending = []
+        managed = {}
+        for path, data in contents.items():
+            digest = hashlib.sha256(data).hexdigest()
+            key = self._manifest_key(root, path)
+            if key is not None:
+                managed[key] = digest
+            
+            if self._is_current(path, digest, len(data), manifest.get(key)):
+                summary.unchanged += 1
+            else:
+                pending.append((path, data))
+        
+        methods = self._commit(pending, sync=self.fsync, use_blobs=root is not None and self.blob_store is not None)
+        summary.written = len(pending)
+        
+        if root is not None:
+            if prune:
+                kept = {self._manifest_key(root, Path(path)) for path in keep} & manifest.keys()
+            else:
+                kept = set(manifest)
+            
+            # Önceki partide üretilip artık üretilmeyen dosyaları temizle
+            for key, entry in manifest.items():
+                if key in managed or key in kept:
+                    continue
+                path = root / key
+                if self._is_current(path, entry.get("sha256"), entry.get("size"), entry):
+                    path.unlink()
+                    summary.deleted += 1
+            
+            written = {path for path, _ in pending}
+            updated = {key: manifest[key] for key in kept if key not in managed}
+            for key, digest in managed.items():
+                path = root / key
+                stat = path.stat()
+                updated[key] = {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+                
+                # Blob'a bağlı dosyalar (reflink/hardlink/copy) gc ve tasarruf raporu için işaretlenir
+                blob = methods.get(path) if path in written else manifest.get(key, {}).get("blob")
+                if blob:
+                    updated[key]["blob"] = blob
+            
+            # Manifest yalnızca bir önbellektir: kaybolursa dosyalar okunarak karşılaştırılır
+            if updated != manifest:
+                data = json.dumps({"files": updated}, ensure_ascii=False, indent=2).encode("utf-8")
+                self._commit([(root / self.MANIFEST_NAME, data)], sync=False)
+        
+        with self._lock:
+            self._stats["written"] += summary.written
+            self._stats["unchanged"] += summary.unchanged
+            self._stats["deleted"] += summary.deleted
+        
+        return summary
+    
+    def _manifest_key(self, root: Optional[Path], path: Path) -> Optional[str]:
+        """Dosyanın manifest anahtarı (root'a göre göreli yol); root dışındaysa None"""
+        if root is None:
+            return None
+        try:
+            return path.relative_to(root).as_posix()
+        except ValueError:
+            return None
+    
+    def _load_manifest(self, root: Path) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(root / self.MANIFEST_NAME, "r", encoding="utf-8") as f:
+                return json.load(f).get("files", {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+    
+    def _is_current(self, path: Path, digest: Optional[str], size: Optional[int],
+                    entry: Optional[Dict[str, Any]]) -> bool:
+        """Diskteki dosyanın içeriği digest ile aynı mı (manifest eşleşirse dosya okunmaz)"""
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if stat.st_size != size:
+            return False
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return entry.get("sha256") == digest
+        try:
+            return hashlib.sha256(path.read_bytes()).hexdigest() == digest
+        except OSError:
+            return False
+    
+    def _commit(self, files: List[tuple], sync: bool, use_blobs: bool = False) -> Dict[Path, str]:
+        """(yol, bayt) çiftlerini geçici dosyalar üzerinden atomik olarak yerine taşı.
+        
+        use_blobs ise içerikler blob deposuna yazılır ve dosyalar blob'a bağlanır;
+        dosya başına kullanılan bağlama yöntemi döndürülür.
+        """
+        methods: Dict[Path, str] = {}
+        if not files:
+            return methods
+        
+        directories = {path.parent for path, _ in files}
+        for directory in sorted(directories):
+            directory.mkdir(parents=True, exist_ok=True)
+        
+        staged = []
+        try:
+            for path, data in files:
+                # Bağlama düz kopyaya düştüyse blob paylaşılmaz; dosya doğrudan yazılır
+                if use_blobs and self.blob_store.can_share:
+                    blob = self.blob_store.store(hashlib.sha256(data).hexdigest(), data, fsync=sync)
+                    directories.add(blob.parent)
+                    tmp_name = str(path.parent / f".{path.name}.{os.urandom(4).hex()}.tmp")
+                    staged.append((tmp_name, path))
+                    methods[path] = self.blob_store.materialize(blob, tmp_name, self._file_mode)
+                    if sync and methods[path] != "hardlink":
+                        # Reflink/kopya ayrı bir dosyadır; blob'un fsync'i onu kapsamaz
+                        fd = os.open(tmp_name, os.O_RDONLY)
+                        try:
+                            os.fsync(fd)
+                        finally:
+                            os.close(fd)
+                    continue
+                
+                fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+                staged.append((tmp_name, path))
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                    if sync:
+                        f.flush()
+                        os.fsync(f.fileno())
+                
+                # Blob'a hardlink'li (salt okunur, paylaşılan) dosyanın izinleri devralınmaz
+                try:
+                    stat = path.stat()
+                    mode = stat.st_mode & 0o777 if stat.st_nlink == 1 else self._file_mode
+                except FileNotFoundError:
+                    mode = self._file_mode
+                os.chmod(tmp_name, mode)
+            
+            while staged:
+                tmp_name, path = staged.pop()
+                os.replace(tmp_name, path)
+        finally:
+            # Hata durumunda yerine taşınmamış geçici dosyaları temizle
+            for tmp_name, _ in staged:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+        
+        if sync and os.name == "posix":
+            # Yeniden adlandırmaların kalıcı olması için dizinleri bir kez senkronize et
+            for directory in directories:
+                fd = os.open(directory, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+        
+        return methods
+
+class PatchConflict(Exception):
+    """Düzenleme mevcut dosyaya uygulanamadı"""
+
+class PatchApplier:
+    """Uzmanların döndürdüğü FileEdit listesini diskteki dosyalara uygular.
+    
+    Arama/değiştirme düzenlemelerinde aranan metin dosyada tam olarak bir kez geçmelidir.
+    Unified diff hunk'ları beklenen satırın çevresinde bağlam satırlarıyla eşleştirilir;
+    satır numaraları kaymışsa en yakın eşleşme kullanılır. Eşleşmeyen düzenlemeler
+    çakışma olarak raporlanır ve o dosya yazılmaz; diğer dosyalar uygulanır.
+    """
+    
+    HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+    
+    def __init__(self, base_dir: Path, writer: Optional[AsyncFileWriter] = None):
+        self.base_dir = base_dir
+        self.writer = writer or AsyncFileWriter()
+    
+    def apply(self, edits: List[FileEdit], dry_run: bool = False) -> List[PatchResult]:
+        """Düzenlemeleri dosya bazında uygula, her dosya için sonuç döndür"""
+        # Aynı dosyaya ait düzenlemeler sırayla, tek seferde uygulanır
+        grouped: Dict[str, List[FileEdit]] = {}
+        for edit in edits:
+            grouped.setdefault(edit.path, []).append(edit)
+        
+        results = []
+        writes = []
+        deletes = []
+        for path, file_edits in grouped.items():
+            try:
+                target = self._resolve(path)
+                original = target.read_text(encoding="utf-8") if target.exists() else None
+                content = original
+                for edit in file_edits:
+                    content = self._apply_edit(edit, content)
+            except (PatchConflict, UnicodeDecodeError) as e:
+                results.append(PatchResult(path=path, status="conflict", message=str(e)))
+                continue
+            
+            if content is None:
+                status = "deleted"
+            elif original is None:
+                status = "created"
+            elif content == original:
+                status = "unchanged"
+            else:
+                status = "applied"
+            
+            if content is None:
+                deletes.append(target)
+            elif status != "unchanged":
+                writes.append((target, content))
+            
+            results.append(PatchResult(
+                path=path,
+                status=status,
+                message=f"{len(file_edits)} düzenleme",
+                added=self._count_lines(original, content, added=True),
+                removed=self._count_lines(original, content, added=False)
+            ))
+        
+        # Çakışmasız dosyalar tek partide atomik olarak yazılır
+        if not dry_run:
+            self.writer.write_sync(writes)
+            for target in deletes:
+                target.unlink()
+        
+        return results
+    
+    def _resolve(self, path: str) -> Path:
+        """Yolu base_dir altında çöz; dışarı çıkan yolları reddet"""
+        target = (self.base_dir / path).resolve()
+        try:
+            target.relative_to(self.base_dir.resolve())
+        except ValueError:
+            raise PatchConflict(f"Proje dizini dışında yol: {path}")
+        return target
+    
+    def _apply_edit(self, edit: FileEdit, content: Optional[str]) -> Optional[str]:
+        if edit.operation == "create":
+            if content is not None:
+                raise PatchConflict("Dosya zaten var")
+            return edit.content or ""
+        
+        if edit.operation == "delete":
+            if content is None:
+                raise PatchConflict("Silinecek dosya yok")
+            return None
+        
+        if edit.operation == "replace":
+            if content is None:
+                raise PatchConflict("Düzenlenecek dosya yok")
+            if not edit.search:
+                raise PatchConflict("Aranan metin boş")
+            count = content.count(edit.search)
+            if count == 0:
+                raise PatchConflict("Aranan metin dosyada bulunamadı")
+            if count > 1:
+                raise PatchConflict(f"Aranan metin {count} kez geçiyor, tek eşleşme gerekli")
+            return content.replace(edit.search, edit.replace or "", 1)
+        
+        if edit.operation == "diff":
+            return self._apply_unified_diff(edit.diff or "", content)
+        
+        raise PatchConflict(f"Bilinmeyen işlem: {edit.operation}")
+    
+    def _apply_unified_diff(self, diff: str, content: Optional[str]) -> str:
+        """Unified diff'i içeriğe uygula"""
+        lines = content.splitlines() if content else []
+        trailing_newline = content is None or content.endswith("\n") or content == ""
+        hunks = self._parse_hunks(diff)
+        if not hunks:
+            raise PatchConflict("Diff içinde hunk bulunamadı")
+        
+        offset = 0
+        for old_start, old_lines, new_lines in hunks:
+            expected = max(old_start - 1 + offset, 0)
+            position = self._find_block(lines, old_lines, expected)
+            if position is None:
+                raise PatchConflict(f"Hunk eşleşmedi (satır {old_start})")
+            lines[position:position + len(old_lines)] = new_lines
+            offset = position - (old_start - 1) + len(new_lines) - len(old_lines)
+        
+        return "\n".join(lines) + ("\n" if lines and trailing_newline else "")
+    
+    def _parse_hunks(self, diff: str) -> List[tuple]:
+        """Diff'i (eski başlangıç satırı, eski satırlar, yeni satırlar) listesine çevir
+        
+        ---/+++ satırları yalnızca hunk dışında dosya başlığıdır; hunk içinde ilk karakter
+        işlemdir ("--- eski yorum" silinen "-- eski yorum" satırıdır). Hunk'ın sonu @@ başlığındaki
+        satır sayılarıyla belirlenir, sayıları tutmayan hunk reddedilir.
+        """
+        hunks = []
+        current = None
+        old_left = new_left = 0
+        
+        for line in diff.splitlines():
+            if current is not None and (old_left > 0 or new_left > 0):
+                if line.startswith("\\"):
+                    # "\ No newline at end of file"
+                    continue
+                op, text = (line[0], line[1:]) if line else (" ", "")
+                if op == "-" and old_left > 0:
+                    current[1].append(text)
+                    old_left -= 1
+                elif op == "+" and new_left > 0:
+                    current[2].append(text)
+                    new_left -= 1
+                elif op == " " and old_left > 0 and new_left > 0:
+                    # Bağlam satırı (boş satırlar baştaki boşluğu kaybetmiş olabilir)
+                    current[1].append(text)
+                    current[2].append(text)
+                    old_left -= 1
+                    new_left -= 1
+                else:
+                    raise PatchConflict(
+                        f"Hunk satır sayıları başlıkla uyuşmuyor (satır {current[0]})"
+                    )
+                continue
+            
+            header = self.HUNK_HEADER.match(line)
+            if header:
+                old_start = int(header.group(1))
+                old_left = int(header.group(2)) if header.group(2) is not None else 1
+                new_left = int(header.group(4)) if header.group(4) is not None else 1
+                if old_left == 0:
+                    # "@@ -N,0 +M,k @@": ekleme N. satırın ardına yapılır
+                    old_start += 1
+                current = (old_start, [], [])
+                hunks.append(current)
+            elif line.startswith(("-", "+", " ")) and current is not None and not line.startswith(("---", "+++")):
+                raise PatchConflict(
+                    f"Hunk satır sayıları başlıkla uyuşmuyor (satır {current[0]})"
+                )
+        
+        if current is not None and (old_left > 0 or new_left > 0):
+            raise PatchConflict(f"Hunk eksik, başlıktaki satır sayılarına ulaşılamadı (satır {current[0]})")
+        
+        return hunks
+    
+    def _find_block(self, lines: List[str], block: List[str], expected: int) -> Optional[int]:
+        """Bloğu beklenen konuma en yakın yerde bul (önce birebir, sonra satır sonu boşlukları yok sayarak)"""
+        if not block:
+            return min(expected, len(lines))
+        
+        for normalize in (lambda line: line, lambda line: line.rstrip()):
+            target = [normalize(line) for line in block]
+            candidates = [
+                i for i in range(len(lines) - len(block) + 1)
+                if [normalize(line) for line in lines[i:i + len(block)]] == target
+            ]
+            if candidates:
+                return min(candidates, key=lambda i: abs(i - expected))
+        
+        return None
+    
+    def _count_lines(self, original: Optional[str], content: Optional[str], added: bool) -> int:
+        """Eklenen veya silinen satır sayısı"""
+        before = (original or "").splitlines()
+        after = (content or "").splitlines()
+        matcher = difflib.SequenceMatcher(a=before, b=after, autojunk=False)
+        return sum(
+            (j2 - j1) if added else (i2 - i1)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"
+        )
+
+class ExpertRegistry:
+    """Uzmanları hafif tanımlar (sistem prompt'u) olarak tutar.
+    
+    Ajan nesnesi ilk erişimde factory(expert_type, system_prompt) ile oluşturulur ve saklanır.
+    Sözlük gibi kullanılabilir: registry["backend"].
+    """
+    
+    def __init__(self, factory):
+        self._factory = factory
+        self._prompts: Dict[str, str] = {}
+        self._agents: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+    
+    def register(self, expert_type: str, system_prompt: str):
+        self._prompts[expert_type] = system_prompt
+        self._agents.pop(expert_type, None)
+    
+    def system_prompt(self, expert_type: str) -> str:
+        return self._prompts[expert_type]
+    
+    def is_loaded(self, expert_type: str) -> bool:
+        return expert_type in self._agents
+    
+    def load_all(self, expert_types: Optional[List[str]] = None):
+        """Verilen (veya tüm) uzmanların ajanlarını oluştur"""
+        for expert_type in expert_types or list(self._prompts):
+            self[expert_type]
+    
+    def keys(self):
+        return self._prompts.keys()
+    
+    def __contains__(self, expert_type: str) -> bool:
+        return expert_type in self._prompts
+    
+    def __iter__(self):
+        return iter(self._prompts)
+    
+    def __len__(self) -> int:
+        return len(self._prompts)
+    
+    def __getitem__(self, expert_type: str):
+        agent = self._agents.get(expert_type)
+        if agent is None:
+            with self._lock:
+                agent = self._agents.get(expert_type)
+                if agent is None:
+                    agent = self._factory(expert_type, self._prompts[expert_type])
+                    self._agents[expert_type] = agent
+        return agent
 
 class VibeCodingAISystem:
     """VibeCoding AI Sistemi Ana Sınıfı"""
@@ -68,13 +1824,66 @@ class VibeCodingAISystem:
         self.console = Console()
         self.api_key = None
         self.model = None
-        self.experts = {}
+        self.experts = ExpertRegistry(self._build_expert_agent)
+        self.patch_experts = ExpertRegistry(self._build_patch_agent)
+        self.plan_experts = ExpertRegistry(self._build_plan_agent)
+        self.fill_experts = ExpertRegistry(self._build_fill_agent)
         self.current_project = None
         self.output_dir = Path("generated_projects")
         self.output_dir.mkdir(exist_ok=True)
         
+        # Aynı anda çalışabilecek uzman sayısı (1 = sıralı çalışma)
+        self.max_concurrent_experts = env_number("VIBE_MAX_CONCURRENT_EXPERTS", 4, minimum=1)
+        self._expert_semaphore = None
+        
+        # Plan-doldur modu (VIBE_PLAN_THEN_FILL): önce manifest, sonra dosyalar paralel yazılır
+        self.plan_then_fill = os.getenv("VIBE_PLAN_THEN_FILL", "false").lower() == "true"
+        self.max_concurrent_files = env_number("VIBE_MAX_CONCURRENT_FILES", 4, minimum=1)
+        self._file_semaphore = None
+        self._file_indexes: Dict[Path, "ProjectFileIndex"] = {}
+        self.test_context_tokens = env_number("VIBE_TEST_CONTEXT_TOKENS", 12000)
+        # Düzenleme modunda uzmanın dosyaları tam içerikle gönderilir; bu sınırı aşanlar reddedilir
+        self.patch_context_tokens = env_number("VIBE_PATCH_CONTEXT_TOKENS", 24000)
+        self.skeleton_extractor = CodeSkeletonExtractor()
+        
+        # Üretilen dosyalar için toplu, atomik ve bloklamayan yazıcı (VIBE_FSYNC=false: fsync yok).
+        # VIBE_BLOB_STORE (off, auto, reflink, hardlink): aynı içerikli dosyalar tek blob'u paylaşır.
+        # hardlink modunda dosyalar blob ile aynı inode'dur; yerinde düzenleme diğer projelere yansır
+        blob_mode = os.getenv("VIBE_BLOB_STORE", "off").lower()
+        blob_store = None
+        if blob_mode != "off":
+            blob_store = BlobStore(
+                Path(os.getenv("VIBE_BLOB_DIR", str(self.output_dir / ".cache" / "blobs"))), blob_mode
+            )
+        self.file_writer = AsyncFileWriter(
+            fsync=os.getenv("VIBE_FSYNC", "true").lower() == "true", blob_store=blob_store
+        )
+        self.test_sharding = os.getenv("VIBE_TEST_SHARDING", "true").lower() == "true"
+        self.test_max_shards = env_number("VIBE_TEST_MAX_SHARDS", 8, minimum=1)
+        
+        # Artımlı üretim (VIBE_INCREMENTAL): yalnızca girdileri değişen uzmanları yeniden çalıştır
+        self.incremental = os.getenv("VIBE_INCREMENTAL", "true").lower() == "true"
+        
+        # Uzman başına model çağrısı, önbellek isabeti ve token sayaçları
+        self.call_stats: Dict[str, Dict[str, int]] = {}
+        
+        # Proje kayıt defteri (SQLite); ilk listelemede oluşturulur
+        self._project_registry = None
+        self.projects_page_size = env_number("VIBE_PROJECTS_PAGE_SIZE", 20, minimum=1)
+        
+        # Uzman yanıt önbelleği (VIBE_CACHE: on, off, refresh)
+        self.cache_mode = os.getenv("VIBE_CACHE", "on").lower()
+        self.expert_cache = None
+        if self.cache_mode != "off":
+            self.expert_cache = ExpertCache(
+                Path(os.getenv("VIBE_CACHE_DIR", str(self.output_dir / ".cache" / "experts"))),
+                ttl_seconds=env_number("VIBE_CACHE_TTL_DAYS", 7.0, float) * 86400,
+                max_bytes=int(env_number("VIBE_CACHE_MAX_MB", 200.0, float) * 1024 * 1024)
+            )
+        
         # API anahtarını yükle
         self._load_api_key()
+        self.model_name = self._get_model()
         self._initialize_experts()
     
     def _load_api_key(self):
@@ -92,13 +1901,48 @@ class VibeCodingAISystem:
             self.console.print("[red]❌ API anahtarı bulunamadı! Lütfen .env dosyasını kontrol edin.[/red]")
             sys.exit(1)
     
+    def _register_expert(self, expert_type: str, system_prompt: str):
+        """Uzmanı kaydet; ajan ilk kullanımda oluşturulur"""
+        self.experts.register(expert_type, system_prompt)
+        self.patch_experts.register(expert_type, system_prompt + PATCH_MODE_INSTRUCTIONS)
+        self.plan_experts.register(expert_type, system_prompt + PLAN_MODE_INSTRUCTIONS)
+        self.fill_experts.register(expert_type, system_prompt + FILL_MODE_INSTRUCTIONS)
+    
+    def _build_expert_agent(self, expert_type: str, system_prompt: str, result_type=ExpertResponse):
+        """Uzman ajanını oluştur"""
+        # pydantic_ai ağır bir modül; yalnızca ilk ajan oluşturulurken yüklenir
+        from pydantic_ai import Agent
+        
+        return Agent(
+            model=self.model_name,
+            result_type=result_type,
+            system_prompt=system_prompt
+        )
+    
+    def _build_patch_agent(self, expert_type: str, system_prompt: str):
+        """Düzenleme (patch) modundaki uzman ajanını oluştur"""
+        return self._build_expert_agent(expert_type, system_prompt, result_type=ExpertPatchResponse)
+    
+    def _build_plan_agent(self, expert_type: str, system_prompt: str):
+        """Plan-doldur modunda manifest üreten uzman ajanını oluştur"""
+        return self._build_expert_agent(expert_type, system_prompt, result_type=ExpertPlan)
+    
+    def _build_fill_agent(self, expert_type: str, system_prompt: str):
+        """Plan-doldur modunda tek dosya içeriği yazan uzman ajanını oluştur (düz metin çıktı)"""
+        return self._build_expert_agent(expert_type, system_prompt, result_type=str)
+    
+    def prewarm_experts(self, expert_types: Optional[List[str]] = None) -> threading.Thread:
+        """Uzman ajanlarını arka planda önceden oluştur"""
+        thread = threading.Thread(target=self.experts.load_all, args=(expert_types,), daemon=True)
+        thread.start()
+        return thread
+    
     def _initialize_experts(self):
-        """Uzman AI ajanlarını başlat"""
+        """Uzmanları kaydet (ajanlar ilk kullanımda oluşturulur)"""
         
         # Backend Uzmanı
-        self.experts['backend'] = Agent(
-            model=self._get_model(),
-            result_type=ExpertResponse,
+        self._register_expert(
+            'backend',
             system_prompt="""
             Sen bir Backend Geliştirme Uzmanısın. VibeCoding metodolojisini kullanarak:
             
@@ -132,9 +1976,8 @@ class VibeCodingAISystem:
         )
         
         # Frontend Uzmanı
-        self.experts['frontend'] = Agent(
-            model=self._get_model(),
-            result_type=ExpertResponse,
+        self._register_expert(
+            'frontend',
             system_prompt="""
             Sen bir Frontend Geliştirme Uzmanısın. VibeCoding metodolojisini kullanarak:
             
@@ -169,9 +2012,8 @@ class VibeCodingAISystem:
         )
         
         # Database Uzmanı
-        self.experts['database'] = Agent(
-            model=self._get_model(),
-            result_type=ExpertResponse,
+        self._register_expert(
+            'database',
             system_prompt="""
             Sen bir Veritabanı Uzmanısın. VibeCoding metodolojisini kullanarak:
             
@@ -206,9 +2048,8 @@ class VibeCodingAISystem:
         )
         
         # UI/UX Uzmanı
-        self.experts['uiux'] = Agent(
-            model=self._get_model(),
-            result_type=ExpertResponse,
+        self._register_expert(
+            'uiux',
             system_prompt="""
             Sen bir UI/UX Tasarım Uzmanısın. VibeCoding metodolojisini kullanarak:
             
@@ -243,9 +2084,8 @@ class VibeCodingAISystem:
         )
         
         # DevOps Uzmanı
-        self.experts['devops'] = Agent(
-            model=self._get_model(),
-            result_type=ExpertResponse,
+        self._register_expert(
+            'devops',
             system_prompt="""
             Sen bir DevOps Uzmanısın. VibeCoding metodolojisini kullanarak:
             
@@ -280,9 +2120,8 @@ class VibeCodingAISystem:
         )
         
         # Mobile Uzmanı
-        self.experts['mobile'] = Agent(
-            model=self._get_model(),
-            result_type=ExpertResponse,
+        self._register_expert(
+            'mobile',
             system_prompt="""
             Sen bir Mobile Geliştirme Uzmanısın. VibeCoding metodolojisini kullanarak:
             
@@ -317,9 +2156,8 @@ class VibeCodingAISystem:
         )
         
         # Test Uzmanı
-        self.experts['test'] = Agent(
-            model=self._get_model(),
-            result_type=ExpertResponse,
+        self._register_expert(
+            'test',
             system_prompt="""
             Sen bir Test Uzmanısın ve Kalite Güvence (QA) Uzmanısın. VibeCoding metodolojisini kullanarak:
             
@@ -403,9 +2241,8 @@ class VibeCodingAISystem:
         )
         
         # Akıllı Proje Analizci
-        self.experts['smart_analyzer'] = Agent(
-            model=self._get_model(),
-            result_type=ExpertResponse,
+        self._register_expert(
+            'smart_analyzer',
             system_prompt="""
             Sen VibeCoding Akıllı Proje Analizci'sin. Tek bir kullanıcı isteğini alıp, minimum sorularla netleştirerek otomatik teknoloji seçimi yapan ve hazır çözüm üreten bir uzmansın.
             
@@ -559,6 +2396,8 @@ class VibeCodingAISystem:
         self.console.print("  [cyan]3[/cyan] - 🔧 Proje Geliştir")
         self.console.print("  [cyan]4[/cyan] - 📋 Proje Listesi")
         self.console.print("  [cyan]5[/cyan] - 🧠 Akıllı Proje Analizi")
+        self.console.print("  [cyan]6[/cyan] - 🗂️ Proje Kayıt Defteri (ara, filtrele, sırala)")
+        self.console.print("  [cyan]7[/cyan] - 🔎 Projelerde Ara (tam metin)")
         
         # Uzman Modları
         self.console.print("\n[bold yellow]👨‍💻 UZMAN MODLARI:[/bold yellow]")
@@ -651,8 +2490,10 @@ class VibeCodingAISystem:
         
         # Konfigürasyonu kaydet
         config_file = project_dir / "project_config.json"
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(project_config.model_dump(), f, ensure_ascii=False, indent=2)
+        await self.file_writer.write([
+            (config_file, json.dumps(project_config.model_dump(), ensure_ascii=False, indent=2))
+        ])
+        self._sync_project_registry(project_dir)
         
         self.console.print(f"\n[green]✅ Proje '{project_name}' oluşturuldu![/green]")
         self.console.print(f"📁 Proje dizini: {project_dir}")
@@ -676,9 +2517,9 @@ class VibeCodingAISystem:
         for expert in required_experts:
             self.console.print(f"👨‍💻 {expert.title()} Uzmanı")
         
-        # Her uzmanla çalış
+        # Uzmanlarla eşzamanlı çalış
         project_dir = self.output_dir / self.current_project.name
-        all_responses = {}
+        write_stats = self.file_writer.stats()
         
         with Progress(
             SpinnerColumn(),
@@ -686,45 +2527,214 @@ class VibeCodingAISystem:
             TimeElapsedColumn(),
             console=self.console
         ) as progress:
-            
-            for expert_type in required_experts:
-                task = progress.add_task(f"🤖 {expert_type.title()} uzmanıyla çalışılıyor...", total=None)
-                
-                try:
-                    expert_response = await self._consult_expert(expert_type, self.current_project)
-                    all_responses[expert_type] = expert_response
-                    
-                    # Dosyaları oluştur
-                    expert_dir = project_dir / expert_type
-                    expert_dir.mkdir(exist_ok=True)
-                    
-                    for file_struct in expert_response.code_files:
-                        file_path = expert_dir / file_struct.path
-                        file_path.parent.mkdir(parents=True, exist_ok=True)
-                        
-                        with open(file_path, "w", encoding="utf-8") as f:
-                            f.write(file_struct.content)
-                    
-                    progress.update(task, description=f"✅ {expert_type.title()} uzmanı tamamlandı")
-                    
-                except Exception as e:
-                    progress.update(task, description=f"❌ {expert_type.title()} uzmanında hata: {str(e)}")
-                    self.console.print(f"[red]Hata ({expert_type}): {str(e)}[/red]")
+            all_responses, reused = await self._generate_project(self.current_project, progress, required_experts)
         
         # Sonuçları göster
         await self._display_project_results(all_responses)
         
-        # Proje özetini kaydet
-        summary_file = project_dir / "project_summary.json"
-        with open(summary_file, "w", encoding="utf-8") as f:
-            json.dump({
-                "project": self.current_project.model_dump(),
-                "experts": {k: v.model_dump() for k, v in all_responses.items()},
-                "generated_at": datetime.now().isoformat()
-            }, f, ensure_ascii=False, indent=2)
+        if reused is not None:
+            self.console.print(
+                f"[dim]♻️ {len(reused)}/{len(all_responses)} uzman değişmedi, yeniden çalıştırılmadı[/dim]"
+            )
         
         self.console.print(f"\n[green]🎉 Proje başarıyla oluşturuldu![/green]")
         self.console.print(f"📁 Proje dizini: {project_dir}")
+        self._display_write_summary(WriteSummary(**{
+            key: value - write_stats[key] for key, value in self.file_writer.stats().items()
+        }))
+        self._display_cache_stats()
+        self._display_call_stats()
+    
+    async def _generate_project(self, project: ProjectConfig, progress: Progress,
+                                required_experts: Optional[List[str]] = None,
+                                label: str = "", transient: bool = False) -> tuple:
+        """Projeyi soru sormadan üret: uzmanları çalıştır, özeti ve parmak izlerini kaydet.
+        
+        (uzman yanıtları, değişmediği için yeniden çalıştırılmayan uzmanlar) döndürür;
+        artımlı üretim kapalıysa veya önceki çıktı yoksa ikinci değer None'dır.
+        """
+        if required_experts is None:
+            required_experts = self._determine_required_experts(project)
+        project_dir = self.output_dir / project.name
+        
+        # Artımlı üretim: girdileri değişmeyen uzmanların önceki çıktıları kullanılır
+        previous = self._load_previous_outputs(project_dir) if self.incremental else None
+        fingerprints: Dict[str, str] = {}
+        
+        all_responses = await self._consult_experts(
+            required_experts, project, progress, output_dir=project_dir,
+            previous=previous, fingerprints=fingerprints, label=label, transient=transient
+        )
+        
+        # Proje özetini ve uzman parmak izlerini kaydet
+        summary = {
+            "project": project.model_dump(),
+            "experts": {k: v.model_dump() for k, v in all_responses.items()},
+            "generated_at": datetime.now().isoformat()
+        }
+        await self.file_writer.write([
+            (project_dir / "project_summary.json", json.dumps(summary, ensure_ascii=False, indent=2)),
+            self._fingerprint_file(project_dir, {
+                expert_type: fingerprints[expert_type] for expert_type in all_responses
+            })
+        ])
+        self._sync_project_registry(project_dir)
+        
+        reused = None
+        if previous:
+            reused = [
+                expert_type for expert_type in all_responses
+                if expert_type in previous and fingerprints[expert_type] is not None
+                and previous[expert_type][0] == fingerprints[expert_type]
+            ]
+        return all_responses, reused
+    
+    async def run_batch(self, specs_path: Path, results_path: Optional[Path] = None,
+                        resume: bool = True) -> Dict[str, int]:
+        """JSONL dosyasındaki her satırı bir ProjectConfig olarak okuyup projeleri soru sormadan üret.
+        
+        Projeler eşzamanlı üretilir (VIBE_BATCH_MAX_PROJECTS); tüm uzman çağrıları ortak uzman
+        semaforunu paylaştığından toplam eşzamanlılık VIBE_MAX_CONCURRENT_EXPERTS ile sınırlıdır.
+        Her projenin durumu biter bitmez results JSONL dosyasına eklenir. resume açıksa
+        spesifikasyonu değişmemiş ve daha önce "ok" ile biten projeler atlanır.
+        """
+        results_path = results_path or specs_path.with_name(f"{specs_path.stem}.results.jsonl")
+        specs = self._load_batch_specs(specs_path)
+        completed = self._load_batch_results(results_path) if resume else {}
+        
+        counts = {"ok": 0, "partial": 0, "error": 0, "invalid": 0, "skipped": 0}
+        pending = []
+        for spec in specs:
+            if spec["project"] is not None and completed.get(spec["name"]) == spec["spec_hash"]:
+                counts["skipped"] += 1
+            else:
+                pending.append(spec)
+        
+        self.console.print(
+            f"\n[bold blue]📦 Toplu Üretim[/bold blue] - {len(specs)} spesifikasyon, "
+            f"{len(pending)} üretilecek, {counts['skipped']} daha önce tamamlanmış"
+        )
+        self.console.print(f"[dim]Sonuçlar: {results_path} - uzman eşzamanlılığı {self.max_concurrent_experts}[/dim]\n")
+        
+        project_semaphore = asyncio.Semaphore(max(1, int(
+            os.getenv("VIBE_BATCH_MAX_PROJECTS", str(self.max_concurrent_experts * 2))
+        )))
+        results_path.parent.mkdir(parents=True, exist_ok=True)
+        start = time.perf_counter()
+        
+        with open(results_path, "a", encoding="utf-8") as results_file, Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TimeElapsedColumn(),
+            console=self.console
+        ) as progress:
+            overall = progress.add_task(f"📦 Toplu üretim: 0/{len(pending)}", total=len(pending))
+            
+            def record(spec: Dict[str, Any], **fields):
+                entry = {"line": spec["line"], "name": spec["name"], **fields,
+                         "spec_hash": spec["spec_hash"], "finished_at": datetime.now().isoformat()}
+                results_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                results_file.flush()
+                counts[fields["status"]] += 1
+                done = sum(counts.values()) - counts["skipped"]
+                progress.update(overall, completed=done, description=f"📦 Toplu üretim: {done}/{len(pending)}")
+            
+            async def run_one(spec: Dict[str, Any]):
+                if spec["project"] is None:
+                    record(spec, status="invalid", error=spec["error"])
+                    return
+                
+                project = spec["project"]
+                async with project_semaphore:
+                    project_start = time.perf_counter()
+                    try:
+                        project_dir = self.output_dir / project.name
+                        project_dir.mkdir(parents=True, exist_ok=True)
+                        await self.file_writer.write([(
+                            project_dir / "project_config.json",
+                            json.dumps(project.model_dump(), ensure_ascii=False, indent=2)
+                        )])
+                        
+                        required_experts = self._determine_required_experts(project)
+                        responses, reused = await self._generate_project(
+                            project, progress, required_experts, label=project.name, transient=True
+                        )
+                        failed = [expert_type for expert_type in required_experts if expert_type not in responses]
+                        record(
+                            spec,
+                            status="ok" if not failed else ("partial" if responses else "error"),
+                            experts=list(responses),
+                            failed=failed,
+                            reused=reused or [],
+                            files=sum(len(response.code_files) for response in responses.values()),
+                            duration_s=round(time.perf_counter() - project_start, 2)
+                        )
+                    except Exception as e:
+                        record(spec, status="error", error=str(e),
+                               duration_s=round(time.perf_counter() - project_start, 2))
+            
+            await asyncio.gather(*(run_one(spec) for spec in pending))
+        
+        elapsed = time.perf_counter() - start
+        generated = counts["ok"] + counts["partial"]
+        self.console.print(
+            f"\n[green]✅ {counts['ok']} tamamlandı[/green], [yellow]{counts['partial']} kısmi[/yellow], "
+            f"[red]{counts['error']} hatalı, {counts['invalid']} geçersiz[/red], {counts['skipped']} atlandı "
+            f"- {elapsed:.1f} sn ({generated / elapsed * 60 if elapsed else 0:.1f} proje/dk)"
+        )
+        self.console.print(f"📄 Sonuçlar: {results_path}")
+        self._display_cache_stats()
+        self._display_call_stats()
+        return counts
+    
+    def _load_batch_specs(self, specs_path: Path) -> List[Dict[str, Any]]:
+        """Spesifikasyon satırlarını doğrula; geçersiz satırlar hata mesajıyla döner"""
+        specs = []
+        seen = set()
+        with open(specs_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                
+                spec = {"line": line_number, "name": None, "project": None, "error": None, "spec_hash": None}
+                try:
+                    data = json.loads(line)
+                    spec["name"] = data.get("name") if isinstance(data, dict) else None
+                    project = ProjectConfig(**data)
+                    # Ad çıktı dizininin tek bir alt dizini olmalı: boş, ".", ".." veya yol içeren adlar reddedilir
+                    if (not project.name.strip() or project.name in (".", "..")
+                            or Path(project.name).name != project.name):
+                        raise ValueError(f"Geçersiz proje adı: {project.name!r}")
+                    if project.name in seen:
+                        raise ValueError(f"Aynı proje adı birden fazla satırda: {project.name}")
+                    seen.add(project.name)
+                    spec["project"] = project
+                    spec["spec_hash"] = hashlib.sha256(
+                        json.dumps(project.model_dump(), ensure_ascii=False, sort_keys=True).encode("utf-8")
+                    ).hexdigest()
+                except Exception as e:
+                    spec["error"] = str(e)
+                specs.append(spec)
+        return specs
+    
+    def _load_batch_results(self, results_path: Path) -> Dict[str, str]:
+        """Önceki çalıştırmalarda "ok" ile biten projeler: ad -> spesifikasyon hash'i"""
+        completed: Dict[str, str] = {}
+        if not results_path.exists():
+            return completed
+        
+        with open(results_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # yarıda kalmış son satır
+                if entry.get("status") == "ok":
+                    completed[entry["name"]] = entry.get("spec_hash")
+                else:
+                    completed.pop(entry.get("name"), None)
+        return completed
     
     async def smart_project_analysis(self):
         """Akıllı proje analizi - tek girdi ile otomatik çözüm"""
@@ -930,105 +2940,424 @@ class VibeCodingAISystem:
         smart_dir = project_dir / "smart_analysis"
         smart_dir.mkdir(exist_ok=True)
         
-        # Analiz dosyalarını kaydet (varsa)
-        if response.code_files:
-            for file_struct in response.code_files:
-                file_path = smart_dir / file_struct.path
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(file_struct.content)
-        else:
-            # Kod dosyası yoksa temel bir README oluştur
-            readme_file = smart_dir / "README.md"
-            with open(readme_file, "w", encoding="utf-8") as f:
-                f.write(f"# {project_name}\n\n")
-                f.write(f"## Proje Açıklaması\n{user_request}\n\n")
-                f.write("## Analiz Sonuçları\n")
-                f.write(f"{response.analysis}\n\n")
-                f.write("## Teknolojiler\n")
-                for dep in response.dependencies:
-                    f.write(f"- {dep}\n")
-                f.write("\n## Sonraki Adımlar\n")
-                for step in response.next_steps:
-                    f.write(f"- {step}\n")
+        # Analiz dosyalarını kaydet (varsa)
+        if response.code_files:
+            files = [(smart_dir / file_struct.path, file_struct.content) for file_struct in response.code_files]
+        else:
+            # Kod dosyası yoksa temel bir README oluştur
+            readme = [
+                f"# {project_name}\n\n",
+                f"## Proje Açıklaması\n{user_request}\n\n",
+                "## Analiz Sonuçları\n",
+                f"{response.analysis}\n\n",
+                "## Teknolojiler\n"
+            ]
+            readme.extend(f"- {dep}\n" for dep in response.dependencies)
+            readme.append("\n## Sonraki Adımlar\n")
+            readme.extend(f"- {step}\n" for step in response.next_steps)
+            files = [(smart_dir / "README.md", "".join(readme))]
+        
+        # Analiz raporunu kaydet
+        report = [
+            f"# Akıllı Proje Analizi - {project_name}\n\n",
+            f"## Kullanıcı İsteği\n{user_request}\n\n",
+            f"## Analiz\n{response.analysis}\n\n",
+            f"## Seçilen Teknolojiler\n"
+        ]
+        report.extend(f"- {dep}\n" for dep in response.dependencies)
+        report.append(f"\n## Uygulama Planı\n")
+        report.extend(f"- {step}\n" for step in response.next_steps)
+        files.append((smart_dir / "analysis_report.md", "".join(report)))
+        
+        # Konfigürasyonu kaydet
+        files.append((
+            project_dir / "project_config.json",
+            json.dumps(project_config.model_dump(), ensure_ascii=False, indent=2)
+        ))
+        
+        await self.file_writer.write(files)
+        self._sync_project_registry(project_dir)
+        
+        self.console.print(f"\n[green]✅ Proje '{project_name}' akıllı analiz ile oluşturuldu![/green]")
+        self.console.print(f"📁 Proje dizini: {project_dir}")
+        self.console.print(f"🧠 Analiz dosyaları: {smart_dir}")
+        
+        # Otomatik geliştirme seçeneği
+        if Confirm.ask("\n🚀 Hemen diğer uzmanlarla geliştirmeye başlamak ister misiniz?"):
+            await self.develop_project()
+    
+    def _determine_required_experts(self, project: ProjectConfig) -> List[str]:
+        """Proje için gerekli uzmanları belirle"""
+        experts = []
+        
+        # Proje tipine göre uzmanları belirle
+        if project.type in ["web", "fullstack"]:
+            experts.extend(["frontend", "backend"])
+        elif project.type == "mobile":
+            experts.append("mobile")
+        elif project.type == "api":
+            experts.append("backend")
+        elif project.type == "desktop":
+            experts.append("frontend")
+        
+        # Veritabanı gerekirse database uzmanı ekle
+        if project.database_needed:
+            experts.append("database")
+        
+        # Her projede UI/UX, DevOps ve Test uzmanları çalışsın
+        experts.extend(["uiux", "devops", "test"])
+        
+        # Tekrarları kaldır ve bağımlılık sırasına göre diz
+        return [expert for layer in self._plan_expert_layers(experts) for expert in layer]
+    
+    def _plan_expert_layers(self, expert_types: List[str]) -> List[List[str]]:
+        """Uzmanları bağımlılıklarına göre katmanlara ayır.
+        
+        Aynı katmandaki uzmanlar birbirinden bağımsızdır ve eşzamanlı çalışabilir.
+        Sadece listede bulunan uzmanlar arasındaki bağımlılıklar dikkate alınır.
+        """
+        remaining = list(dict.fromkeys(expert_types))
+        placed = set()
+        layers = []
+        
+        while remaining:
+            layer = [
+                expert for expert in remaining
+                if all(dep in placed or dep not in remaining for dep in EXPERT_DEPENDENCIES.get(expert, []))
+            ]
+            if not layer:
+                # Döngüsel bağımlılık: kalanları tek katmanda çalıştır
+                layer = remaining
+            layers.append(layer)
+            placed.update(layer)
+            remaining = [expert for expert in remaining if expert not in placed]
+        
+        return layers
+    
+    def _get_expert_semaphore(self) -> asyncio.Semaphore:
+        """Tüm uzman çağrıları için ortak eşzamanlılık sınırını döndür"""
+        if self._expert_semaphore is None:
+            self._expert_semaphore = asyncio.Semaphore(self.max_concurrent_experts)
+        return self._expert_semaphore
+    
+    async def _consult_experts(self, expert_types: List[str], project: ProjectConfig,
+                               progress: Progress, output_dir: Optional[Path] = None,
+                               previous: Optional[Dict[str, tuple]] = None,
+                               fingerprints: Optional[Dict[str, str]] = None,
+                               label: str = "", transient: bool = False) -> Dict[str, ExpertResponse]:
+        """Uzmanlara eşzamanlı danış, her uzman için ayrı ilerleme satırı göster.
+        
+        Bir uzmanın hatası diğerlerini durdurmaz; başarısız uzmanlar sonuçta yer almaz.
+        output_dir verilirse her uzmanın dosyaları tamamlanır tamamlanmaz yazılır.
+        previous (uzman -> (parmak izi, yanıt)) verilirse parmak izi değişmeyen uzmanlar
+        yeniden çalıştırılmaz, önceki yanıtları kullanılır. fingerprints verilirse
+        hesaplanan parmak izleri bu sözlüğe yazılır. label ilerleme satırlarının başına eklenir
+        (toplu üretimde proje adı); transient ise satırlar uzmanlar bitince kaldırılır.
+        """
+        semaphore = self._get_expert_semaphore()
+        ordered_experts = [expert for layer in self._plan_expert_layers(expert_types) for expert in layer]
+        titles = {expert_type: f"{label} / {expert_type.title()}" if label else expert_type.title()
+                  for expert_type in ordered_experts}
+        tasks = {
+            expert_type: progress.add_task(f"⏳ {titles[expert_type]} uzmanı sırada bekliyor...", total=None)
+            for expert_type in ordered_experts
+        }
+        running: Dict[str, asyncio.Future] = {}
+        
+        async def run_expert(expert_type: str) -> Optional[ExpertResponse]:
+            task = tasks[expert_type]
+            try:
+                # Önce bağlı olunan uzmanların bitmesini bekle
+                upstream_types = [dep for dep in EXPERT_DEPENDENCIES.get(expert_type, []) if dep in running]
+                upstream = {}
+                if upstream_types:
+                    progress.update(
+                        task,
+                        description=f"⏳ {titles[expert_type]} uzmanı bekliyor ({', '.join(upstream_types)})..."
+                    )
+                    upstream_results = await asyncio.gather(*(running[dep] for dep in upstream_types))
+                    upstream = {
+                        dep: result for dep, result in zip(upstream_types, upstream_results)
+                        if result is not None
+                    }
+                
+                fingerprint = None
+                if previous is not None or fingerprints is not None:
+                    fingerprint = self._expert_fingerprint(expert_type, project, upstream)
+                
+                if previous and expert_type in previous and previous[expert_type][0] == fingerprint:
+                    expert_response = previous[expert_type][1]
+                    reused = True
+                else:
+                    async with semaphore:
+                        progress.update(task, description=f"🤖 {titles[expert_type]} uzmanıyla çalışılıyor...")
+                        expert_response = await self._consult_expert(expert_type, project, upstream=upstream)
+                    reused = False
+                
+                if fingerprints is not None:
+                    # Eksik (bazı dosyaları üretilemeyen) yanıt bir sonraki çalıştırmada yeniden üretilir
+                    fingerprints[expert_type] = None if expert_response._failed_files else fingerprint
+                
+                # Dosyaları oluştur (olay döngüsünü bloklamadan)
+                if output_dir is not None:
+                    expert_dir = output_dir / expert_type
+                    expert_dir.mkdir(parents=True, exist_ok=True)
+                    await self.file_writer.write(
+                        ((expert_dir / file_struct.path, file_struct.content)
+                         for file_struct in expert_response.code_files),
+                        root=expert_dir,
+                        keep=[expert_dir / path for path in expert_response._failed_files]
+                    )
+                    await self._index_search_documents(
+                        output_dir, [expert_dir / file_struct.path for file_struct in expert_response.code_files]
+                    )
+                
+                if reused:
+                    progress.update(task, description=f"♻️ {titles[expert_type]} uzmanı değişmedi, önceki çıktı kullanıldı")
+                else:
+                    progress.update(task, description=f"✅ {titles[expert_type]} uzmanı tamamlandı")
+                return expert_response
+                
+            except Exception as e:
+                progress.update(task, description=f"❌ {titles[expert_type]} uzmanında hata: {str(e)}")
+                self.console.print(f"[red]Hata ({expert_type}): {str(e)}[/red]")
+                return None
+        
+        for expert_type in ordered_experts:
+            running[expert_type] = asyncio.ensure_future(run_expert(expert_type))
+        
+        results = await asyncio.gather(*(running[expert_type] for expert_type in ordered_experts))
+        
+        if transient:
+            for task in tasks.values():
+                progress.remove_task(task)
+        
+        return {
+            expert_type: response
+            for expert_type, response in zip(ordered_experts, results)
+            if response is not None
+        }
+    
+    async def _consult_expert(self, expert_type: str, project: ProjectConfig,
+                              upstream: Optional[Dict[str, ExpertResponse]] = None,
+                              prompt: Optional[str] = None) -> ExpertResponse:
+        """Uzmanla konsültasyon yap.
+        
+        prompt verilirse varsayılan uzman prompt'u yerine kullanılır.
+        """
+        stats = self._expert_stats(expert_type)
+        planned = self.plan_then_fill and expert_type in PLANNED_EXPERTS
+        
+        # Uzman için özel prompt oluştur
+        expert_prompt = prompt if prompt is not None else self._create_expert_prompt(expert_type, project, upstream)
+        
+        # Aynı uzman, model ve prompt için önbellekteki yanıtı kullan
+        cache_key = None
+        if self.expert_cache is not None:
+            cache_key = ExpertCache.make_key(
+                expert_type,
+                self.model_name,
+                self.experts.system_prompt(expert_type),
+                expert_prompt,
+                ExpertPlan.model_json_schema() if planned else ExpertResponse.model_json_schema()
+            )
+            if self.cache_mode != "refresh":
+                cached = self.expert_cache.get(cache_key)
+                if cached is not None:
+                    stats["cache_hits"] += 1
+                    return cached
+        
+        # Uzmanla konuş
+        if planned:
+            response = await self._plan_then_fill(expert_type, project, expert_prompt)
+        else:
+            result = await self.experts[expert_type].run(expert_prompt)
+            self._record_usage(expert_type, result)
+            response = result.data
+        
+        if cache_key is not None and not response._failed_files:
+            self.expert_cache.put(cache_key, response)
+        
+        return response
+    
+    async def _plan_then_fill(self, expert_type: str, project: ProjectConfig, expert_prompt: str) -> ExpertResponse:
+        """Önce dosya planını al, sonra her dosyanın içeriğini ayrı ve paralel çağrılarla üret.
+        
+        Tek yanıtta tüm dosyaları yazmak yerine plan küçük kalır ve her dosya kendi çıktı
+        sınırı içinde üretilir; böylece büyük uzmanlarda kesilmiş JSON önlenir.
+        """
+        result = await self.plan_experts[expert_type].run(expert_prompt)
+        self._record_usage(expert_type, result)
+        plan = result.data
+        
+        if self._file_semaphore is None:
+            self._file_semaphore = asyncio.Semaphore(self.max_concurrent_files)
+        
+        manifest = "\n".join(
+            f"- {planned.path} ({planned.file_type}): {planned.purpose}"
+            + (f"\n  Arayüzler: {'; '.join(planned.interfaces)}" if planned.interfaces else "")
+            for planned in plan.files
+        )
+        
+        async def fill(planned: PlannedFile) -> FileStructure:
+            fill_prompt = f"""
+        '{project.name}' projesinin {expert_type} bölümü için planlanan dosyayı yaz.
+        
+        PROJE BİLGİLERİ:
+{self._format_project_fields(project)}
+        
+        GENEL ANALİZ:
+        {plan.analysis}
+        
+        DOSYA PLANI:
+{manifest}
+        
+        YAZILACAK DOSYA: {planned.path} ({planned.file_type})
+        Amaç: {planned.purpose}
+        Arayüzler: {'; '.join(planned.interfaces) or '-'}
+        """
+            async with self._file_semaphore:
+                fill_result = await self.fill_experts[expert_type].run(fill_prompt)
+            self._record_usage(expert_type, fill_result)
+            
+            return FileStructure(
+                path=planned.path,
+                content=self._strip_code_fence(fill_result.data),
+                file_type=planned.file_type,
+                description=planned.purpose
+            )
         
-        # Analiz raporunu kaydet
-        analysis_report = smart_dir / "analysis_report.md"
-        with open(analysis_report, "w", encoding="utf-8") as f:
-            f.write(f"# Akıllı Proje Analizi - {project_name}\n\n")
-            f.write(f"## Kullanıcı İsteği\n{user_request}\n\n")
-            f.write(f"## Analiz\n{response.analysis}\n\n")
-            f.write(f"## Seçilen Teknolojiler\n")
-            for dep in response.dependencies:
-                f.write(f"- {dep}\n")
-            f.write(f"\n## Uygulama Planı\n")
-            for step in response.next_steps:
-                f.write(f"- {step}\n")
+        results = await asyncio.gather(*(fill(planned) for planned in plan.files), return_exceptions=True)
         
-        # Konfigürasyonu kaydet
-        config_file = project_dir / "project_config.json"
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(project_config.model_dump(), f, ensure_ascii=False, indent=2)
+        # Başarısız dosyalar üretilenleri geçersiz kılmaz; hepsi başarısızsa uzman başarısızdır
+        code_files = []
+        failed = []
+        for planned, result in zip(plan.files, results):
+            if isinstance(result, FileStructure):
+                code_files.append(result)
+            elif isinstance(result, Exception):
+                failed.append((planned.path, result))
+            else:
+                raise result
+        if failed and not code_files:
+            raise failed[0][1]
         
-        self.console.print(f"\n[green]✅ Proje '{project_name}' akıllı analiz ile oluşturuldu![/green]")
-        self.console.print(f"📁 Proje dizini: {project_dir}")
-        self.console.print(f"🧠 Analiz dosyaları: {smart_dir}")
+        next_steps = list(plan.next_steps)
+        for path, error in failed:
+            self.console.print(f"[yellow]⚠️ {expert_type}: {path} üretilemedi ({error})[/yellow]")
+            next_steps.append(f"⚠️ {path} üretilemedi, uzmanı yeniden çalıştırın: {error}")
         
-        # Otomatik geliştirme seçeneği
-        if Confirm.ask("\n🚀 Hemen diğer uzmanlarla geliştirmeye başlamak ister misiniz?"):
-            await self.develop_project()
+        response = ExpertResponse(
+            expert_type=plan.expert_type,
+            analysis=plan.analysis,
+            recommendations=plan.recommendations,
+            code_files=code_files,
+            dependencies=plan.dependencies,
+            next_steps=next_steps
+        )
+        response._failed_files = [path for path, _ in failed]
+        return response
     
-    def _determine_required_experts(self, project: ProjectConfig) -> List[str]:
-        """Proje için gerekli uzmanları belirle"""
-        experts = []
+    def _strip_code_fence(self, content: str) -> str:
+        """Modelin yine de eklediği markdown kod bloğunu kaldır"""
+        stripped = content.strip()
+        if stripped.startswith("```") and stripped.endswith("```"):
+            stripped = stripped.split("\n", 1)[1] if "\n" in stripped else ""
+            stripped = stripped[:-3].rstrip()
+            return stripped + "\n"
+        return content
+    
+    def _expert_stats(self, expert_type: str) -> Dict[str, int]:
+        """Uzmanın çağrı sayaçlarını döndür"""
+        return self.call_stats.setdefault(
+            expert_type, {"model_calls": 0, "cache_hits": 0, "request_tokens": 0, "response_tokens": 0}
+        )
+    
+    def _record_usage(self, expert_type: str, result):
+        """Model çağrısının token kullanımını sayaçlara ekle"""
+        stats = self._expert_stats(expert_type)
+        usage = result.usage()
+        stats["model_calls"] += 1
+        stats["request_tokens"] += usage.request_tokens or 0
+        stats["response_tokens"] += usage.response_tokens or 0
+    
+    async def _consult_expert_patch(self, expert_type: str, project: ProjectConfig,
+                                    request: str, project_dir: Path) -> ExpertPatchResponse:
+        """Uzmandan mevcut dosyalar üzerinde düzenleme iste.
         
-        # Proje tipine göre uzmanları belirle
-        if project.type in ["web", "fullstack"]:
-            experts.extend(["frontend", "backend"])
-        elif project.type == "mobile":
-            experts.append("mobile")
-        elif project.type == "api":
-            experts.append("backend")
-        elif project.type == "desktop":
-            experts.append("frontend")
+        PatchApplier arama bloklarını ve bağlam satırlarını birebir eşleştirdiği için uzmanın
+        dosyaları iskelet veya özete indirgenmeden tam içerikleriyle gönderilir. Toplamları
+        VIBE_PATCH_CONTEXT_TOKENS'ı aşarsa ValueError yükseltilir (tam üretim modu kullanılmalı).
+        """
+        entries = [entry for entry in self._project_file_entries(project_dir) if entry["expert"] == expert_type]
+        total_tokens = sum(entry["tokens"] for entry in entries)
+        if total_tokens > self.patch_context_tokens:
+            raise ValueError(
+                f"{expert_type} dosyaları düzenleme modu için çok büyük (~{total_tokens} token > "
+                f"VIBE_PATCH_CONTEXT_TOKENS={self.patch_context_tokens}). Düzenleme modunu reddedip "
+                f"tam üretimle çalışın veya sınırı artırın."
+            )
         
-        # Veritabanı gerekirse database uzmanı ekle
-        if project.database_needed:
-            experts.append("database")
+        parts = [f"MEVCUT {expert_type.upper()} DOSYALARI (tam içerik, ~{total_tokens} token):\n"]
+        for entry in entries:
+            block = self._context_block(entry, "tam", project_dir)
+            name = entry["path"].split("/", 1)[1]
+            parts.append(block if block is not None else f"\n📄 {name}: (okunamadı, düzenlenemez)\n")
+        existing_code = "".join(parts)
         
-        # Her projede UI/UX, DevOps ve Test uzmanları çalışsın
-        experts.extend(["uiux", "devops", "test"])
+        prompt = self._create_expert_prompt(expert_type, project) + f"""
+        {existing_code}
         
-        return list(set(experts))  # Tekrarları kaldır
-    
-    async def _consult_expert(self, expert_type: str, project: ProjectConfig) -> ExpertResponse:
-        """Uzmanla konsültasyon yap"""
-        expert = self.experts[expert_type]
+        DÜZENLEME İSTEĞİ: {request or 'Mevcut kodu gözden geçir ve gerekli iyileştirmeleri yap.'}
         
-        # Uzman için özel prompt oluştur
-        expert_prompt = self._create_expert_prompt(expert_type, project)
+        Dosya yolları {expert_type} klasörüne göredir. Yalnızca değişen kısımları düzenleme olarak döndür.
+        """
         
-        # Uzmanla konuş
-        result = await expert.run(expert_prompt)
+        result = await self.patch_experts[expert_type].run(prompt)
+        self._record_usage(expert_type, result)
         return result.data
     
-    def _create_expert_prompt(self, expert_type: str, project: ProjectConfig) -> str:
+    def _display_patch_results(self, response: ExpertPatchResponse, results: List[PatchResult]):
+        """Düzenleme yanıtını ve uygulama sonuçlarını göster"""
+        self.console.print(Panel(
+            Markdown(response.analysis),
+            title=f"🔍 {response.expert_type.title()} Uzmanı - Düzenlemeler",
+            border_style="blue"
+        ))
+        
+        status_styles = {
+            "applied": "[green]✅ uygulandı[/green]",
+            "created": "[green]🆕 oluşturuldu[/green]",
+            "deleted": "[yellow]🗑️ silindi[/yellow]",
+            "unchanged": "[dim]değişmedi[/dim]",
+            "conflict": "[red]❌ çakışma[/red]",
+        }
+        table = Table(title="Düzenlemeler", border_style="blue")
+        table.add_column("Dosya", style="cyan")
+        table.add_column("Durum")
+        table.add_column("+/-", justify="right")
+        table.add_column("Not")
+        
+        for result in results:
+            table.add_row(
+                result.path,
+                status_styles.get(result.status, result.status),
+                f"+{result.added} -{result.removed}",
+                result.message
+            )
+        
+        self.console.print(table)
+    
+    def _create_expert_prompt(self, expert_type: str, project: ProjectConfig,
+                              upstream: Optional[Dict[str, ExpertResponse]] = None) -> str:
         """Uzman için özel prompt oluştur"""
+        project_info = self._format_project_fields(project)
+        
         base_prompt = f"""
         VibeCoding metodolojisini kullanarak '{project.name}' projesi için {expert_type} geliştirmesi yap.
         
         PROJE BİLGİLERİ:
-        - İsim: {project.name}
-        - Açıklama: {project.description}
-        - Tip: {project.type}
-        - Teknoloji Yığını: {', '.join(project.tech_stack)}
-        - Özellikler: {', '.join(project.features)}
-        - Hedef Kitle: {project.target_audience}
-        - Karmaşıklık: {project.complexity}
-        - Veritabanı: {'Evet' if project.database_needed else 'Hayır'}
-        - Kimlik Doğrulama: {'Evet' if project.auth_needed else 'Hayır'}
-        - API: {'Evet' if project.api_needed else 'Hayır'}
+{project_info}
         
         GÖREVLER:
         1. Proje analizi yap
@@ -1047,8 +3376,117 @@ class VibeCodingAISystem:
         Detaylı ve uygulanabilir çözümler sun.
         """
         
+        if upstream:
+            base_prompt += self._format_upstream_context(upstream)
+        
         return base_prompt
     
+    def _format_project_fields(self, project: ProjectConfig) -> str:
+        """Proje alanlarını prompt satırlarına çevir"""
+        lines = []
+        for field in PROJECT_FIELD_LABELS:
+            value = getattr(project, field)
+            if isinstance(value, bool):
+                value = "Evet" if value else "Hayır"
+            elif isinstance(value, list):
+                value = ", ".join(value)
+            lines.append(f"        - {PROJECT_FIELD_LABELS[field]}: {value}")
+        return "\n".join(lines)
+    
+    def _expert_fingerprint(self, expert_type: str, project: ProjectConfig,
+                            upstream: Dict[str, ExpertResponse]) -> str:
+        """Uzmanın gördüğü girdilerin parmak izi: kullanıcı prompt'unun kendisi (proje alanları
+        ve üst uzman özetleri dahil), prompt sürümü, model, sistem prompt'u ve üretim modu
+        (tek yanıt veya plan-doldur).
+        
+        Parmak izi prompt metninden hesaplandığı için atlanan uzmanlar, yeniden çalışsalardı
+        görecekleri girdinin aynısıyla üretilmiş olur.
+        """
+        payload = {
+            "prompt_version": PROMPT_VERSION,
+            "model": str(self.model_name),
+            "system_prompt": self.experts.system_prompt(expert_type),
+            "plan_then_fill": self.plan_then_fill and expert_type in PLANNED_EXPERTS,
+            "prompt": self._create_expert_prompt(expert_type, project, upstream)
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+    
+    def _load_previous_outputs(self, project_dir: Path) -> Dict[str, tuple]:
+        """Önceki geliştirmenin parmak izlerini ve çıktılarını yükle: uzman -> (parmak izi, yanıt)"""
+        fingerprint_file = project_dir / "expert_fingerprints.json"
+        if not fingerprint_file.exists():
+            return {}
+        
+        try:
+            with open(fingerprint_file, "r", encoding="utf-8") as f:
+                fingerprints = json.load(f).get("experts", {})
+        except (OSError, ValueError):
+            return {}
+        
+        responses = self._load_project_summary(project_dir, include_test=True)
+        return {
+            expert_type: (fingerprint, responses[expert_type])
+            for expert_type, fingerprint in fingerprints.items()
+            if expert_type in responses
+        }
+    
+    def _fingerprint_file(self, project_dir: Path, fingerprints: Dict[str, str]) -> tuple:
+        """project_summary.json'un yanına yazılacak parmak izi dosyası: (yol, içerik)"""
+        return project_dir / "expert_fingerprints.json", json.dumps({
+            "prompt_version": PROMPT_VERSION,
+            "experts": fingerprints,
+            "generated_at": datetime.now().isoformat()
+        }, ensure_ascii=False, indent=2)
+    
+    def _format_upstream_context(self, upstream: Dict[str, ExpertResponse]) -> str:
+        """Önceki uzmanların çıktılarını sonraki uzman için özetle"""
+        lines = ["", "ÖNCEKİ UZMANLARIN ÇIKTILARI (bunlarla uyumlu çalış):"]
+        
+        for expert_type, response in upstream.items():
+            analysis = response.analysis
+            if len(analysis) > 800:
+                analysis = analysis[:800] + "..."
+            
+            lines.append(f"\n[{expert_type.upper()} UZMANI]")
+            lines.append(f"Analiz: {analysis}")
+            if response.code_files:
+                lines.append("Dosyalar:")
+                lines.extend(f"- {file.path}: {file.description}" for file in response.code_files)
+            if response.dependencies:
+                lines.append(f"Bağımlılıklar: {', '.join(response.dependencies)}")
+        
+        return "\n".join(lines) + "\n"
+    
+    def _display_cache_stats(self):
+        """Uzman önbelleği istatistiklerini göster"""
+        if self.expert_cache is None:
+            return
+        
+        stats = self.expert_cache.stats()
+        self.console.print(
+            f"[dim]💾 Önbellek: {stats['hits']} isabet, {stats['misses']} ıskalama, "
+            f"{stats['evictions']} silme ({stats['entries']} kayıt, {stats['size_bytes'] / 1024:.0f} KB)[/dim]"
+        )
+    
+    def _display_write_summary(self, summary: WriteSummary):
+        """Yazılan, değişmeyen ve silinen dosya sayılarını göster"""
+        self.console.print(
+            f"[dim]📝 Dosyalar: {summary.written} yazıldı, {summary.unchanged} değişmedi, "
+            f"{summary.deleted} silindi[/dim]"
+        )
+    
+    def _display_call_stats(self):
+        """Uzman başına model çağrısı ve token kullanımını göster"""
+        if not self.call_stats:
+            return
+        
+        parts = [
+            f"{expert_type}: {stats['model_calls']} çağrı, {stats['cache_hits']} önbellek, "
+            f"{stats['request_tokens']}+{stats['response_tokens']} token"
+            for expert_type, stats in self.call_stats.items()
+        ]
+        self.console.print(f"[dim]📊 Model kullanımı - {'; '.join(parts)}[/dim]")
+    
     async def _display_project_results(self, responses: Dict[str, ExpertResponse]):
         """Proje sonuçlarını göster"""
         self.console.print("\n[bold blue]📋 Proje Geliştirme Sonuçları[/bold blue]\n")
@@ -1081,49 +3519,146 @@ class VibeCodingAISystem:
             
             self.console.print(panel)
     
-    def list_projects(self):
-        """Projeleri listele"""
+    def _get_project_registry(self) -> ProjectRegistry:
+        """Proje kayıt defterini döndür; ilk kullanımda diskle eşitlenir"""
+        if self._project_registry is None:
+            db_path = Path(os.getenv("VIBE_REGISTRY_DB", str(self.output_dir / ".cache" / "projects.sqlite3")))
+            self._project_registry = ProjectRegistry(db_path, self.output_dir)
+            self._project_registry.reconcile()
+        return self._project_registry
+    
+    def _sync_project_registry(self, project_dir: Path):
+        """Projenin kaydını güncelle; kayıt defteri hatası üretimi durdurmaz"""
+        try:
+            self._get_project_registry().sync_project(project_dir)
+        except Exception as e:
+            self.console.print(f"[dim]⚠️ Proje kayıt defteri güncellenemedi: {str(e)}[/dim]")
+    
+    async def _index_search_documents(self, project_dir: Path, paths: List[Path]):
+        """Uzmanın yazdığı dosyaları arama indeksine ekle (olay döngüsünü bloklamadan)"""
+        try:
+            registry = self._get_project_registry()
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, registry.index_documents, project_dir, paths)
+        except Exception as e:
+            self.console.print(f"[dim]⚠️ Arama indeksi güncellenemedi: {str(e)}[/dim]")
+    
+    def search_projects(self):
+        """Tüm üretilen projelerde tam metin arama"""
+        self.console.print("\n[bold blue]🔎 Projelerde Ara[/bold blue]")
+        self.console.print("[dim]Dosya içerikleri, analiz raporları ve proje özetlerinde arar (örn. jwt refresh)[/dim]\n")
+        
+        registry = self._get_project_registry()
+        registry.reconcile()
+        
+        while True:
+            query = Prompt.ask("🔍 Arama (boş: geri)", default="").strip()
+            if not query:
+                break
+            
+            start = time.perf_counter()
+            results = registry.search(query, limit=self.projects_page_size)
+            display_search_results(self.console, results, query, time.perf_counter() - start)
+    
+    def list_projects(self, page: int = 1, text: str = "", project_type: str = "", tech: str = "",
+                      sort: str = "updated", descending: bool = True) -> int:
+        """Projeleri listele (kayıt defterinden, sayfalı); toplam proje sayısını döndür"""
         self.console.print("\n" + "="*80, style="cyan")
         self.console.print("📂 Mevcut Projeler", style="bold cyan", justify="center")
         self.console.print("="*80, style="cyan")
         
-        projects = []
-        for project_dir in self.output_dir.iterdir():
-            if project_dir.is_dir():
-                config_file = project_dir / "project_config.json"
-                if config_file.exists():
-                    try:
-                        with open(config_file, "r", encoding="utf-8") as f:
-                            config = json.load(f)
-                        projects.append((project_dir.name, config))
-                    except:
-                        continue
+        registry = self._get_project_registry()
+        if page == 1:
+            registry.reconcile()
+        projects, total = registry.query(
+            text=text, project_type=project_type, tech=tech, sort=sort,
+            descending=descending, page=page, page_size=self.projects_page_size
+        )
         
         if not projects:
-            self.console.print("\n[yellow]📭 Henüz proje oluşturulmamış.[/yellow]")
+            if total or text or project_type or tech:
+                self.console.print("\n[yellow]📭 Bu kriterlere uyan proje yok.[/yellow]")
+            else:
+                self.console.print("\n[yellow]📭 Henüz proje oluşturulmamış.[/yellow]")
             self.console.print("-"*80, style="cyan")
-            return
+            return total
         
         self.console.print()
-        for i, (project_name, config) in enumerate(projects, 1):
-            self.console.print(f"[bold cyan]{i}. {project_name}[/bold cyan]")
-            self.console.print(f"   📁 Tip: [green]{config.get('type', 'N/A')}[/green]")
+        start = (page - 1) * self.projects_page_size
+        for i, project in enumerate(projects, start + 1):
+            self.console.print(f"[bold cyan]{i}. {project['name']}[/bold cyan]")
+            
+            if project["status"] == "corrupt":
+                self.console.print(f"   [red]⚠️ project_config.json okunamadı: {project['error']}[/red]")
+                self.console.print()
+                continue
             
-            description = config.get('description', 'N/A')
+            self.console.print(f"   📁 Tip: [green]{project['type'] or 'N/A'}[/green]")
+            
+            description = project['description'] or 'N/A'
             if len(description) > 60:
                 description = description[:60] + "..."
             self.console.print(f"   📝 Açıklama: {description}")
             
-            tech_stack = config.get('tech_stack', [])
+            tech_stack = project['tech_stack']
             if tech_stack:
                 tech_display = ", ".join(tech_stack[:4])
                 if len(tech_stack) > 4:
                     tech_display += f" (+{len(tech_stack)-4} daha)"
                 self.console.print(f"   🛠️ Teknolojiler: [yellow]{tech_display}[/yellow]")
             
+            if project['experts']:
+                experts = ", ".join(f"{expert} ({count})" for expert, count in project['experts'].items())
+                self.console.print(f"   👨‍💻 Uzmanlar: {experts} - {project['file_count']} dosya")
+            
+            updated = datetime.fromtimestamp(project['updated_at']).strftime("%Y-%m-%d %H:%M")
+            self.console.print(f"   🕒 Güncellendi: [dim]{updated}[/dim]")
+            
             self.console.print()
         
+        pages = (total + self.projects_page_size - 1) // self.projects_page_size
+        self.console.print(f"[dim]Sayfa {page}/{pages} - toplam {total} proje[/dim]")
         self.console.print("-"*80, style="cyan")
+        return total
+    
+    def browse_projects(self):
+        """Proje kayıt defterinde sayfalı gezinme, filtreleme ve sıralama"""
+        page, text, project_type, tech = 1, "", "", ""
+        sort, descending = "updated", True
+        
+        while True:
+            total = self.list_projects(page, text, project_type, tech, sort, descending)
+            pages = max(1, (total + self.projects_page_size - 1) // self.projects_page_size)
+            
+            self.console.print(
+                "[cyan]n[/cyan] sonraki  [cyan]p[/cyan] önceki  [cyan]a[/cyan] ara  [cyan]t[/cyan] tip  "
+                "[cyan]k[/cyan] teknoloji  [cyan]s[/cyan] sırala  [cyan]c[/cyan] filtreleri temizle  "
+                "[cyan]r[/cyan] diskten yeniden oluştur  [cyan]q[/cyan] geri"
+            )
+            action = Prompt.ask("Komut", default="q").lower().strip()
+            
+            if action == "n":
+                page = min(page + 1, pages)
+            elif action == "p":
+                page = max(page - 1, 1)
+            elif action == "a":
+                text, page = Prompt.ask("🔍 Ad veya açıklamada ara", default=""), 1
+            elif action == "t":
+                project_type, page = Prompt.ask("📁 Proje tipi (boş: tümü)", default=""), 1
+            elif action == "k":
+                tech, page = Prompt.ask("🛠️ Teknoloji (boş: tümü)", default=""), 1
+            elif action == "s":
+                sort = Prompt.ask("Sıralama", choices=list(ProjectRegistry.SORT_COLUMNS), default=sort)
+                descending = Confirm.ask("Azalan sırada mı?", default=sort in ("updated", "created", "files"))
+                page = 1
+            elif action == "c":
+                page, text, project_type, tech = 1, "", "", ""
+            elif action == "r":
+                count = self._get_project_registry().rebuild()
+                self.console.print(f"[green]✅ Kayıt defteri yeniden oluşturuldu: {count} proje[/green]")
+                page = 1
+            elif action == "q":
+                break
     
     def load_project(self):
         """Mevcut projeyi yükle"""
@@ -1162,6 +3697,13 @@ class VibeCodingAISystem:
         
         additional_request = Prompt.ask("Özel istek (boş bırakabilirsiniz)", default="")
         
+        # Uzmanın dosyaları zaten varsa yalnızca değişiklikleri iste
+        expert_dir = self.output_dir / self.current_project.name / expert_type
+        if expert_dir.exists() and any(path.is_file() for path in expert_dir.rglob("*")):
+            if Confirm.ask("✏️ Mevcut dosyalar bulundu. Düzenleme (patch) modunda çalışılsın mı?", default=True):
+                await self._consult_single_expert_patch(expert_type, additional_request)
+                return
+        
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -1177,7 +3719,7 @@ class VibeCodingAISystem:
                 if additional_request:
                     expert_prompt += f"\n\nÖZEL İSTEK: {additional_request}"
                 
-                response = await self._consult_expert(expert_type, self.current_project)
+                response = await self._consult_expert(expert_type, self.current_project, prompt=expert_prompt)
                 
                 progress.update(task, description=f"✅ {expert_type.title()} uzmanı yanıtladı")
                 
@@ -1190,19 +3732,61 @@ class VibeCodingAISystem:
                     expert_dir = project_dir / expert_type
                     expert_dir.mkdir(parents=True, exist_ok=True)
                     
-                    for file_struct in response.code_files:
-                        file_path = expert_dir / file_struct.path
-                        file_path.parent.mkdir(parents=True, exist_ok=True)
-                        
-                        with open(file_path, "w", encoding="utf-8") as f:
-                            f.write(file_struct.content)
+                    summary = await self.file_writer.write(
+                        ((expert_dir / file_struct.path, file_struct.content)
+                         for file_struct in response.code_files),
+                        root=expert_dir,
+                        # Özel istek yanıtı genelde yalnızca değişen dosyaları içerir; diğerleri silinmez
+                        prune=False
+                    )
+                    
+                    self._sync_project_registry(project_dir)
                     
                     self.console.print(f"[green]✅ Dosyalar {expert_dir} dizinine kaydedildi![/green]")
+                    self._display_write_summary(summary)
                 
             except Exception as e:
                 progress.update(task, description=f"❌ Hata oluştu: {str(e)}")
                 self.console.print(f"[red]❌ Hata: {str(e)}[/red]")
     
+    async def _consult_single_expert_patch(self, expert_type: str, request: str):
+        """Uzmanla mevcut dosyalar üzerinde düzenleme modunda çalış"""
+        project_dir = self.output_dir / self.current_project.name
+        applier = PatchApplier(project_dir / expert_type, self.file_writer)
+        
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TimeElapsedColumn(),
+            console=self.console
+        ) as progress:
+            task = progress.add_task(f"✏️ {expert_type.title()} uzmanı düzenlemeleri hazırlıyor...", total=None)
+            
+            try:
+                response = await self._consult_expert_patch(expert_type, self.current_project, request, project_dir)
+                progress.update(task, description=f"✅ {expert_type.title()} uzmanı {len(response.edits)} düzenleme önerdi")
+            except Exception as e:
+                progress.update(task, description=f"❌ Hata oluştu: {str(e)}")
+                self.console.print(f"[red]❌ Hata: {str(e)}[/red]")
+                return
+        
+        # Önce kuru çalıştırma: çakışmalar diske dokunmadan gösterilir
+        preview = applier.apply(response.edits, dry_run=True)
+        self._display_patch_results(response, preview)
+        
+        conflicts = [result for result in preview if result.status == "conflict"]
+        if conflicts:
+            self.console.print(f"[yellow]⚠️ {len(conflicts)} dosyada çakışma var; bu dosyalar değiştirilmeyecek.[/yellow]")
+        
+        if len(conflicts) < len(preview) and Confirm.ask("\n💾 Düzenlemeler uygulansın mı?"):
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(None, applier.apply, response.edits)
+            applied = [result for result in results if result.status not in ("conflict", "unchanged")]
+            self._sync_project_registry(applier.base_dir.parent)
+            self.console.print(f"[green]✅ {len(applied)} dosya güncellendi ({applier.base_dir})[/green]")
+        
+        self._display_call_stats()
+    
     async def _consult_test_expert(self):
         """Test uzmanı ile özel konsültasyon"""
         self.console.print("[bold yellow]🧪 Test Uzmanı - Kod Analizi ve Test Stratejisi[/bold yellow]\n")
@@ -1213,22 +3797,88 @@ class VibeCodingAISystem:
             self.console.print("[red]❌ Proje dizini bulunamadı! Önce projeyi geliştirin.[/red]")
             return
         
-        # Mevcut kodları topla
-        existing_code = self._collect_existing_code(project_dir)
+        # Geliştirme sırasında kaydedilen uzman çıktıları yeniden üretilmeden bağlam olarak kullanılır
+        upstream = self._load_project_summary(project_dir)
+        
+        # Mevcut kodları topla; tek bağlama sığmayan projeler bölümlere ayrılır
+        entries = self._project_file_entries(project_dir)
+        shards = self._plan_context_shards(entries)
+        
+        if len(shards) == 1:
+            existing_code, context_items = self._collect_existing_code(project_dir, entries=entries)
+            self._display_context_report(context_items)
+            test_prompt = self._create_test_prompt(existing_code, upstream=upstream)
         
-        # Test uzmanına özel prompt oluştur
-        test_prompt = f"""
-        VibeCoding Test Uzmanı olarak '{self.current_project.name}' projesinin kapsamlı analizini yap.
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TimeElapsedColumn(),
+            console=self.console
+        ) as progress:
+            
+            task = progress.add_task("🧪 Test uzmanı kod analizi yapıyor...", total=None)
+            
+            try:
+                if len(shards) > 1:
+                    progress.update(
+                        task,
+                        description=f"🧪 Proje {len(shards)} bölüme ayrıldı, bölümler paralel analiz ediliyor..."
+                    )
+                    response = await self._analyze_test_shards(project_dir, shards, progress, upstream)
+                else:
+                    response = await self._consult_expert("test", self.current_project, prompt=test_prompt)
+                
+                progress.update(task, description="✅ Test analizi tamamlandı")
+                
+                # Sonucu göster
+                await self._display_test_results(response)
+                
+                # Dosyaları kaydet
+                if Confirm.ask("\n💾 Test dosyalarını ve analiz raporunu kaydetmek ister misiniz?"):
+                    project_dir = self.output_dir / self.current_project.name
+                    test_dir = project_dir / "test"
+                    test_dir.mkdir(parents=True, exist_ok=True)
+                    
+                    # Test dosyaları ve analiz raporu tek partide kaydedilir
+                    files = [(test_dir / file_struct.path, file_struct.content) for file_struct in response.code_files]
+                    
+                    report = [
+                        f"# Test Analizi Raporu - {self.current_project.name}\n\n",
+                        f"## Analiz\n{response.analysis}\n\n",
+                        f"## Öneriler\n"
+                    ]
+                    report.extend(f"- {rec}\n" for rec in response.recommendations)
+                    report.append(f"\n## Sonraki Adımlar\n")
+                    report.extend(f"- {step}\n" for step in response.next_steps)
+                    files.append((test_dir / "test_analysis_report.md", "".join(report)))
+                    
+                    summary = await self.file_writer.write(files)
+                    self._sync_project_registry(project_dir)
+                    
+                    self.console.print(f"[green]✅ Test dosyaları ve analiz raporu {test_dir} dizinine kaydedildi![/green]")
+                    self._display_write_summary(summary)
+                
+                self._display_call_stats()
+                
+            except Exception as e:
+                progress.update(task, description=f"❌ Hata oluştu: {str(e)}")
+                self.console.print(f"[red]❌ Hata: {str(e)}[/red]")
+    
+    def _create_test_prompt(self, existing_code: str, scope: str = "",
+                            upstream: Optional[Dict[str, ExpertResponse]] = None) -> str:
+        """Test uzmanı için analiz prompt'u oluştur"""
+        project = self.current_project
+        upstream_context = self._format_upstream_context(upstream) if upstream else ""
+        return f"""
+        VibeCoding Test Uzmanı olarak '{project.name}' projesinin kapsamlı analizini yap.
         
         PROJE BİLGİLERİ:
-        - İsim: {self.current_project.name}
-        - Açıklama: {self.current_project.description}
-        - Tip: {self.current_project.type}
-        - Teknoloji Yığını: {', '.join(self.current_project.tech_stack)}
-        - Karmaşıklık: {self.current_project.complexity}
+{self._format_project_fields(project)}
         
         MEVCUT KOD YAPISI:
         {existing_code}
+        {upstream_context}
+        {scope}
         
         GÖREVLERİN:
         
@@ -1268,83 +3918,307 @@ class VibeCodingAISystem:
         VibeCoding prensiplerini uygula ve tüm eksiklikleri detaylandır.
         Test-driven development yaklaşımını benimse.
         """
+    
+    def _plan_context_shards(self, entries: List[Dict[str, Any]],
+                             token_budget: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """Dosyaları her biri tek bağlama sığan bölümlere ayır.
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            TimeElapsedColumn(),
-            console=self.console
-        ) as progress:
+        Proje bütçeye sığıyorsa tek bölüm döner. Bölüm sayısı test_max_shards ile
+        sınırlıdır; sınır aşılırsa bölümler büyütülür ve paketleyici iskelete düşer.
+        """
+        token_budget = token_budget or self.test_context_tokens
+        total = sum(entry["tokens"] for entry in entries)
+        if not self.test_sharding or total <= token_budget:
+            return [entries]
+        
+        # Başlık ve kod blokları için pay bırak
+        shard_budget = max(int(token_budget * 0.8), total // self.test_max_shards + 1)
+        shards = []
+        current = []
+        size = 0
+        
+        for entry in entries:
+            cost = min(entry["tokens"], shard_budget)
+            if current and size + cost > shard_budget:
+                shards.append(current)
+                current = []
+                size = 0
+            current.append(entry)
+            size += cost
+        
+        if current:
+            shards.append(current)
+        
+        return shards
+    
+    async def _analyze_test_shards(self, project_dir: Path, shards: List[List[Dict[str, Any]]],
+                                   progress: Progress,
+                                   upstream: Optional[Dict[str, ExpertResponse]] = None) -> ExpertResponse:
+        """Bölümleri paralel analiz et (map) ve kısmi yanıtları birleştir (reduce)"""
+        semaphore = self._get_expert_semaphore()
+        context_items = []
+        
+        async def analyze_shard(number: int, shard: List[Dict[str, Any]]) -> Optional[ExpertResponse]:
+            task = progress.add_task(f"⏳ Bölüm {number}/{len(shards)} sırada bekliyor...", total=None)
             
-            task = progress.add_task("🧪 Test uzmanı kod analizi yapıyor...", total=None)
+            existing_code, items = self._collect_existing_code(project_dir, entries=shard)
+            context_items.extend(items)
+            scope = (
+                f"KAPSAM: Bu, projenin {len(shards)} bölümünden {number}. bölümüdür; diğer bölümler ayrıca "
+                f"analiz ediliyor. Yalnızca bu bölümdeki dosyaları analiz et ve bunlar için test yaz."
+            )
             
             try:
-                response = await self._consult_expert("test", self.current_project)
-                
-                # Test uzmanına özel prompt ekle
-                test_expert = self.experts["test"]
-                result = await test_expert.run(test_prompt)
-                response = result.data
-                
-                progress.update(task, description="✅ Test analizi tamamlandı")
-                
-                # Sonucu göster
-                await self._display_test_results(response)
-                
-                # Dosyaları kaydet
-                if Confirm.ask("\n💾 Test dosyalarını ve analiz raporunu kaydetmek ister misiniz?"):
-                    project_dir = self.output_dir / self.current_project.name
-                    test_dir = project_dir / "test"
-                    test_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    # Test dosyalarını kaydet
-                    for file_struct in response.code_files:
-                        file_path = test_dir / file_struct.path
-                        file_path.parent.mkdir(parents=True, exist_ok=True)
-                        
-                        with open(file_path, "w", encoding="utf-8") as f:
-                            f.write(file_struct.content)
-                    
-                    # Analiz raporunu kaydet
-                    report_file = test_dir / "test_analysis_report.md"
-                    with open(report_file, "w", encoding="utf-8") as f:
-                        f.write(f"# Test Analizi Raporu - {self.current_project.name}\n\n")
-                        f.write(f"## Analiz\n{response.analysis}\n\n")
-                        f.write(f"## Öneriler\n")
-                        for rec in response.recommendations:
-                            f.write(f"- {rec}\n")
-                        f.write(f"\n## Sonraki Adımlar\n")
-                        for step in response.next_steps:
-                            f.write(f"- {step}\n")
-                    
-                    self.console.print(f"[green]✅ Test dosyaları ve analiz raporu {test_dir} dizinine kaydedildi![/green]")
-                
+                async with semaphore:
+                    progress.update(
+                        task,
+                        description=f"🧪 Bölüm {number}/{len(shards)} analiz ediliyor ({len(shard)} dosya)..."
+                    )
+                    response = await self._consult_expert(
+                        "test", self.current_project,
+                        prompt=self._create_test_prompt(existing_code, scope, upstream)
+                    )
             except Exception as e:
-                progress.update(task, description=f"❌ Hata oluştu: {str(e)}")
-                self.console.print(f"[red]❌ Hata: {str(e)}[/red]")
+                progress.update(task, description=f"❌ Bölüm {number}/{len(shards)} hata: {str(e)}")
+                self.console.print(f"[red]Hata (bölüm {number}): {str(e)}[/red]")
+                return None
+            
+            progress.update(task, description=f"✅ Bölüm {number}/{len(shards)} tamamlandı")
+            return response
+        
+        results = await asyncio.gather(*(
+            analyze_shard(number, shard) for number, shard in enumerate(shards, 1)
+        ))
+        self._display_context_report(context_items)
+        
+        partials = [response for response in results if response is not None]
+        if not partials:
+            raise RuntimeError("Hiçbir bölüm analiz edilemedi")
+        
+        return self._merge_expert_responses("test", partials)
     
-    def _collect_existing_code(self, project_dir: Path) -> str:
-        """Mevcut kodları topla"""
-        code_summary = "MEVCUT PROJE DOSYALARI:\n\n"
+    def _merge_expert_responses(self, expert_type: str, responses: List[ExpertResponse]) -> ExpertResponse:
+        """Kısmi uzman yanıtlarını tek yanıtta birleştir.
         
-        for expert_dir in project_dir.iterdir():
-            if expert_dir.is_dir() and expert_dir.name != "test":
-                code_summary += f"📁 {expert_dir.name.upper()} KLASÖRÜ:\n"
-                
-                for file_path in expert_dir.rglob("*"):
-                    if file_path.is_file() and file_path.suffix in ['.py', '.js', '.ts', '.jsx', '.tsx', '.html', '.css', '.sql', '.json', '.yml', '.yaml', '.md']:
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                if len(content) > 1000:  # Uzun dosyaları kısalt
-                                    content = content[:1000] + "\n... (dosya kesildi)"
-                                code_summary += f"\n📄 {file_path.name}:\n```\n{content}\n```\n"
-                        except:
-                            code_summary += f"\n📄 {file_path.name}: (okunamadı)\n"
-                
-                code_summary += "\n"
+        Listeler sırası korunarak tekilleştirilir. Aynı yolda farklı içerikli dosyalar
+        çakışmasın diye sonrakiler bölüm numarasıyla yeniden adlandırılır.
+        """
+        def unique(values: List[str]) -> List[str]:
+            seen = set()
+            merged = []
+            for value in values:
+                key = " ".join(value.lower().split())
+                if key and key not in seen:
+                    seen.add(key)
+                    merged.append(value)
+            return merged
+        
+        # Yeni ad, herhangi bir bölümün gerçekten ürettiği bir yolu da ezmemeli
+        generated = {file_struct.path for response in responses for file_struct in response.code_files}
+        code_files: Dict[str, FileStructure] = {}
+        for number, response in enumerate(responses, 1):
+            for file_struct in response.code_files:
+                existing = code_files.get(file_struct.path)
+                if existing is not None and existing.content == file_struct.content:
+                    continue
+                if existing is not None:
+                    path = Path(file_struct.path)
+                    suffix = str(number)
+                    attempt = 1
+                    while True:
+                        candidate = str(path.with_name(f"{path.stem}_{suffix}{path.suffix}"))
+                        if candidate not in code_files and candidate not in generated:
+                            break
+                        attempt += 1
+                        suffix = f"{number}_{attempt}"
+                    file_struct = file_struct.model_copy(update={"path": candidate})
+                code_files[file_struct.path] = file_struct
+        
+        if len(responses) == 1:
+            analysis = responses[0].analysis
+        else:
+            analysis = "\n\n".join(
+                f"### Bölüm {number}\n{response.analysis}" for number, response in enumerate(responses, 1)
+            )
+        
+        return ExpertResponse(
+            expert_type=expert_type,
+            analysis=analysis,
+            recommendations=unique([rec for response in responses for rec in response.recommendations]),
+            code_files=list(code_files.values()),
+            dependencies=unique([dep for response in responses for dep in response.dependencies]),
+            next_steps=unique([step for response in responses for step in response.next_steps])
+        )
+    
+    def _load_project_summary(self, project_dir: Path, include_test: bool = False) -> Dict[str, ExpertResponse]:
+        """project_summary.json'daki uzman çıktılarını yükle (varsayılan olarak test uzmanı hariç)"""
+        summary_file = project_dir / "project_summary.json"
+        if not summary_file.exists():
+            return {}
+        
+        try:
+            with open(summary_file, "r", encoding="utf-8") as f:
+                experts = json.load(f).get("experts", {})
+            return {
+                expert_type: ExpertResponse(**data)
+                for expert_type, data in experts.items()
+                if include_test or expert_type != "test"
+            }
+        except (OSError, ValueError) as e:
+            self.console.print(f"[yellow]⚠️ Proje özeti okunamadı: {str(e)}[/yellow]")
+            return {}
+    
+    def _project_file_entries(self, project_dir: Path) -> List[Dict[str, Any]]:
+        """Proje dosyalarının güncel indeks kayıtlarını döndür (test klasörü hariç)"""
+        index = self._file_indexes.get(project_dir)
+        if index is None:
+            index = ProjectFileIndex(project_dir, CODE_EXTENSIONS, self._summarize_code_file)
+            self._file_indexes[project_dir] = index
+        
+        return index.refresh(exclude_dirs={"test"})
+    
+    def _collect_existing_code(self, project_dir: Path, token_budget: Optional[int] = None,
+                               entries: Optional[List[Dict[str, Any]]] = None) -> tuple:
+        """Mevcut kodları token bütçesine sığacak şekilde topla.
+        
+        Dosyalar önem sırasına göre (giriş noktaları, modeller, route'lar önce) tam içerik,
+        iskelet veya kısa özet olarak eklenir. entries verilirse yalnızca bu kayıtlar
+        paketlenir. (bağlam metni, List[ContextItem]) döndürür.
+        """
+        token_budget = token_budget or self.test_context_tokens
+        if entries is None:
+            entries = self._project_file_entries(project_dir)
+        
+        blocks = {}
+        levels = {}
+        remaining = token_budget
+        
+        # 1. Her dosyaya kısa özet (bütçenin en fazla %20'si)
+        summary_budget = token_budget // 5
+        for entry in entries:
+            block = self._context_block(entry, "özet")
+            cost = estimate_tokens(block)
+            if cost <= summary_budget:
+                blocks[entry["path"]] = block
+                levels[entry["path"]] = "özet"
+                summary_budget -= cost
+                remaining -= cost
+        
+        # 2. Önemli dosyaları sırayla tam içerik veya iskelete yükselt
+        for entry in sorted(entries, key=self._context_priority, reverse=True):
+            path = entry["path"]
+            current_cost = estimate_tokens(blocks[path]) if path in blocks else 0
+            
+            for level in ("tam", "iskelet"):
+                if level == "tam" and entry["tokens"] > remaining + current_cost:
+                    continue
+                block = self._context_block(entry, level, project_dir)
+                if block is None:
+                    continue
+                cost = estimate_tokens(block)
+                if cost <= remaining + current_cost and cost > current_cost:
+                    blocks[path] = block
+                    levels[path] = level
+                    remaining -= cost - current_cost
+                    break
+        
+        # Bağlamı klasör sırasıyla oluştur
+        parts = [f"MEVCUT PROJE DOSYALARI (~{token_budget - remaining}/{token_budget} token):\n\n"]
+        items = []
+        current_dir = None
+        
+        for entry in entries:
+            path = entry["path"]
+            if path not in blocks:
+                items.append(ContextItem(path=path, level="dışarıda", tokens=0))
+                continue
+            
+            if entry["expert"] != current_dir:
+                if current_dir is not None:
+                    parts.append("\n")
+                current_dir = entry["expert"]
+                parts.append(f"📁 {current_dir.upper()} KLASÖRÜ:\n")
+            
+            parts.append(blocks[path])
+            items.append(ContextItem(path=path, level=levels[path], tokens=estimate_tokens(blocks[path])))
+        
+        if current_dir is not None:
+            parts.append("\n")
+        
+        return "".join(parts), items
+    
+    def _context_priority(self, entry: Dict[str, Any]) -> tuple:
+        """Dosyanın bağlam önceliği: (puan, küçük dosyalar önce)"""
+        path = entry["path"].lower()
+        score = 0
+        for patterns, points in CONTEXT_PRIORITY_PATTERNS:
+            if any(pattern in path for pattern in patterns):
+                score = max(score, points)
+        if path.endswith(".md"):
+            score -= 20
+        return (score, -entry["tokens"])
+    
+    def _context_block(self, entry: Dict[str, Any], level: str,
+                       project_dir: Optional[Path] = None) -> Optional[str]:
+        """Dosyanın verilen seviyedeki bağlam bloğunu oluştur"""
+        name = entry["path"].split("/", 1)[1]
         
-        return code_summary
+        if entry["skeleton"] is None:
+            return f"\n📄 {name}: (okunamadı)\n" if level == "özet" else None
+        
+        if level == "tam":
+            try:
+                content = (project_dir / entry["path"]).read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                return None
+            return f"\n📄 {name} (tam):\n```\n{content}\n```\n"
+        
+        if level == "iskelet":
+            if not entry["skeleton"]:
+                return None
+            return f"\n📄 {name} (iskelet):\n```\n{entry['skeleton']}\n```\n"
+        
+        return f"\n📄 {name} (özet): {entry['outline']}\n"
+    
+    def _summarize_code_file(self, path: str, content: str) -> Dict[str, str]:
+        """Dosya içeriğinden iskelet ve kısa özet çıkar"""
+        lines = content.splitlines()
+        skeleton = self.skeleton_extractor.extract(path, content)
+        
+        # İlk yorum/docstring satırını kısa açıklama olarak kullan
+        description = ""
+        for line in lines[:20]:
+            if line.lstrip().startswith(('"""', "'''", "#", "//", "/*", "--", "<!--")):
+                description = line.strip().strip('"\'#/*-<>! ')[:80]
+                if description:
+                    break
+        
+        outline = f"{len(lines)} satır, ~{estimate_tokens(content)} token"
+        if description:
+            outline += f" - {description}"
+        
+        return {"skeleton": skeleton, "outline": outline}
+    
+    def _display_context_report(self, items: List[ContextItem]):
+        """Test uzmanına gönderilen bağlamın özetini göster"""
+        counts = {}
+        for item in items:
+            counts[item.level] = counts.get(item.level, 0) + 1
+        total = sum(item.tokens for item in items)
+        
+        self.console.print(
+            f"[dim]📦 Bağlam: {counts.get('tam', 0)} tam, {counts.get('iskelet', 0)} iskelet, "
+            f"{counts.get('özet', 0)} özet, {counts.get('dışarıda', 0)} dışarıda (~{total} token)[/dim]"
+        )
+        
+        if os.getenv("DEBUG", "false").lower() == "true":
+            table = Table(title="Bağlam Paketi", border_style="dim")
+            table.add_column("Dosya")
+            table.add_column("Seviye")
+            table.add_column("Token", justify="right")
+            for item in items:
+                table.add_row(item.path, item.level, str(item.tokens))
+            self.console.print(table)
     
     async def _display_test_results(self, response: ExpertResponse):
         """Test sonuçlarını özel formatta göster"""
@@ -1407,6 +4281,15 @@ class VibeCodingAISystem:
         self.console.print("      • Minimum soru ile hızlı çözüm üretimi")
         self.console.print("      • Doğrudan uygulanabilir kod taslakları")
         
+        self.console.print("  [cyan]6[/cyan] - Proje Kayıt Defteri")
+        self.console.print("      • Projeleri sayfalı listeler; ada, tipe ve teknolojiye göre filtreler")
+        self.console.print("      • Güncelleme, oluşturma, ad, tip veya dosya sayısına göre sıralar")
+        self.console.print("      • Kayıt defterini istendiğinde diskten yeniden oluşturur")
+        
+        self.console.print("  [cyan]7[/cyan] - Projelerde Ara")
+        self.console.print("      • Tüm projelerin dosyalarında, raporlarında ve özetlerinde tam metin arama")
+        self.console.print("      • Terminalden: vibe search \"jwt refresh\"")
+        
         self.console.print("\n[bold yellow]👨‍💻 UZMAN MODLARI:[/bold yellow]")
         self.console.print("  [cyan]b[/cyan] - Backend Uzmanı: API, veritabanı, sunucu mimarisi")
         self.console.print("  [cyan]f[/cyan] - Frontend Uzmanı: Kullanıcı arayüzü, responsive tasarım")
@@ -1428,6 +4311,7 @@ class VibeCodingAISystem:
         self.console.print("  ├── proje_adi/")
         self.console.print("  │   ├── project_config.json")
         self.console.print("  │   ├── project_summary.json")
+        self.console.print("  │   ├── expert_fingerprints.json")
         self.console.print("  │   ├── smart_analysis/")
         self.console.print("  │   ├── backend/")
         self.console.print("  │   ├── frontend/")
@@ -1450,6 +4334,10 @@ class VibeCodingAISystem:
         """Ana çalışma döngüsü"""
         self.display_welcome()
         
+        # Kullanıcı menüyü okurken uzmanları arka planda hazırla
+        if os.getenv("VIBE_PREWARM_EXPERTS", "false").lower() == "true":
+            self.prewarm_experts()
+        
         while True:
             self.display_main_menu()
             
@@ -1466,6 +4354,10 @@ class VibeCodingAISystem:
                     self.list_projects()
                 elif choice == "5":
                     await self.smart_project_analysis()
+                elif choice == "6":
+                    self.browse_projects()
+                elif choice == "7":
+                    self.search_projects()
                 elif choice == "b":
                     await self.consult_single_expert("backend")
                 elif choice == "f":
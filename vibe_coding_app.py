@@ -15,17 +15,92 @@ from rich.prompt import Prompt, Confirm
 from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn, BarColumn, MofNCompleteColumn
 from rich.live import Live
-import requests
-import google.generativeai as genai
+import httpx
 import getpass
 import time
 import threading
+import atexit
+import queue
+from collections import deque
 
 # Environment variables yükle
 load_dotenv()
 
+def env_number(name: str, default, cast=int, minimum=None):
+    """Sayısal ortam değişkenini oku; geçersizse uyarı verip varsayılanı kullan"""
+    raw = os.getenv(name)
+    value = default
+    if raw is not None and raw.strip():
+        try:
+            value = cast(raw.strip())
+        except ValueError:
+            Console(stderr=True).print(
+                f"⚠️ {name}={raw!r} geçersiz, varsayılan kullanılıyor: {default}", style="yellow"
+            )
+    return value if minimum is None else max(minimum, value)
+
+# Süreç genelinde paylaşılan HTTP istemcisi (bağlantı havuzu + keep-alive)
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+def get_http_client() -> httpx.Client:
+    """Paylaşılan, bağlantı havuzlu HTTP istemcisini döndür.
+    
+    Havuz boyutu PROMPTCRAFT_POOL_SIZE ile ayarlanır. PROMPTCRAFT_HTTP2=true ve
+    h2 paketi kuruluysa HTTP/2 kullanılır.
+    """
+    global _http_client
+    
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                pool_size = env_number('PROMPTCRAFT_POOL_SIZE', 10, minimum=1)
+                http2 = os.getenv('PROMPTCRAFT_HTTP2', 'false').lower() == 'true'
+                if http2:
+                    try:
+                        import h2  # noqa: F401
+                    except ImportError:
+                        http2 = False
+                
+                _http_client = httpx.Client(
+                    http2=http2,
+                    timeout=httpx.Timeout(60.0, connect=10.0),
+                    limits=httpx.Limits(
+                        max_connections=pool_size,
+                        max_keepalive_connections=pool_size,
+                        keepalive_expiry=env_number('PROMPTCRAFT_KEEPALIVE_EXPIRY', 120.0, float)
+                    ),
+                    headers={"User-Agent": "PromptCraft-AI/1.0"}
+                )
+                atexit.register(_http_client.close)
+    
+    return _http_client
+
+class RateLimiter:
+    """İş parçacıkları arasında paylaşılan basit istek hızı sınırlayıcı.
+    
+    İstekler saniyede en fazla `rate` olacak şekilde eşit aralıklarla başlatılır;
+    rate <= 0 ise sınır uygulanmaz.
+    """
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Sıradaki istek zamanı gelene kadar bekle"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
 class PromptCraftApp:
     """PromptCraft AI - VibeCoding mantığı ile çalışan ana uygulama sınıfı"""
     
@@ -38,15 +113,52 @@ class PromptCraftApp:
         # API anahtarlarını kontrol et
         self.deepseek_api_key = os.getenv('DEEPSEEK_API_KEY')
         self.gemini_api_key = os.getenv('GEMINI_API_KEY')
+        self.deepseek_base_url = os.getenv('DEEPSEEK_BASE_URL', 'https://api.deepseek.com').rstrip('/')
+        
+        # Akış modu: yanıtlar geldikçe canlı panelde gösterilir
+        self.stream_mode = os.getenv('PROMPTCRAFT_STREAM', 'true').lower() == 'true'
+        self.stream_refresh_rate = env_number('PROMPTCRAFT_STREAM_FPS', 8, minimum=1)
+        self.last_timing = {}
+        self._local = threading.local()
+        self.last_provider = None
+        
+        # Hedge modu: birincil sağlayıcı gecikirse istek yedeğe de gönderilir
+        self.hedge_mode = os.getenv('PROMPTCRAFT_HEDGE', 'true').lower() == 'true'
+        self.hedge_default_delay = env_number('PROMPTCRAFT_HEDGE_DELAY', 8.0, float)
+        self.hedge_max_ratio = env_number('PROMPTCRAFT_HEDGE_MAX_RATIO', 0.2, float)
+        default_budget = env_number('PROMPTCRAFT_HEDGE_BUDGET', 20)
+        self.hedge_budget = {
+            name: env_number(f'PROMPTCRAFT_HEDGE_BUDGET_{name.upper()}', default_budget)
+            for name in ("deepseek", "gemini")
+        }
+        self.hedge_count = 0
+        self.request_count = 0
+        self._hedge_lock = threading.Lock()
+        self.latency_history = {}
+        
+        # Yanıt token sınırları (görev türüne göre) ve kesilen yanıtlar için devam isteği sayısı
+        self.default_max_tokens = env_number('PROMPTCRAFT_MAX_TOKENS', 2000)
+        self.max_tokens = {
+            task: env_number(f'PROMPTCRAFT_MAX_TOKENS_{task.upper()}', default)
+            for task, default in (("analiz", 2000), ("optimizasyon", 2000), ("template", 4000))
+        }
+        self.max_continuations = env_number('PROMPTCRAFT_MAX_CONTINUATIONS', 3, minimum=0)
+        
+        # Toplu mod (--bulk): paralel iş parçacığı sayısı, saniyedeki istek sınırı (0 = sınırsız)
+        # ve başarısız girdiler için yeniden deneme sayısı
+        self.bulk_workers = env_number('PROMPTCRAFT_BULK_WORKERS', 8, minimum=1)
+        self.bulk_rate = env_number('PROMPTCRAFT_BULK_RATE', 5.0, float)
+        self.bulk_retries = env_number('PROMPTCRAFT_BULK_RETRIES', 2, minimum=0)
+        # Toplu modda her sağlayıcı isteği (yeniden deneme, yedek ve hedge dahil) bu sınırlayıcıdan geçer
+        self.request_limiter: Optional[RateLimiter] = None
+        
+        # Gemini istemcisi ilk Gemini çağrısında yapılandırılır (ilk kurulumdaki anahtar testi dahil)
+        self._gemini_configured_key = None
         
         # İlk kurulum kontrolü
         if not self.deepseek_api_key and not self.gemini_api_key:
             self.first_time_setup()
         
-        # Gemini API'yi yapılandır
-        if self.gemini_api_key:
-            genai.configure(api_key=self.gemini_api_key)
-        
         self.vibe_coding_prompts = {
             "analiz": """Sen bir VibeCoding uzmanısın. Aşağıdaki doğal dil metnini analiz et ve yapay zeka için optimize edilmiş bir prompt haline getir.
 
@@ -87,6 +199,15 @@ Optimize edilmiş versiyonu ve değişikliklerin açıklamasını ver.""",
 Kullanılabilir ve yeniden düzenlenebilir bir şablon hazırla."""
         }
     
+    @property
+    def last_provider(self) -> Optional[str]:
+        """Son yanıtı veren sağlayıcı (iş parçacığına özel; toplu modda istekler paralel)"""
+        return getattr(self._local, "provider", None)
+    
+    @last_provider.setter
+    def last_provider(self, name: Optional[str]) -> None:
+        self._local.provider = name
+    
     def debug_log(self, message: str, context: str = "MAIN") -> None:
         """Debug mesajlarını kontrollü şekilde yazdır"""
         if self.debug_mode:
@@ -178,7 +299,6 @@ Kullanılabilir ve yeniden düzenlenebilir bir şablon hazırla."""
                     self.gemini_api_key = gemini_key
                     
                     try:
-                        genai.configure(api_key=gemini_key)
                         task = progress.add_task("🔍 Gemini API test ediliyor...", total=None)
                         result = self.call_gemini_api_animated(test_prompt, progress, task)
                         if result:
@@ -214,7 +334,6 @@ Kullanılabilir ve yeniden düzenlenebilir bir şablon hazırla."""
             elif 'GEMINI_API_KEY' in valid_keys:
                 self.default_provider = 'gemini'
                 self.gemini_api_key = valid_keys['GEMINI_API_KEY']
-                genai.configure(api_key=self.gemini_api_key)
             
             self.console.print(f"🤖 Varsayılan AI: {self.default_provider.upper()}", style="cyan")
             
@@ -340,6 +459,7 @@ Kullanılabilir ve yeniden düzenlenebilir bir şablon hazırla."""
         settings_table.add_column("Açıklama", style="white")
         
         settings_table.add_row("s", "🔄 AI Sağlayıcısı Değiştir")
+        settings_table.add_row("a", f"📡 Akış Modu ({'Açık' if self.stream_mode else 'Kapalı'})")
         settings_table.add_row("t", "🧪 API Bağlantılarını Test Et")
         settings_table.add_row("r", "🔄 API Anahtarlarını Sıfırla")
         settings_table.add_row("h", "❓ Yardım & Komutlar")
@@ -358,6 +478,7 @@ Kullanılabilir ve yeniden düzenlenebilir bir şablon hazırla."""
         table.add_row("optimizasyon", "2", "Mevcut promptu optimize et")
         table.add_row("template", "3", "Belirli bir konu için prompt şablonu oluştur")
         table.add_row("provider", "s", "AI sağlayıcısını değiştir (deepseek/gemini)")
+        table.add_row("stream", "a", "Akış modunu aç/kapat (yanıtı geldikçe göster)")
         table.add_row("test", "t", "API bağlantılarını test et")
         table.add_row("reset", "r", "API anahtarlarını sıfırla")
         table.add_row("help", "h", "Yardım menüsünü göster")
@@ -365,307 +486,627 @@ Kullanılabilir ve yeniden düzenlenebilir bir şablon hazırla."""
         
         self.console.print(table)
     
-    def call_deepseek_api(self, prompt: str) -> Optional[str]:
-        """DeepSeek API'sini çağır"""
-        if not self.deepseek_api_key:
-            self.console.print("❌ DeepSeek API anahtarı bulunamadı!", style="red")
-            self.console.print("💡 .env dosyasında DEEPSEEK_API_KEY değişkenini ayarlayın", style="yellow")
+    def _build_deepseek_request(self, prompt: str, stream: bool = False, max_tokens: Optional[int] = None,
+                                partial: Optional[str] = None) -> tuple:
+        """DeepSeek isteği için header ve gövdeyi hazırla.
+        
+        partial verilirse kesilen yanıt asistan mesajı olarak eklenir ve devam istenir.
+        """
+        headers = {
+            "Authorization": f"Bearer {self.deepseek_api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        messages = [
+            {
+                "role": "system", 
+                "content": "Sen yardımcı bir AI asistanısın. Türkçe yanıt ver."
+            },
+            {
+                "role": "user", 
+                "content": prompt
+            }
+        ]
+        if partial is not None:
+            messages.append({"role": "assistant", "content": partial})
+            messages.append({"role": "user", "content": self._continuation_instruction(partial)})
+        
+        data = {
+            "model": "deepseek-chat",
+            "messages": messages,
+            "temperature": 0.7,
+            "max_tokens": max_tokens or self.default_max_tokens,
+            "stream": stream
+        }
+        
+        return headers, data
+    
+    def _max_tokens_for(self, task_type: Optional[str]) -> int:
+        """Görev türü için yanıt token sınırı"""
+        return self.max_tokens.get(task_type, self.default_max_tokens)
+    
+    def _continuation_instruction(self, partial: str) -> str:
+        """Kesilen yanıtın devamı için talimat"""
+        instruction = (
+            "Yanıtın yukarıda token sınırında kesildi. Tam olarak kaldığın yerden, bir sonraki "
+            "satırdan devam et; önceki metni tekrar etme ve giriş cümlesi ekleme."
+        )
+        # Açık kod bloğu: ``` sayısı tek
+        if partial.count("```") % 2 == 1:
+            instruction += (
+                " Şu an açık bir kod bloğunun içindesin: kod bloğunu yeniden açma, kodun sonraki "
+                "satırından devam et ve kod bitince bloğu kapat."
+            )
+        return instruction
+    
+    def _safe_boundary(self, text: str) -> str:
+        """Kesilen yanıtı devam için güvenli bir sınırda kırp.
+        
+        Yarım satır (kodda yarım ifade) atılır; satır çok uzunsa son cümle sonunda kesilir.
+        """
+        window = text[-400:]
+        cut = window.rfind("\n")
+        if cut == -1:
+            cut = max(window.rfind(". "), window.rfind("! "), window.rfind("? "))
+            if cut == -1:
+                return text
+        return text[:len(text) - len(window) + cut + 1]
+    
+    def _merge_continuation(self, text: str, more: str) -> str:
+        """Devam yanıtını birleştir; modelin tekrarladığı örtüşmeyi ve yeniden açılan kod bloğunu at"""
+        if text.count("```") % 2 == 1 and more.lstrip().startswith("```"):
+            stripped = more.lstrip()
+            more = stripped.split("\n", 1)[1] if "\n" in stripped else ""
+        
+        # Örtüşme en az 20 karakter ya da anlamlı tam satır(lar) olmalı ("}" gibi satırlar yanlışlıkla silinmesin)
+        for size in range(min(len(text), len(more), 300), 0, -1):
+            overlap = more[:size]
+            if (size >= 20 or (overlap.endswith("\n") and len(overlap.strip()) >= 4)) and text.endswith(overlap):
+                return text + more[size:]
+        return text + more
+    
+    def _complete_with_continuation(self, complete, emit, on_chunk=None, cancel=None) -> Optional[str]:
+        """Yanıt token sınırında kesildiyse devam istekleriyle tamamla.
+        
+        complete(partial, on_chunk) tek bir istek yapar ve (metin, kesildi_mi) veya None döndürür;
+        partial None ise ilk istektir, değilse yanıtın güvenli sınırda kırpılmış halidir.
+        En fazla self.max_continuations devam isteği yapılır.
+        """
+        result = complete(None, on_chunk)
+        if result is None:
             return None
         
-        self.debug_log("DeepSeek API çağrısı yapılıyor", "API")
+        text, truncated = result
+        continuations = 0
         
-        try:
-            headers = {
-                "Authorization": f"Bearer {self.deepseek_api_key}",
-                "Content-Type": "application/json",
-                "User-Agent": "PromptCraft-AI/1.0"
-            }
+        while truncated and continuations < self.max_continuations:
+            if cancel is not None and cancel.is_set():
+                break
             
-            data = {
-                "model": "deepseek-chat",
-                "messages": [
-                    {
-                        "role": "system", 
-                        "content": "Sen yardımcı bir AI asistanısın. Türkçe yanıt ver."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.7,
-                "max_tokens": 2000,
-                "stream": False
-            }
+            continuations += 1
+            emit("status", f"✂️ Yanıt kesildi, devam ediliyor... ({continuations}/{self.max_continuations})")
+            self.debug_log(f"Yanıt kesildi ({len(text)} karakter), devam isteği {continuations}", "API")
             
-            self.debug_log(f"API çağrısı yapılıyor: {len(prompt)} karakter", "API")
+            safe = self._safe_boundary(text)
+            result = complete(safe, on_chunk)
+            if result is None:
+                emit("warning", "⚠️ Devam isteği başarısız, yanıtın alınan kısmı kullanılıyor")
+                break
             
-            # Yeniden deneme mekanizması
-            for attempt in range(3):
-                try:
-                    response = requests.post(
-                        "https://api.deepseek.com/v1/chat/completions",
-                        headers=headers,
-                        json=data,
-                        timeout=60,  # Timeout artırıldı
-                        verify=True
-                    )
-                    
-                    self.debug_log(f"API yanıtı alındı: {response.status_code}", "API")
-                    
-                    if response.status_code == 200:
-                        result = response.json()
-                        if "choices" in result and len(result["choices"]) > 0:
-                            content = result["choices"][0]["message"]["content"]
-                            self.debug_log(f"Başarılı yanıt: {len(content)} karakter", "API")
-                            return content
-                        else:
-                            self.console.print("❌ DeepSeek API yanıtı beklenmeyen formatta!", style="red")
-                            return None
-                    
-                    elif response.status_code == 401:
-                        self.console.print("❌ DeepSeek API anahtarı geçersiz!", style="red")
-                        self.console.print("💡 API anahtarınızı kontrol edin: https://platform.deepseek.com", style="yellow")
-                        return None
-                    
-                    elif response.status_code == 429:
-                        self.console.print(f"⚠️ DeepSeek API rate limit (deneme {attempt + 1}/3)", style="yellow")
-                        if attempt < 2:
-                            import time
-                            time.sleep(2 ** attempt)  # Exponential backoff
-                            continue
-                        else:
-                            self.console.print("❌ DeepSeek API rate limit aşıldı!", style="red")
-                            return None
-                    
-                    elif response.status_code == 500:
-                        self.console.print(f"⚠️ DeepSeek sunucu hatası (deneme {attempt + 1}/3)", style="yellow")
-                        if attempt < 2:
-                            import time
-                            time.sleep(1)
-                            continue
-                        else:
-                            self.console.print("❌ DeepSeek sunucu hatası devam ediyor!", style="red")
-                            return None
-                    
-                    else:
-                        error_msg = f"DeepSeek API Hatası: {response.status_code}"
-                        try:
-                            error_detail = response.json()
-                            if "error" in error_detail:
-                                error_msg += f" - {error_detail['error'].get('message', 'Bilinmeyen hata')}"
-                        except:
-                            pass
-                        
-                        self.console.print(f"❌ {error_msg}", style="red")
-                        return None
-                        
-                except requests.exceptions.Timeout:
-                    self.console.print(f"⚠️ DeepSeek API timeout (deneme {attempt + 1}/3)", style="yellow")
-                    if attempt < 2:
-                        continue
-                    else:
-                        self.console.print("❌ DeepSeek API bağlantı zaman aşımı!", style="red")
-                        return None
-                        
-                except requests.exceptions.ConnectionError:
-                    self.console.print(f"⚠️ DeepSeek API bağlantı hatası (deneme {attempt + 1}/3)", style="yellow")
-                    if attempt < 2:
-                        import time
-                        time.sleep(1)
-                        continue
-                    else:
-                        self.console.print("❌ DeepSeek API'ye bağlanılamıyor!", style="red")
-                        self.console.print("💡 İnternet bağlantınızı kontrol edin", style="yellow")
-                        return None
-                        
-        except Exception as e:
-            self.console.print(f"❌ DeepSeek API Beklenmeyen Hata: {str(e)}", style="red")
-            self.debug_log(f"DeepSeek API hata detayı: {str(e)}", "ERROR")
-            return None
+            more, truncated = result
+            text = self._merge_continuation(safe, more)
+        
+        if truncated:
+            emit("warning", "⚠️ Yanıt devam sınırına rağmen tamamlanamadı (PROMPTCRAFT_MAX_CONTINUATIONS)")
+        
+        return text
     
-    def call_deepseek_api_animated(self, prompt: str, progress, task_id) -> Optional[str]:
-        """Animasyonlu DeepSeek API çağrısı"""
+    def _console_events(self):
+        """Olayları konsola yazan dinleyiciyi döndür (animasyonsuz çağrılar için)"""
+        def emit(event: str, message: str) -> None:
+            if event == "error":
+                self.console.print(message, style="red")
+            elif event in ("warning", "hint"):
+                self.console.print(message, style="yellow")
+            else:
+                self.debug_log(message, "API")
+        
+        return emit
+    
+    def _progress_events(self, progress, task_id):
+        """Olayları ilerleme satırına aktaran dinleyiciyi döndür.
+        
+        Dinleyici sadece satır açıklamasını günceller; animasyonu rich.Progress
+        kendi yenileme iş parçacığında çizer, böylece gösterge isteğe süre eklemez.
+        Hatalar geçici satır kapandıktan sonra da görünsün diye ayrıca yazdırılır.
+        """
+        def emit(event: str, message: str) -> None:
+            if event == "error":
+                progress.console.print(message, style="red")
+            if event != "hint":
+                progress.update(task_id, description=message)
+        
+        return emit
+    
+    def _acquire_request_slot(self) -> None:
+        """Sağlayıcıya istek göndermeden önce hız sınırlayıcıyı bekle (toplu mod)"""
+        limiter = self.request_limiter
+        if limiter is not None:
+            limiter.acquire()
+    
+    def _wait_backoff(self, seconds: float, cancel=None) -> bool:
+        """Yeniden deneme öncesi bekle; iptal edildiyse False döndür"""
+        if cancel is None:
+            time.sleep(seconds)
+            return True
+        return not cancel.wait(seconds)
+    
+    def _request_deepseek(self, prompt: str, emit, on_chunk=None, cancel=None,
+                          max_tokens: Optional[int] = None) -> Optional[str]:
+        """DeepSeek API'sini çağır ve durum değişikliklerini olay olarak yayınla.
+        
+        emit(event, message) olayları: status, warning, error, hint, done.
+        on_chunk verilirse yanıt akış (SSE) olarak okunur ve her parça on_chunk'a iletilir.
+        cancel (threading.Event) kurulduğunda yeniden denemeler ve akış okuması durur.
+        Yanıt max_tokens sınırında kesilirse (finish_reason=length) devam istenir.
+        """
         if not self.deepseek_api_key:
-            progress.update(task_id, description="❌ DeepSeek API anahtarı bulunamadı!")
-            time.sleep(1)
+            emit("error", "❌ DeepSeek API anahtarı bulunamadı!")
+            emit("hint", "💡 .env dosyasında DEEPSEEK_API_KEY değişkenini ayarlayın")
             return None
         
+        def complete(partial, chunk_handler):
+            return self._deepseek_completion(prompt, emit, chunk_handler, cancel, max_tokens, partial)
+        
         try:
-            progress.update(task_id, description="🔗 DeepSeek'e bağlanıyor...")
-            time.sleep(0.3)
-            
-            headers = {
-                "Authorization": f"Bearer {self.deepseek_api_key}",
-                "Content-Type": "application/json",
-                "User-Agent": "PromptCraft-AI/1.0"
-            }
-            
-            data = {
-                "model": "deepseek-chat",
-                "messages": [
-                    {
-                        "role": "system", 
-                        "content": "Sen yardımcı bir AI asistanısın. Türkçe yanıt ver."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.7,
-                "max_tokens": 2000,
-                "stream": False
-            }
-            
-            progress.update(task_id, description="📤 İstek gönderiliyor...")
-            time.sleep(0.2)
+            emit("status", "🔗 DeepSeek'e bağlanıyor...")
+            content = self._complete_with_continuation(complete, emit, on_chunk, cancel)
+        except Exception as e:
+            emit("error", f"❌ DeepSeek API Beklenmeyen Hata: {str(e)}")
+            self.debug_log(f"DeepSeek API hata detayı: {str(e)}", "ERROR")
+            return None
+        
+        if content:
+            emit("done", "🎉 DeepSeek yanıtı hazır!")
+        return content
+    
+    def _deepseek_completion(self, prompt: str, emit, on_chunk=None, cancel=None,
+                             max_tokens: Optional[int] = None, partial: Optional[str] = None) -> Optional[tuple]:
+        """Tek bir DeepSeek isteği yap (yeniden denemelerle); (metin, kesildi_mi) döndür"""
+        headers, data = self._build_deepseek_request(
+            prompt, stream=on_chunk is not None, max_tokens=max_tokens, partial=partial
+        )
+        self.debug_log(f"API çağrısı yapılıyor: {len(prompt)} karakter", "API")
+        
+        # Yeniden deneme mekanizması
+        for attempt in range(3):
+            if cancel is not None and cancel.is_set():
+                return None
             
-            # Yeniden deneme mekanizması
-            for attempt in range(3):
-                try:
-                    if attempt > 0:
-                        progress.update(task_id, description=f"🔄 Yeniden deneniyor... ({attempt + 1}/3)")
-                        time.sleep(0.5)
-                    
-                    progress.update(task_id, description="⏳ DeepSeek yanıtı bekleniyor...")
-                    
-                    response = requests.post(
-                        "https://api.deepseek.com/v1/chat/completions",
-                        headers=headers,
-                        json=data,
-                        timeout=60,
-                        verify=True
-                    )
-                    
-                    if response.status_code == 200:
-                        progress.update(task_id, description="✅ Yanıt alındı, işleniyor...")
-                        time.sleep(0.2)
-                        
-                        result = response.json()
-                        if "choices" in result and len(result["choices"]) > 0:
-                            content = result["choices"][0]["message"]["content"]
-                            progress.update(task_id, description="🎉 DeepSeek yanıtı hazır!")
-                            time.sleep(0.3)
-                            return content
-                        else:
-                            progress.update(task_id, description="❌ Yanıt formatı hatalı!")
-                            time.sleep(1)
-                            return None
-                    
-                    elif response.status_code == 401:
-                        progress.update(task_id, description="❌ API anahtarı geçersiz!")
-                        time.sleep(1)
-                        return None
-                    
-                    elif response.status_code == 429:
-                        progress.update(task_id, description=f"⏸️ Rate limit, bekleniyor... ({attempt + 1}/3)")
-                        if attempt < 2:
-                            time.sleep(2 ** attempt)
-                            continue
-                        else:
-                            progress.update(task_id, description="❌ Rate limit aşıldı!")
-                            time.sleep(1)
-                            return None
-                    
-                    elif response.status_code == 500:
-                        progress.update(task_id, description=f"🔧 Sunucu hatası, yeniden deneniyor... ({attempt + 1}/3)")
-                        if attempt < 2:
-                            time.sleep(1)
-                            continue
-                        else:
-                            progress.update(task_id, description="❌ Sunucu hatası devam ediyor!")
-                            time.sleep(1)
-                            return None
+            try:
+                if attempt > 0:
+                    emit("status", f"🔄 Yeniden deneniyor... ({attempt + 1}/3)")
+                
+                emit("status", "⏳ DeepSeek yanıtı bekleniyor...")
+                
+                client = get_http_client()
+                request = client.build_request(
+                    "POST",
+                    f"{self.deepseek_base_url}/v1/chat/completions",
+                    headers=headers,
+                    json=data
+                )
+                self._acquire_request_slot()
+                response = client.send(request, stream=on_chunk is not None)
+                
+                self.debug_log(f"API yanıtı alındı: {response.status_code}", "API")
+                
+                if response.status_code == 200 and on_chunk is not None:
+                    try:
+                        content, finish_reason = self._read_deepseek_stream(response, on_chunk, emit, cancel)
+                    finally:
+                        response.close()
                     
+                    if content:
+                        return content, finish_reason in ("length", "interrupted")
+                    emit("error", "❌ DeepSeek API boş yanıt döndürdü!")
+                    return None
+                
+                # Akış modunda hata gövdesini okuyup bağlantıyı havuza geri bırak
+                response.read()
+                
+                if response.status_code == 200:
+                    result = response.json()
+                    if "choices" in result and len(result["choices"]) > 0:
+                        choice = result["choices"][0]
+                        content = choice["message"]["content"]
+                        self.debug_log(f"Başarılı yanıt: {len(content)} karakter", "API")
+                        return content, choice.get("finish_reason") == "length"
                     else:
-                        progress.update(task_id, description=f"❌ API Hatası: {response.status_code}")
-                        time.sleep(1)
+                        emit("error", "❌ DeepSeek API yanıtı beklenmeyen formatta!")
                         return None
-                        
-                except requests.exceptions.Timeout:
-                    progress.update(task_id, description=f"⏰ Bağlantı zaman aşımı ({attempt + 1}/3)")
-                    if attempt < 2:
-                        time.sleep(1)
+                
+                elif response.status_code == 401:
+                    emit("error", "❌ DeepSeek API anahtarı geçersiz!")
+                    emit("hint", "💡 API anahtarınızı kontrol edin: https://platform.deepseek.com")
+                    return None
+                
+                elif response.status_code == 429:
+                    emit("warning", f"⏸️ DeepSeek API rate limit, bekleniyor... (deneme {attempt + 1}/3)")
+                    if attempt < 2 and self._wait_backoff(2 ** attempt, cancel):  # Exponential backoff
                         continue
                     else:
-                        progress.update(task_id, description="❌ Bağlantı zaman aşımı!")
-                        time.sleep(1)
+                        emit("error", "❌ DeepSeek API rate limit aşıldı!")
                         return None
-                        
-                except requests.exceptions.ConnectionError:
-                    progress.update(task_id, description=f"🌐 Bağlantı hatası ({attempt + 1}/3)")
-                    if attempt < 2:
-                        time.sleep(1)
+                
+                elif response.status_code == 500:
+                    emit("warning", f"🔧 DeepSeek sunucu hatası (deneme {attempt + 1}/3)")
+                    if attempt < 2 and self._wait_backoff(1, cancel):
                         continue
                     else:
-                        progress.update(task_id, description="❌ İnternet bağlantısı hatası!")
-                        time.sleep(1)
+                        emit("error", "❌ DeepSeek sunucu hatası devam ediyor!")
                         return None
-                        
-        except Exception as e:
-            progress.update(task_id, description=f"❌ Beklenmeyen hata!")
-            time.sleep(1)
-            return None
+                
+                else:
+                    error_msg = f"DeepSeek API Hatası: {response.status_code}"
+                    try:
+                        error_detail = response.json()
+                        if "error" in error_detail:
+                            error_msg += f" - {error_detail['error'].get('message', 'Bilinmeyen hata')}"
+                    except:
+                        pass
+                    
+                    emit("error", f"❌ {error_msg}")
+                    return None
+                    
+            except httpx.TimeoutException:
+                emit("warning", f"⏰ DeepSeek API zaman aşımı (deneme {attempt + 1}/3)")
+                if attempt < 2:
+                    continue
+                else:
+                    emit("error", "❌ DeepSeek API bağlantı zaman aşımı!")
+                    return None
+                    
+            except httpx.TransportError:
+                emit("warning", f"🌐 DeepSeek API bağlantı hatası (deneme {attempt + 1}/3)")
+                if attempt < 2 and self._wait_backoff(1, cancel):
+                    continue
+                else:
+                    emit("error", "❌ DeepSeek API'ye bağlanılamıyor!")
+                    emit("hint", "💡 İnternet bağlantınızı kontrol edin")
+                    return None
     
-    def call_gemini_api(self, prompt: str) -> Optional[str]:
-        """Gemini API'sini çağır"""
+    def _read_deepseek_stream(self, response: httpx.Response, on_chunk, emit, cancel=None) -> tuple:
+        """DeepSeek SSE akışını oku, parçaları on_chunk'a ilet; (birleşik metin, finish_reason) döndür.
+        
+        Akış parça alındıktan sonra koparsa finish_reason "interrupted" olur; yanıt kesilmiş
+        sayılır ve devam isteğiyle tamamlanır.
+        """
+        parts = []
+        finish_reason = None
+        
+        try:
+            for line in response.iter_lines():
+                if cancel is not None and cancel.is_set():
+                    break
+                
+                if not line.startswith("data:"):
+                    continue
+                
+                payload = line[5:].strip()
+                if payload == "[DONE]":
+                    break
+                
+                try:
+                    event = json.loads(payload)
+                except json.JSONDecodeError:
+                    self.debug_log(f"Geçersiz akış satırı: {payload[:80]}", "API")
+                    continue
+                
+                choices = event.get("choices") or []
+                if not choices:
+                    continue
+                
+                finish_reason = choices[0].get("finish_reason") or finish_reason
+                delta = choices[0].get("delta", {}).get("content")
+                if delta:
+                    parts.append(delta)
+                    on_chunk(delta)
+                    
+        except httpx.TransportError:
+            # Parça alınmadıysa yeniden denensin; alındıysa eldekini devam için döndür
+            if not parts:
+                raise
+            emit("warning", "⚠️ Akış yarıda kesildi, kalan kısım isteniyor")
+            finish_reason = "interrupted"
+        
+        return "".join(parts), finish_reason
+    
+    def _gemini_model(self):
+        """Gemini modelini döndür; SDK ilk kullanımda yüklenir ve yapılandırılır"""
+        import google.generativeai as genai
+        
+        if self._gemini_configured_key != self.gemini_api_key:
+            genai.configure(api_key=self.gemini_api_key)
+            self._gemini_configured_key = self.gemini_api_key
+        
+        return genai.GenerativeModel('gemini-pro')
+    
+    def _request_gemini(self, prompt: str, emit, on_chunk=None, cancel=None,
+                        max_tokens: Optional[int] = None) -> Optional[str]:
+        """Gemini API'sini çağır ve durum değişikliklerini olay olarak yayınla.
+        
+        on_chunk verilirse yanıt parça parça alınır ve her parça on_chunk'a iletilir.
+        Yanıt max_tokens sınırında kesilirse (MAX_TOKENS) devam istenir.
+        """
         if not self.gemini_api_key:
-            self.console.print("❌ Gemini API anahtarı bulunamadı!", style="red")
+            emit("error", "❌ Gemini API anahtarı bulunamadı!")
             return None
         
         self.debug_log("Gemini API çağrısı yapılıyor", "API")
         
         try:
-            model = genai.GenerativeModel('gemini-pro')
-            response = model.generate_content(prompt)
-            return response.text
+            emit("status", "⚙️ Gemini modeli hazırlanıyor...")
+            model = self._gemini_model()
+            
+            def complete(partial, chunk_handler):
+                return self._gemini_completion(model, prompt, emit, chunk_handler, cancel, max_tokens, partial)
+            
+            content = self._complete_with_continuation(complete, emit, on_chunk, cancel)
+            
+            if content:
+                emit("done", "🎉 Gemini yanıtı hazır!")
+                return content
+            else:
+                emit("error", "❌ Gemini boş yanıt döndürdü!")
+                return None
             
         except Exception as e:
-            self.console.print(f"❌ Gemini API Hatası: {str(e)}", style="red")
+            emit("error", f"❌ Gemini API Hatası: {str(e)}")
             return None
     
+    def _gemini_completion(self, model, prompt: str, emit, on_chunk=None, cancel=None,
+                           max_tokens: Optional[int] = None, partial: Optional[str] = None) -> Optional[tuple]:
+        """Tek bir Gemini isteği yap; (metin, kesildi_mi) döndür"""
+        contents = prompt
+        if partial is not None:
+            contents = [
+                {"role": "user", "parts": [prompt]},
+                {"role": "model", "parts": [partial]},
+                {"role": "user", "parts": [self._continuation_instruction(partial)]}
+            ]
+        generation_config = {"max_output_tokens": max_tokens or self.default_max_tokens}
+        
+        emit("status", "⏳ Gemini yanıtı bekleniyor...")
+        
+        if on_chunk is not None:
+            parts = []
+            self._acquire_request_slot()
+            response = model.generate_content(contents, stream=True, generation_config=generation_config)
+            try:
+                for chunk in response:
+                    if cancel is not None and cancel.is_set():
+                        # SDK'nın akışı kapatan genel bir API'si yok: okumayı bırakıp yanıtı serbest
+                        # bırakmak akışın iptal edilmesini sağlar
+                        return None
+                    if chunk.text:
+                        parts.append(chunk.text)
+                        on_chunk(chunk.text)
+            except Exception:
+                # Parça alınmadıysa hata olarak raporlansın; alındıysa kesilmiş yanıt olarak devam et
+                if not parts:
+                    raise
+                emit("warning", "⚠️ Akış yarıda kesildi, kalan kısım isteniyor")
+                return "".join(parts), True
+            
+            return ("".join(parts), self._gemini_truncated(response)) if parts else None
+        
+        self._acquire_request_slot()
+        response = model.generate_content(contents, generation_config=generation_config)
+        return (response.text, self._gemini_truncated(response)) if response.text else None
+    
+    def _gemini_truncated(self, response) -> bool:
+        """Gemini yanıtı token sınırında mı kesildi?"""
+        try:
+            reason = response.candidates[0].finish_reason
+        except (AttributeError, IndexError):
+            return False
+        return getattr(reason, "name", str(reason)) == "MAX_TOKENS"
+    
+    def call_deepseek_api(self, prompt: str) -> Optional[str]:
+        """DeepSeek API'sini çağır"""
+        return self._request_deepseek(prompt, self._console_events())
+    
+    def call_deepseek_api_animated(self, prompt: str, progress, task_id) -> Optional[str]:
+        """Animasyonlu DeepSeek API çağrısı"""
+        return self._request_deepseek(prompt, self._progress_events(progress, task_id))
+    
+    def call_gemini_api(self, prompt: str) -> Optional[str]:
+        """Gemini API'sini çağır"""
+        return self._request_gemini(prompt, self._console_events())
+    
     def call_gemini_api_animated(self, prompt: str, progress, task_id) -> Optional[str]:
         """Animasyonlu Gemini API çağrısı"""
-        if not self.gemini_api_key:
-            progress.update(task_id, description="❌ Gemini API anahtarı bulunamadı!")
-            time.sleep(1)
+        return self._request_gemini(prompt, self._progress_events(progress, task_id))
+    
+    def _provider_order(self, provider: Optional[str] = None) -> list:
+        """Denenecek sağlayıcıları sırayla döndür (birincil + anahtarı olan yedek)"""
+        primary = provider or self.default_provider
+        if primary not in ("deepseek", "gemini"):
+            return []
+        
+        providers = [primary]
+        secondary = "gemini" if primary == "deepseek" else "deepseek"
+        if (secondary == "gemini" and self.gemini_api_key) or (secondary == "deepseek" and self.deepseek_api_key):
+            providers.append(secondary)
+        
+        return providers
+    
+    def _call_provider(self, name: str, prompt: str, emit, on_chunk=None, cancel=None,
+                       max_tokens: Optional[int] = None) -> Optional[str]:
+        """Sağlayıcı adına göre ilgili istek fonksiyonunu çağır"""
+        if name == "deepseek":
+            return self._request_deepseek(prompt, emit, on_chunk=on_chunk, cancel=cancel, max_tokens=max_tokens)
+        return self._request_gemini(prompt, emit, on_chunk=on_chunk, cancel=cancel, max_tokens=max_tokens)
+    
+    def _record_latency(self, name: str, streaming: bool, seconds: float) -> None:
+        """Sağlayıcının yanıt süresini hedge eşiği için kaydet"""
+        key = f"{name}:{'stream' if streaming else 'full'}"
+        self.latency_history.setdefault(key, deque(maxlen=50)).append(seconds)
+    
+    def _hedge_threshold(self, name: str, streaming: bool) -> float:
+        """Hedge isteği için bekleme eşiği: gözlenen p90 veya varsayılan süre"""
+        history = sorted(self.latency_history.get(f"{name}:{'stream' if streaming else 'full'}", []))
+        if len(history) < 5:
+            return self.hedge_default_delay
+        return history[int(0.9 * (len(history) - 1))]
+    
+    def _can_hedge(self, name: str) -> bool:
+        """Sağlayıcının hedge bütçesi ve genel hedge oranı izin veriyor mu?"""
+        if self.hedge_budget.get(name, 0) <= 0:
+            return False
+        return self.hedge_count < max(1.0, self.hedge_max_ratio * self.request_count)
+    
+    def _ask_providers(self, prompt: str, emit, on_chunk=None, provider: Optional[str] = None,
+                       max_tokens: Optional[int] = None) -> Optional[str]:
+        """Yanıtı sağlayıcılardan al.
+        
+        Hedge modu açıksa birincil sağlayıcı eşik süresinde yanıt vermezse istek yedek
+        sağlayıcıya da gönderilir; ilk yanıt veren kazanır. Aksi halde yedek sağlayıcı
+        yalnızca birincil başarısız olursa denenir. Kazanan sağlayıcı self.last_provider'a yazılır.
+        """
+        providers = self._provider_order(provider)
+        if not providers:
+            emit("error", "❌ Geçersiz AI sağlayıcısı!")
             return None
         
-        try:
-            progress.update(task_id, description="🔗 Gemini'ye bağlanıyor...")
-            time.sleep(0.3)
+        with self._hedge_lock:
+            self.request_count += 1
+        
+        if len(providers) == 2 and self.hedge_mode:
+            return self._hedged_request(prompt, providers[0], providers[1], emit, on_chunk, max_tokens)
+        
+        for name in providers:
+            if name != providers[0]:
+                emit("status", f"🔄 {name.upper()} sağlayıcısına geçiliyor...")
             
-            progress.update(task_id, description="⚙️ Gemini modeli hazırlanıyor...")
-            time.sleep(0.2)
+            chunks = {"count": 0, "first": None}
             
-            model = genai.GenerativeModel('gemini-pro')
+            def forward(chunk: str) -> None:
+                if chunks["first"] is None:
+                    chunks["first"] = time.perf_counter()
+                chunks["count"] += 1
+                on_chunk(chunk)
             
-            progress.update(task_id, description="📤 İstek gönderiliyor...")
-            time.sleep(0.2)
+            started = time.perf_counter()
+            result = self._call_provider(
+                name, prompt, emit, on_chunk=forward if on_chunk else None, max_tokens=max_tokens
+            )
             
-            progress.update(task_id, description="⏳ Gemini yanıtı bekleniyor...")
+            if result:
+                answered = chunks["first"] or time.perf_counter()
+                self._record_latency(name, on_chunk is not None, answered - started)
+                self.last_provider = name
+                return result
             
-            response = model.generate_content(prompt)
+            # Yarım kalan akışı başka sağlayıcıyla tekrarlama
+            if chunks["count"]:
+                return None
+        
+        return None
+    
+    def _hedged_request(self, prompt: str, primary: str, secondary: str, emit, on_chunk=None,
+                        max_tokens: Optional[int] = None) -> Optional[str]:
+        """Birincil sağlayıcı geç kalırsa yedeği de çalıştır, ilk yanıt vereni kullan.
+        
+        Çağıran akış istemese de iki istek akış olarak yapılır: ilk parçayı alan kazanır ve
+        kaybedenin akışı hemen kapatılır, böylece sağlayıcı üretmeyi bırakır. Kaybedenin o ana
+        kadar ürettiği tokenler yine faturalanır (bkz. PROMPTCRAFT_HEDGE_* açıklaması).
+        """
+        forward = on_chunk is not None
+        streaming = True  # gecikme geçmişi ilk parçaya göre tutulur
+        lock = threading.Lock()
+        finished = queue.Queue()
+        state = {"winner": None}
+        results = {}
+        cancels = {primary: threading.Event(), secondary: threading.Event()}
+        started = {}
+        
+        def claim(name: str) -> bool:
+            # İlk yanıt veren kazanır, diğer istek iptal edilir
+            with lock:
+                if state["winner"] is None:
+                    state["winner"] = name
+                    other = secondary if name == primary else primary
+                    cancels[other].set()
+                    self._record_latency(name, streaming, time.perf_counter() - started[name])
+                return state["winner"] == name
+        
+        def worker(name: str) -> None:
+            def forward_event(event: str, message: str) -> None:
+                if state["winner"] in (None, name):
+                    emit(event, message)
             
-            progress.update(task_id, description="✅ Yanıt alındı, işleniyor...")
-            time.sleep(0.2)
+            def forward_chunk(chunk: str) -> None:
+                if claim(name) and forward:
+                    on_chunk(chunk)
             
-            if response.text:
-                progress.update(task_id, description="🎉 Gemini yanıtı hazır!")
-                time.sleep(0.3)
-                return response.text
-            else:
-                progress.update(task_id, description="❌ Boş yanıt alındı!")
-                time.sleep(1)
+            try:
+                result = self._call_provider(
+                    name, prompt, forward_event,
+                    on_chunk=forward_chunk,
+                    cancel=cancels[name],
+                    max_tokens=max_tokens
+                )
+                if result and claim(name):
+                    results[name] = result
+            finally:
+                finished.put(name)
+        
+        def start(name: str) -> None:
+            started[name] = time.perf_counter()
+            threading.Thread(target=worker, args=(name,), daemon=True).start()
+        
+        start(primary)
+        threshold = self._hedge_threshold(primary, streaming)
+        self.debug_log(f"Hedge eşiği ({primary}): {threshold:.2f} sn", "HEDGE")
+        
+        pending = 1
+        try:
+            finished_name = finished.get(timeout=threshold)
+            pending -= 1
+        except queue.Empty:
+            finished_name = None
+            with self._hedge_lock:
+                hedge = state["winner"] is None and self._can_hedge(secondary)
+                if hedge:
+                    self.hedge_budget[secondary] -= 1
+                    self.hedge_count += 1
+            if hedge:
+                emit("status", f"🏁 {primary.upper()} gecikti, {secondary.upper()} ile yarıştırılıyor...")
+                start(secondary)
+                pending += 1
+        
+        while True:
+            if finished_name is not None:
+                if finished_name in results:
+                    self.last_provider = finished_name
+                    return results[finished_name]
+                
+                # Birincil yanıt vermeden başarısız olduysa klasik yedeğe geç
+                if finished_name == primary and secondary not in started and state["winner"] is None:
+                    emit("status", f"🔄 {secondary.upper()} sağlayıcısına geçiliyor...")
+                    start(secondary)
+                    pending += 1
+            
+            if pending == 0:
                 return None
             
-        except Exception as e:
-            progress.update(task_id, description=f"❌ Gemini API hatası!")
-            time.sleep(1)
-            return None
+            finished_name = finished.get()
+            pending -= 1
     
-    def get_ai_response_with_animation(self, prompt: str, provider: Optional[str] = None) -> Optional[str]:
+    def get_ai_response_with_animation(self, prompt: str, provider: Optional[str] = None,
+                                       task_type: Optional[str] = None) -> Optional[str]:
         """Animasyonlu AI yanıtı alma"""
         active_provider = provider or self.default_provider
         
@@ -678,38 +1119,83 @@ Kullanılabilir ve yeniden düzenlenebilir bir şablon hazırla."""
             transient=True
         )
         
-        result = None
-        
         with progress:
-            # İlk sağlayıcıyı dene
-            if active_provider == "deepseek":
-                task = progress.add_task(f"🤖 DeepSeek AI ile işleniyor...", total=None)
-                result = self.call_deepseek_api_animated(prompt, progress, task)
-                
-                if result is None and self.gemini_api_key:
-                    progress.update(task, description="🔄 Gemini'ye geçiliyor...")
-                    time.sleep(0.5)
-                    progress.update(task, description="🤖 Gemini AI ile işleniyor...")
-                    result = self.call_gemini_api_animated(prompt, progress, task)
-                    
-            elif active_provider == "gemini":
-                task = progress.add_task(f"🤖 Gemini AI ile işleniyor...", total=None)
-                result = self.call_gemini_api_animated(prompt, progress, task)
+            task = progress.add_task(f"🤖 {active_provider.upper()} AI ile işleniyor...", total=None)
+            return self._ask_providers(
+                prompt, self._progress_events(progress, task), provider=provider,
+                max_tokens=self._max_tokens_for(task_type)
+            )
+    
+    def get_ai_response_streaming(self, prompt: str, task_type: str,
+                                  provider: Optional[str] = None) -> Optional[str]:
+        """Yanıtı akış olarak al ve canlı panelde parça parça göster.
+        
+        İlk parçaya kadar geçen süre (TTFT) ve toplam süre self.last_timing'e yazılır.
+        """
+        active_provider = provider or self.default_provider
+        parts = []
+        status = {"message": f"🤖 {active_provider.upper()} AI ile işleniyor..."}
+        timing = {"start": time.perf_counter(), "first_token": None, "last_render": 0.0}
+        
+        def render() -> Panel:
+            subtitle = None if parts else status["message"]
+            return self._result_panel("".join(parts), task_type, subtitle=subtitle)
+        
+        with Live(render(), console=self.console, refresh_per_second=self.stream_refresh_rate,
+                  vertical_overflow="visible") as live:
+            
+            def emit(event: str, message: str) -> None:
+                if event == "error":
+                    self.console.print(message, style="red")
+                elif event == "warning":
+                    self.console.print(message, style="yellow")
+                status["message"] = message
+                live.update(render())
+            
+            def on_chunk(chunk: str) -> None:
+                now = time.perf_counter()
+                if timing["first_token"] is None:
+                    timing["first_token"] = now
+                parts.append(chunk)
                 
-                if result is None and self.deepseek_api_key:
-                    progress.update(task, description="🔄 DeepSeek'e geçiliyor...")
-                    time.sleep(0.5)
-                    progress.update(task, description="🤖 DeepSeek AI ile işleniyor...")
-                    result = self.call_deepseek_api_animated(prompt, progress, task)
-            else:
-                self.console.print("❌ Geçersiz AI sağlayıcısı!", style="red")
-                return None
+                # Paneli en fazla saniyede stream_refresh_rate kez yeniden oluştur
+                if now - timing["last_render"] >= 1 / self.stream_refresh_rate:
+                    timing["last_render"] = now
+                    live.update(render())
+            
+            result = self._ask_providers(
+                prompt, emit, on_chunk=on_chunk, provider=provider, max_tokens=self._max_tokens_for(task_type)
+            )
+            
+            # Devam istekleriyle birleştirilen nihai metni göster (tekrarlanan satırlar ayıklanmış)
+            if result:
+                parts[:] = [result]
+            live.update(render())
+        
+        if result:
+            self.last_timing = {
+                "provider": self.last_provider,
+                "ttft": timing["first_token"] - timing["start"] if timing["first_token"] else None,
+                "total": time.perf_counter() - timing["start"],
+                "chars": len(result)
+            }
+            self._display_timing()
         
         return result
     
-    def get_ai_response(self, prompt: str, provider: Optional[str] = None) -> Optional[str]:
+    def _display_timing(self) -> None:
+        """Son akışlı yanıtın gecikme ölçümlerini göster"""
+        timing = self.last_timing
+        ttft = f"{timing['ttft']:.2f} sn" if timing.get("ttft") is not None else "-"
+        self.console.print(
+            f"⚡ {timing['provider'].upper()} | İlk token: {ttft} | Toplam: {timing['total']:.2f} sn",
+            style="dim"
+        )
+    
+    def get_ai_response(self, prompt: str, provider: Optional[str] = None,
+                        task_type: Optional[str] = None) -> Optional[str]:
         """Seçilen AI sağlayıcısından yanıt al (eski versiyon - test için)"""
-        return self.get_ai_response_with_animation(prompt, provider)
+        return self.get_ai_response_with_animation(prompt, provider, task_type=task_type)
     
     def process_command(self, command: str) -> bool:
         """Kullanıcı komutunu işle"""
@@ -730,6 +1216,13 @@ Kullanılabilir ve yeniden düzenlenebilir bir şablon hazırla."""
             self.change_provider()
             return True
         
+        # Akış modunu değiştir
+        elif command in ["stream", "a"]:
+            self.stream_mode = not self.stream_mode
+            durum = "açıldı" if self.stream_mode else "kapatıldı"
+            self.console.print(f"📡 Akış modu {durum}", style="green")
+            return True
+        
         # Ana özellikler - tam isim
         elif command in ["analiz", "optimizasyon", "template"]:
             self.handle_vibe_coding_task(command)
@@ -763,7 +1256,7 @@ Kullanılabilir ve yeniden düzenlenebilir bir şablon hazırla."""
         
         else:
             self.console.print("❌ Geçersiz seçenek!", style="red")
-            self.console.print("💡 Kullanılabilir seçenekler: 1, 2, 3, s, t, r, h, q", style="yellow")
+            self.console.print("💡 Kullanılabilir seçenekler: 1, 2, 3, a, s, t, r, h, q", style="yellow")
             self.console.print("   Veya 'h' yazarak tüm komutları görebilirsiniz.", style="dim")
             return True
     
@@ -904,10 +1397,15 @@ Kullanılabilir ve yeniden düzenlenebilir bir şablon hazırla."""
         # Prompt hazırla ve AI'dan yanıt al
         vibe_prompt = self.vibe_coding_prompts[task_type].format(user_input=user_input)
         
-        response = self.get_ai_response(vibe_prompt)
+        if self.stream_mode:
+            self.console.print("\n")
+            response = self.get_ai_response_streaming(vibe_prompt, task_type)
+        else:
+            response = self.get_ai_response(vibe_prompt, task_type=task_type)
         
         if response:
-            self.display_result(response, task_type)
+            if not self.stream_mode:
+                self.display_result(response, task_type)
             
             # Sonucu dosyaya kaydetme seçeneği
             if Confirm.ask("Bu sonucu dosyaya kaydetmek ister misiniz?"):
@@ -915,23 +1413,26 @@ Kullanılabilir ve yeniden düzenlenebilir bir şablon hazırla."""
         else:
             self.console.print("❌ AI yanıtı alınamadı. Lütfen tekrar deneyin.", style="red")
     
-    def display_result(self, result: str, task_type: str) -> None:
-        """AI yanıtını güzel bir şekilde göster"""
+    def _result_panel(self, result: str, task_type: str, subtitle: Optional[str] = None) -> Panel:
+        """AI yanıtı için sonuç panelini oluştur"""
         task_titles = {
             "analiz": "🔍 Analiz Sonucu",
             "optimizasyon": "⚡ Optimizasyon Sonucu",
             "template": "📋 Şablon Sonucu"
         }
         
-        panel = Panel(
+        return Panel(
             result,
             title=task_titles[task_type],
+            subtitle=subtitle,
             border_style="green",
             expand=False
         )
-        
+    
+    def display_result(self, result: str, task_type: str) -> None:
+        """AI yanıtını güzel bir şekilde göster"""
         self.console.print("\n")
-        self.console.print(panel)
+        self.console.print(self._result_panel(result, task_type))
     
     def save_result(self, result: str, task_type: str, original_input: str) -> None:
         """Sonucu dosyaya kaydet"""
@@ -959,6 +1460,296 @@ Kullanılabilir ve yeniden düzenlenebilir bir şablon hazırla."""
         except Exception as e:
             self.console.print(f"❌ Dosya kaydetme hatası: {str(e)}", style="red")
     
+    def _read_bulk_inputs(self, source: str, task_type: str, input_format: Optional[str] = None) -> list:
+        """Toplu mod girdilerini oku (source "-" ise stdin).
+        
+        Biçim verilmezse uzantıdan çıkarılır: .jsonl/.ndjson, .csv, diğerleri txt.
+        txt: boş olmayan her satır bir girdi. CSV: input, prompt veya text sütunu (yoksa ilk sütun).
+        JSONL: her satır bir metin ya da input/prompt/text alanlı nesne; nesnelerde isteğe bağlı
+        id ve task_type alanları okunur. Geçersiz satırlar atlanmaz, hata bilgisiyle döndürülür.
+        """
+        import csv
+        import io
+        
+        if source == "-":
+            text = sys.stdin.read()
+        else:
+            with open(source, "r", encoding="utf-8-sig") as f:
+                text = f.read()
+        
+        if input_format is None:
+            extension = os.path.splitext(source)[1].lower()
+            if extension in (".jsonl", ".ndjson"):
+                input_format = "jsonl"
+            elif extension == ".csv":
+                input_format = "csv"
+            elif source == "-" and text.lstrip().startswith("{"):
+                input_format = "jsonl"
+            else:
+                input_format = "txt"
+        
+        def entry(line_no: int, value: Any, task: Optional[str] = None, item_id: Any = None) -> Dict[str, Any]:
+            task = task or task_type
+            item = {"id": item_id if item_id not in (None, "") else line_no, "task_type": task,
+                    "input": value if isinstance(value, str) else None, "error": None}
+            if task not in self.vibe_coding_prompts:
+                item["error"] = f"Geçersiz görev türü: {task}"
+            elif not (item["input"] or "").strip():
+                item["error"] = "Boş giriş"
+            return item
+        
+        items = []
+        if input_format == "csv":
+            reader = csv.DictReader(io.StringIO(text))
+            fields = reader.fieldnames or []
+            column = next((name for name in ("input", "prompt", "text") if name in fields), fields[0] if fields else None)
+            for row in reader:
+                items.append(entry(reader.line_num, row.get(column), row.get("task_type"), row.get("id")))
+        elif input_format == "jsonl":
+            for line_no, line in enumerate(text.splitlines(), 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    item = entry(line_no, None)
+                    item["error"] = f"Geçersiz JSON: {e}"
+                    items.append(item)
+                    continue
+                if isinstance(record, dict):
+                    value = next((record[name] for name in ("input", "prompt", "text") if name in record), None)
+                    items.append(entry(line_no, value, record.get("task_type"), record.get("id")))
+                else:
+                    items.append(entry(line_no, record))
+        else:
+            for line_no, line in enumerate(text.splitlines(), 1):
+                if line.strip():
+                    items.append(entry(line_no, line.strip()))
+        
+        for index, item in enumerate(items):
+            item["index"] = index
+        return items
+    
+    def _bulk_previous_records(self, output_path: str, items: list) -> list:
+        """Önceki çalışmanın çıktı dosyasındaki tamamlanmış kayıtları döndür.
+        
+        Kayıtlar girdi sırasıyla yazıldığı için dosya her zaman bir önektir; yarım kalan veya
+        bozuk ilk satırdan sonrası yok sayılır. Kayıtlar başka bir girdi dosyasına veya görev
+        türüne aitse ValueError yükseltilir.
+        """
+        records = []
+        with open(output_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                count = len(records)
+                if count >= len(items) or record.get("input") != items[count]["input"]:
+                    raise ValueError(f"{output_path} başka bir girdiye ait (kayıt {count + 1})")
+                if record.get("task_type") != items[count]["task_type"]:
+                    raise ValueError(
+                        f"{output_path} başka bir görev türüne ait (kayıt {count + 1}: "
+                        f"{record.get('task_type')} ≠ {items[count]['task_type']})"
+                    )
+                records.append(record)
+        return records
+    
+    def _bulk_item(self, item: Dict[str, Any], provider: Optional[str], retries: int,
+                   stop: threading.Event) -> Optional[Dict[str, Any]]:
+        """Tek bir toplu girdiyi işle ve çıktı kaydını döndür; iptal edildiyse None"""
+        record = {
+            "index": item["index"], "id": item["id"], "task_type": item["task_type"], "input": item["input"],
+            "status": "invalid", "provider": None, "output": None, "error": item["error"],
+            "attempts": 0, "elapsed": 0.0
+        }
+        if item["error"]:
+            return record
+        
+        errors = []
+        
+        def emit(event: str, message: str) -> None:
+            if event == "error":
+                errors.append(message)
+            elif event == "warning":
+                self.debug_log(message, "BULK")
+        
+        prompt = self.vibe_coding_prompts[item["task_type"]].format(user_input=item["input"])
+        started = time.perf_counter()
+        
+        for attempt in range(1, retries + 2):
+            if stop.is_set():
+                return None
+            response = self._ask_providers(
+                prompt, emit, provider=provider, max_tokens=self._max_tokens_for(item["task_type"])
+            )
+            record["attempts"] = attempt
+            if response:
+                record.update(status="ok", provider=self.last_provider, output=response, error=None)
+                break
+            # Sağlayıcılar kendi içinde kısa yeniden denemeler yapar; burada daha uzun bekle
+            if attempt <= retries and not self._wait_backoff(min(30, 2 ** attempt), stop):
+                return None
+        else:
+            record.update(status="error", error=errors[-1] if errors else "❌ AI yanıtı alınamadı")
+        
+        record["elapsed"] = round(time.perf_counter() - started, 3)
+        return record
+    
+    def run_bulk(self, task_type: str, source: str, output: Optional[str] = None,
+                 provider: Optional[str] = None, workers: Optional[int] = None, rate: Optional[float] = None,
+                 retries: Optional[int] = None, input_format: Optional[str] = None,
+                 resume: bool = True) -> Optional[Dict[str, int]]:
+        """Dosyadaki (veya stdin'deki) girdileri vibe_coding_prompts ile toplu işle.
+        
+        Girdiler `workers` iş parçacığında paralel işlenir; sağlayıcı istekleri (yeniden deneme,
+        yedek sağlayıcı ve hedge dahil) saniyede en fazla `rate` ile başlatılır ve başarısız
+        girdiler `retries` kez yeniden denenir. Sonuçlar tek bir JSONL dosyasına (output "-"
+        ise stdout) girdi sırasıyla, geldikçe yazılır. Aynı çıktı dosyasıyla yeniden çalıştırmak
+        başarılı ve geçersiz kayıtları korur, hatalı kayıtları ve kalan girdileri işler; dosya
+        bu sırada geçici bir kopyaya yazılıp sonunda yerine taşınır.
+        Sayaçları döndürür (ok, error, invalid, skipped).
+        """
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+        import datetime
+        
+        workers = max(1, workers or self.bulk_workers)
+        rate = self.bulk_rate if rate is None else rate
+        retries = max(0, self.bulk_retries if retries is None else retries)
+        to_stdout = output == "-"
+        console = Console(stderr=True) if to_stdout else self.console
+        
+        if not any(
+            (name == "deepseek" and self.deepseek_api_key) or (name == "gemini" and self.gemini_api_key)
+            for name in self._provider_order(provider)
+        ):
+            console.print("❌ Kullanılabilir AI sağlayıcısı veya API anahtarı yok!", style="red")
+            return None
+        
+        try:
+            items = self._read_bulk_inputs(source, task_type, input_format)
+        except OSError as e:
+            console.print(f"❌ Girdi dosyası okunamadı: {str(e)}", style="red")
+            return None
+        
+        if output is None:
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            output = f"vibe_coding_{task_type}_bulk_{timestamp}.jsonl"
+        
+        previous = []
+        if resume and not to_stdout and os.path.exists(output):
+            try:
+                previous = self._bulk_previous_records(output, items)
+            except ValueError as e:
+                console.print(f"❌ {str(e)}", style="red")
+                console.print("💡 Farklı bir çıktı dosyası seçin veya --no-resume kullanın", style="yellow")
+                return None
+        
+        # Hatalı kayıtlar (geçici sağlayıcı hataları) yeniden kuyruğa alınır
+        reused = {record["index"]: record for record in previous if record.get("status") != "error"}
+        pending_items = [item for item in items if item["index"] not in reused]
+        counts = {"ok": 0, "error": 0, "invalid": 0, "skipped": len(reused)}
+        console.print(
+            f"📦 {len(items)} girdi | işlenecek: {len(pending_items)} "
+            f"(önceki hatalar: {len(previous) - len(reused)}) | iş parçacığı: {workers} | "
+            f"hız: {f'{rate:g}/sn' if rate > 0 else 'sınırsız'} | yeniden deneme: {retries}",
+            style="cyan"
+        )
+        
+        stop = threading.Event()
+        # Sırası gelmemiş sonuçlar bellekte bekler; pencere bunların sayısını sınırlar
+        window = workers * 4
+        in_flight = {}
+        finished = {}
+        next_index = 0
+        started = time.perf_counter()
+        
+        if to_stdout:
+            out = sys.stdout
+        else:
+            out = open(f"{output}.tmp" if previous else output, "w", encoding="utf-8")
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="promptcraft-bulk")
+        progress = Progress(
+            SpinnerColumn("dots12", style="cyan"),
+            TextColumn("[bold blue]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=console,
+            transient=True
+        )
+        
+        def write(record: Dict[str, Any]) -> None:
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+        
+        def collect(done) -> None:
+            nonlocal next_index
+            for future in done:
+                record = future.result()
+                del in_flight[future]
+                finished[record["index"]] = record
+            
+            # Girdi sırasını koruyarak yazılabilecek kayıtları akıt
+            while next_index in finished:
+                record = finished.pop(next_index)
+                write(record)
+                if next_index not in reused:
+                    counts[record["status"]] += 1
+                    progress.advance(task_id)
+                next_index += 1
+        
+        self.request_limiter = RateLimiter(rate)
+        try:
+            with progress:
+                task_id = progress.add_task(f"🤖 {task_type} toplu işleniyor...", total=len(pending_items))
+                for item in items:
+                    if item["index"] in reused:
+                        finished[item["index"]] = reused[item["index"]]
+                        collect(())
+                        continue
+                    while in_flight and len(in_flight) + len(finished) >= window:
+                        collect(wait(in_flight, return_when=FIRST_COMPLETED)[0])
+                    future = executor.submit(self._bulk_item, item, provider, retries, stop)
+                    in_flight[future] = item
+                while in_flight:
+                    collect(wait(in_flight, return_when=FIRST_COMPLETED)[0])
+        except KeyboardInterrupt:
+            stop.set()
+            console.print(
+                f"\n⏹️ Durduruldu: {next_index}/{len(items)} kayıt yazıldı, aynı çıktıyla tekrar çalıştırınca devam eder",
+                style="yellow"
+            )
+            running = sum(future.running() for future in in_flight)
+            if running:
+                console.print(f"⏳ Süren {running} girdinin bitmesi bekleniyor...", style="dim")
+        finally:
+            # Başlamamış girdiler iptal edilir; süren istekler stop'u görene kadar beklenir ki
+            # sınırlayıcı ve çıktı dosyası iş parçacıklarının altından değiştirilmesin
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.request_limiter = None
+            if not to_stdout:
+                # Yarıda kalınırsa önceki çalışmanın henüz yazılmamış kayıtları korunur
+                for index in range(next_index, len(previous)):
+                    write(finished.get(index) or previous[index])
+                out.close()
+                if previous:
+                    os.replace(f"{output}.tmp", output)
+        
+        elapsed = time.perf_counter() - started
+        processed = counts["ok"] + counts["error"] + counts["invalid"]
+        throughput = f" | {processed / elapsed * 60:.0f} girdi/dk" if processed and elapsed > 0 else ""
+        console.print(
+            f"✅ {counts['ok']} başarılı | ❌ {counts['error']} hata | ⚠️ {counts['invalid']} geçersiz | "
+            f"⏭️ {counts['skipped']} önceden tamamlanmış | {elapsed:.1f} sn{throughput}",
+            style="green" if not counts["error"] else "yellow"
+        )
+        if not to_stdout:
+            console.print(f"📄 Sonuçlar: {output}", style="green")
+        return counts
+    
     def run(self) -> None:
         """Ana uygulama döngüsü"""
         self.display_welcome()
@@ -981,8 +1772,67 @@ Kullanılabilir ve yeniden düzenlenebilir bir şablon hazırla."""
 
 def main():
     """Ana fonksiyon"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="PromptCraft AI - VibeCoding prompt aracı",
+        epilog="Örnek: python vibe_coding_app.py --bulk prompts.jsonl --task optimizasyon -o sonuc.jsonl"
+    )
+    parser.add_argument(
+        "--bulk",
+        metavar="DOSYA",
+        help="Girdileri etkileşimsiz, toplu işle (txt, CSV veya JSONL; '-' = stdin)"
+    )
+    parser.add_argument(
+        "--task",
+        choices=["analiz", "optimizasyon", "template"],
+        default="analiz",
+        help="Toplu mod görev türü (JSONL/CSV satırlarındaki task_type alanı önceliklidir)"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        help="Toplu mod sonuç JSONL dosyası ('-' = stdout, varsayılan: zaman damgalı dosya)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["txt", "csv", "jsonl"],
+        help="Girdi biçimi (varsayılan: dosya uzantısından)"
+    )
+    parser.add_argument(
+        "--provider",
+        choices=["deepseek", "gemini"],
+        help="AI sağlayıcısı (varsayılan: DEFAULT_AI_PROVIDER)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Paralel istek sayısı (PROMPTCRAFT_BULK_WORKERS)"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        help="Saniyedeki en fazla istek, 0 = sınırsız (PROMPTCRAFT_BULK_RATE)"
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        help="Başarısız girdiler için yeniden deneme sayısı (PROMPTCRAFT_BULK_RETRIES)"
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Mevcut çıktı dosyasına devam etmek yerine baştan yaz"
+    )
+    args = parser.parse_args()
+    
     app = PromptCraftApp()
-    app.run()
+    if args.bulk:
+        app.run_bulk(
+            args.task, args.bulk, output=args.output, provider=args.provider, workers=args.workers,
+            rate=args.rate, retries=args.retries, input_format=args.format, resume=not args.no_resume
+        )
+    else:
+        app.run()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file